@@ -6,9 +6,10 @@ def new(key,mode=MODE_ECB,IV=None,counter=None,segment_size=None):
 
         key = raw string containing the key, AES-128..256 will be selected according to the key length
             -> when using XTS mode: the key should be a tuple of the 2 keys needed
-        mode = AES.MODE_ECB/CBC/CFB/OFB/CTR/XTS/CMAC, default is ECB
+        mode = AES.MODE_ECB/CBC/CFB/OFB/CTR/XTS/CMAC/GCM/OCB/PMAC, default is ECB
+            -> OCB (as XTS and GCM) only works with a 128-bit blocksize
         IV = IV as a raw string, default is "all zero" IV
-            -> only needed for CBC mode
+            -> needed for CBC, CFB and OFB mode, the nonce for GCM mode and for OCB mode (1 to 15 bytes)
         counter = counter object (CryptoPlus.Util.util.Counter)
             -> only needed for CTR mode
         segment_size = amount of bits to use from the keystream in each chain part
@@ -139,6 +140,11 @@ class AES(BlockCipher):
         self.blocksize = 16
         BlockCipher.__init__(self,key,mode,IV,counter,cipher_module,segment_size)
 
+class Key(BlockCipherKey):
+    """Immutable expanded AES key (pycrypto) for the one-shot functions (encrypt_cbc, encrypt_ctr, ...)"""
+    def __init__(self,key):
+        BlockCipherKey.__init__(self,key,16,Crypto.Cipher.AES.new)
+
 def _test():
     import doctest
     doctest.testmod()
@@ -9,7 +9,7 @@ def new(key,mode=MODE_ECB,IV=None,counter=None,segment_size=None,effective_keyle
     ARC2 using pycrypto for algo and pycryptoplus for ciphermode
 
         key = raw string containing the keys
-        mode = python_AES.MODE_ECB/CBC/CFB/OFB/CTR/CMAC, default is ECB
+        mode = python_AES.MODE_ECB/CBC/CFB/OFB/CTR/CMAC/PMAC, default is ECB
         IV = IV as a raw string, default is "all zero" IV
             -> only needed for CBC mode
         counter = counter object (CryptoPlus.Util.util.Counter)
@@ -51,6 +51,16 @@ class ARC2(BlockCipher):
         self.blocksize = 8
         BlockCipher.__init__(self,key,mode,IV,counter,cipher_module,segment_size,args)
 
+class Key(BlockCipherKey):
+    """Immutable expanded ARC2 key (pycrypto) for the one-shot functions (encrypt_cbc, encrypt_ctr, ...)"""
+    def __init__(self,key,effective_keylen=None):
+        # pycrypto versions newer than 2.0.1 will have support for "effective_keylen"
+        if parse_version(Crypto.__version__) <= parse_version("2.0.1"):
+            args = {}
+        else:
+            args = {'effective_keylen':effective_keylen}
+        BlockCipherKey.__init__(self,key,8,Crypto.Cipher.ARC2.new,args)
+
 def _test():
     import doctest
     doctest.testmod()
@@ -7,7 +7,7 @@ def new(key,mode=MODE_ECB,IV=None,counter=None,segment_size=None):
     Blowfish using pycrypto for algo and pycryptoplus for ciphermode
 
         key = raw string containing the key
-        mode = Blowfish.MODE_ECB/CBC/CFB/OFB/CTR/CMAC, default is ECB
+        mode = Blowfish.MODE_ECB/CBC/CFB/OFB/CTR/CMAC/PMAC, default is ECB
         IV = IV as a raw string, default is "all zero" IV
             -> only needed for CBC mode
         counter = counter object (CryptoPlus.Util.util.Counter)
@@ -69,6 +69,11 @@ class Blowfish(BlockCipher):
         self.blocksize = 8
         BlockCipher.__init__(self,key,mode,IV,counter,cipher_module,segment_size)
 
+class Key(BlockCipherKey):
+    """Immutable expanded Blowfish key (pycrypto) for the one-shot functions (encrypt_cbc, encrypt_ctr, ...)"""
+    def __init__(self,key):
+        BlockCipherKey.__init__(self,key,8,Crypto.Cipher.Blowfish.new)
+
 def _test():
     import doctest
     doctest.testmod()
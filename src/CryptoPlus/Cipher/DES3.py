@@ -9,7 +9,7 @@ def new(key,mode=MODE_ECB,IV=None,counter=None,segment_size=None):
         key = raw string containing the 2/3 keys
             - DES-EDE2: supply 2 keys as 1 single concatenated 16byte key= key1|key2
             - DES-EDE3: supply 3 keys as 1 single concatenated 24byte key= key1|key2|key3
-        mode = python_AES.MODE_ECB/CBC/CFB/OFB/CTR/CMAC, default is ECB
+        mode = python_AES.MODE_ECB/CBC/CFB/OFB/CTR/CMAC/PMAC, default is ECB
         IV = IV as a raw string, default is "all zero" IV
             -> only needed for CBC mode
         counter = counter object (CryptoPlus.Util.util.Counter)
@@ -66,6 +66,11 @@ class DES3(BlockCipher):
         self.blocksize = 8
         BlockCipher.__init__(self,key,mode,IV,counter,cipher_module,segment_size)
 
+class Key(BlockCipherKey):
+    """Immutable expanded Triple DES key (pycrypto) for the one-shot functions (encrypt_cbc, encrypt_ctr, ...)"""
+    def __init__(self,key):
+        BlockCipherKey.__init__(self,key,8,Crypto.Cipher.DES3.new)
+
 def _test():
     import doctest
     doctest.testmod()
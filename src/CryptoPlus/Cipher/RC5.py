@@ -12,7 +12,7 @@ def new(key,mode=MODE_ECB,IV=None,counter=None,segment_size=None,rounds=12,word_
 
         key = raw string containing the keys
               multiple of 8 bits between 0 <-> 2040 bits
-        mode = python_AES.MODE_ECB/CBC/CFB/OFB/CTR/CMAC, default is ECB
+        mode = python_AES.MODE_ECB/CBC/CFB/OFB/CTR/CMAC/PMAC, default is ECB
         IV = IV as a raw string, default is "all zero" IV
             -> only needed for CBC mode
         counter = counter object (CryptoPlus.Util.util.Counter)
@@ -50,6 +50,12 @@ class RC5(BlockCipher):
         self.blocksize = (2*word_size)/8
         BlockCipher.__init__(self,key,mode,IV,counter,cipher_module,segment_size,args)
 
+class Key(BlockCipherKey):
+    """Immutable expanded RC5 key (pycrypto) for the one-shot functions (encrypt_cbc, encrypt_ctr, ...)"""
+    def __init__(self,key,rounds=12,word_size=32):
+        args = {'rounds':rounds,'word_size':word_size}
+        BlockCipherKey.__init__(self,key,(2*word_size)/8,Crypto.Cipher.RC5.new,args)
+
 def _test():
     import doctest
     doctest.testmod()
@@ -20,8 +20,14 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
 # THE SOFTWARE.
 # =============================================================================
+import copy
+import struct
+import threading
+import types
+from collections import OrderedDict
 from ..Util import util
 from ..Util import padding
+from ..Util.strxor import strxor, xor_blocks
 
 MODE_ECB = 1
 MODE_CBC = 2
@@ -30,6 +36,94 @@ MODE_OFB = 5
 MODE_CTR = 6
 MODE_XTS = 7
 MODE_CMAC = 8
+MODE_GCM = 9
+MODE_OCB = 10
+MODE_PMAC = 11
+
+# Modes that need a fresh IV (or nonce) for every message
+_IV_MODES = (MODE_CBC, MODE_CFB, MODE_OFB, MODE_GCM, MODE_OCB)
+
+# Amount of data processed at once by encrypt_into/decrypt_into and read at
+#   once by the stream functions, a multiple of every blocksize
+CHUNK_SIZE = 64*1024
+
+class KeyScheduleCache:
+    """LRU cache of expanded keys, shared by all BlockCipher constructors
+
+    Constructing a cipher expands the key into a codebook object (rijndael,
+      Blowfish, ...), which can take longer than encrypting a few blocks.
+    Ciphers constructed with the same algorithm, key and parameters share
+      one codebook from this cache. The codebook only holds the key
+      schedule: the chaining state (IV, counter, cache) is kept by every
+      cipher object itself and is never shared.
+
+        size    = maximum amount of codebooks kept, 0 disables the cache
+        hits    = amount of constructions that found their codebook in the cache
+        misses  = amount of constructions that had to expand the key
+
+    >>> from CryptoPlus.Cipher import python_AES, blockcipher
+    >>> cache = blockcipher.key_schedule_cache
+    >>> cache.clear()
+    >>> key = '2b7e151628aed2a6abf7158809cf4f3c'.decode('hex')
+    >>> cipher1 = python_AES.new(key,python_AES.MODE_ECB)
+    >>> cipher2 = python_AES.new(key,python_AES.MODE_CBC,'\\x00'*16)
+    >>> cipher1.cipher is cipher2.cipher
+    True
+    >>> cache.hits, cache.misses
+    (1, 1)
+    >>> cache.invalidate(key)
+    >>> python_AES.new(key,python_AES.MODE_ECB).cipher is cipher1.cipher
+    False
+    """
+    def __init__(self,size=64):
+        self.size = size
+        self.hits = 0
+        self.misses = 0
+        self.__codebooks = OrderedDict()
+        self.__lock = threading.Lock()
+
+    def get(self,cipher_module,key,args={}):
+        """Return the codebook cipher_module(key,**args), from the cache if possible"""
+        try:
+            index = (cipher_module,key,tuple(sorted(args.items())))
+            hash(index)
+        except TypeError:
+            # unhashable key or parameters: can't be cached
+            return cipher_module(key,**args)
+        with self.__lock:
+            codebook = self.__codebooks.pop(index,None)
+            if codebook is not None:
+                self.hits += 1
+                # reinsert as most recently used
+                self.__codebooks[index] = codebook
+                return codebook
+            self.misses += 1
+        codebook = cipher_module(key,**args)
+        with self.__lock:
+            if self.size > 0:
+                self.__codebooks[index] = codebook
+                while len(self.__codebooks) > self.size:
+                    self.__codebooks.popitem(last=False)
+        return codebook
+
+    def invalidate(self,key,cipher_module=None):
+        """Remove the codebooks for key (for all algorithms, or only cipher_module)"""
+        with self.__lock:
+            for index in self.__codebooks.keys():
+                if index[1] == key and cipher_module in (None,index[0]):
+                    del self.__codebooks[index]
+
+    def clear(self):
+        """Remove all codebooks and reset the counters"""
+        with self.__lock:
+            self.__codebooks.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def __len__(self):
+        return len(self.__codebooks)
+
+key_schedule_cache = KeyScheduleCache()
 
 class BlockCipher():
     """ Base class for all blockciphers
@@ -46,26 +140,23 @@ class BlockCipher():
         self.cache = ''
         self.ed = None
 
-        if 'keylen_valid' in dir(self): #wrappers for pycrypto functions don't have this function
+        if hasattr(self,'keylen_valid'): #wrappers for pycrypto functions don't have this function
          if not self.keylen_valid(key) and type(key) is not tuple:
                 raise ValueError(self.key_error_message)
 
+        self.__check_IV(IV)
         if IV == None:
             self.IV = '\x00'*self.blocksize
         else:
             self.IV = IV
 
         if mode <> MODE_XTS:
-            self.cipher = cipher_module(self.key,**args)
+            self.cipher = key_schedule_cache.get(cipher_module,self.key,args)
         if mode == MODE_ECB:
             self.chain = ECB(self.cipher, self.blocksize)
         elif mode == MODE_CBC:
-            if len(self.IV) <> self.blocksize:
-                raise Exception,"the IV length should be %i bytes"%self.blocksize
             self.chain = CBC(self.cipher, self.blocksize,self.IV)
         elif mode == MODE_CFB:
-            if len(self.IV) <> self.blocksize:
-                raise Exception,"the IV length should be %i bytes"%self.blocksize
             if segment_size == None:
                 raise ValueError,"segment size must be defined explicitely for CFB mode"
             if segment_size > self.blocksize*8 or segment_size%8 <> 0:
@@ -73,35 +164,172 @@ class BlockCipher():
                 raise ValueError,"segment size should be a multiple of 8 bits between 8 and %i"%(self.blocksize*8)
             self.chain = CFB(self.cipher, self.blocksize,self.IV,segment_size)
         elif mode == MODE_OFB:
-            if len(self.IV) <> self.blocksize:
-                raise ValueError("the IV length should be %i bytes"%self.blocksize)
             self.chain = OFB(self.cipher, self.blocksize,self.IV)
         elif mode == MODE_CTR:
-            if (counter == None) or  not callable(counter):
-                raise Exception,"Supply a valid counter object for the CTR mode"
+            self.__check_counter(counter)
             self.chain = CTR(self.cipher,self.blocksize,counter)
         elif mode == MODE_XTS:
             if self.blocksize <> 16:
                 raise Exception,'XTS only works with blockcipher that have a 128-bit blocksize'
             if not(type(key) == tuple and len(key) == 2):
                 raise Exception,'Supply two keys as a tuple when using XTS'
-            if 'keylen_valid' in dir(self): #wrappers for pycrypto functions don't have this function
+            if hasattr(self,'keylen_valid'): #wrappers for pycrypto functions don't have this function
              if not self.keylen_valid(key[0]) or  not self.keylen_valid(key[1]):
                 raise ValueError(self.key_error_message)
-            self.cipher = cipher_module(self.key[0],**args)
-            self.cipher2 = cipher_module(self.key[1],**args)
+            self.cipher = key_schedule_cache.get(cipher_module,self.key[0],args)
+            # cipher2 only encrypts the tweaks
+            self.cipher2 = key_schedule_cache.get(cipher_module,self.key[1],args)
             self.chain = XTS(self.cipher, self.cipher2)
         elif mode == MODE_CMAC:
             if self.blocksize not in (8,16):
                 raise Exception,'CMAC only works with blockcipher that have a 64 or 128-bit blocksize'
             self.chain = CMAC(self.cipher,self.blocksize,self.IV)
+        elif mode == MODE_PMAC:
+            if self.blocksize not in (8,16):
+                raise Exception,'PMAC only works with blockcipher that have a 64 or 128-bit blocksize'
+            self.chain = PMAC(self.cipher,self.blocksize,self.IV)
+        elif mode == MODE_GCM:
+            if self.blocksize <> 16:
+                raise Exception,'GCM only works with blockcipher that have a 128-bit blocksize'
+            self.chain = GCM(self.cipher,self.blocksize,self.IV)
+        elif mode == MODE_OCB:
+            if self.blocksize <> 16:
+                raise Exception,'OCB only works with blockcipher that have a 128-bit blocksize'
+            self.chain = OCB(self.cipher,self.blocksize,self.IV)
         else:
                 raise Exception,"Unknown chaining mode!"
 
+    def __check_IV(self,IV):
+        mode = self.mode
+        if mode in (MODE_CBC,MODE_CFB):
+            if IV <> None and len(IV) <> self.blocksize:
+                raise Exception,"the IV length should be %i bytes"%self.blocksize
+        elif mode == MODE_OFB:
+            if IV <> None and len(IV) <> self.blocksize:
+                raise ValueError("the IV length should be %i bytes"%self.blocksize)
+        elif mode == MODE_GCM:
+            if IV == None or len(IV) == 0:
+                # an all zero default IV would be reused for every message
+                raise ValueError("supply a nonce as IV for the GCM mode")
+        elif mode == MODE_OCB:
+            if IV == None or not 0 < len(IV) < 16:
+                raise ValueError("supply a nonce of 1 to 15 bytes as IV for the OCB mode")
+
+    def __check_counter(self,counter):
+        if (counter == None) or  not callable(counter):
+            raise Exception,"Supply a valid counter object for the CTR mode"
+
+    def reset(self,IV=None,counter=None):
+        """Start a new message with the same key
+
+            IV      = IV (or nonce) of the new message, mandatory for the
+                      CBC, CFB, OFB, GCM and OCB modes: reusing an IV or
+                      nonce with the same key leaks information about the
+                      messages (for GCM even the authentication key)
+            counter = counter object for the CTR mode, the current one
+                      (with its current value) is kept when not supplied
+
+        The chaining mode state (cached data, keystream, IV, counter,
+          hash state) is set up as for a newly created cipher object, but
+          the key isn't expanded again and the values derived from the key
+          only (GHASH tables, CMAC/PMAC subkeys, OCB L table, the ECB memo)
+          are kept.
+
+        >>> from CryptoPlus.Cipher import python_AES
+        >>> key = '2b7e151628aed2a6abf7158809cf4f3c'.decode('hex')
+        >>> cipher = python_AES.new(key,python_AES.MODE_CBC,'\\x00'*16)
+        >>> first = cipher.encrypt('a'*20)
+        >>> cipher.reset('\\x01'*16)
+        >>> cipher.encrypt('b'*16) == python_AES.new(key,python_AES.MODE_CBC,'\\x01'*16).encrypt('b'*16)
+        True
+        >>> cipher.reset('\\x01'*15)
+        Traceback (most recent call last):
+        ...
+        Exception: the IV length should be 16 bytes
+        >>> cipher = python_AES.new(key,python_AES.MODE_GCM,'\\x00'*12)
+        >>> cipher.reset()
+        Traceback (most recent call last):
+        ...
+        ValueError: supply a new IV (or nonce) to reset a cipher in this mode
+        """
+        mode = self.mode
+        if IV == None and mode in _IV_MODES:
+            raise ValueError("supply a new IV (or nonce) to reset a cipher in this mode")
+        if IV <> None:
+            self.__check_IV(IV)
+            self.IV = IV
+        self.cache = ''
+        self.ed = None
+        if mode == MODE_CTR:
+            if counter <> None:
+                self.__check_counter(counter)
+                self.chain.reset(counter)
+            else:
+                self.chain.reset(self.chain.counter)
+        elif mode in (MODE_ECB,MODE_XTS):
+            self.chain.reset()
+        else:
+            self.chain.reset(self.IV)
+
+    def clone(self,IV=None,counter=None):
+        """Return a new cipher object with the same key, ready for a new message
+
+            IV, counter = as for reset(), in CTR mode without a counter
+                          the clone gets a copy of the current counter
+                          object (counters that can't be copied, like
+                          functions, have to be supplied)
+
+        The clone shares the expanded key (and the other values derived
+          from the key only) with this cipher, so creating it costs next to
+          nothing. Both objects can then be used independently: in ECB mode
+          the clone gets its own empty memo (see enable_memo), of the same
+          size.
+
+        >>> from CryptoPlus.Cipher import python_AES
+        >>> key = '2b7e151628aed2a6abf7158809cf4f3c'.decode('hex')
+        >>> nonce = '000102030405060708090a0b'.decode('hex')
+        >>> cipher = python_AES.new(key,python_AES.MODE_GCM,nonce)
+        >>> other = cipher.clone('\\xff'*12)
+        >>> ciphertext = cipher.encrypt('a'*40)
+        >>> other.encrypt('a'*40) == python_AES.new(key,python_AES.MODE_GCM,'\\xff'*12).encrypt('a'*40)
+        True
+        >>> reference = python_AES.new(key,python_AES.MODE_GCM,nonce)
+        >>> ciphertext == reference.encrypt('a'*40) and cipher.digest() == reference.digest()
+        True
+
+        In CTR mode, the original and the clone keep their own counter:
+
+        >>> from CryptoPlus.Util.util import Counter
+        >>> cipher = python_AES.new(key,python_AES.MODE_CTR,counter=Counter('\\x00'*16))
+        >>> other = cipher.clone()
+        >>> reference = python_AES.new(key,python_AES.MODE_CTR,counter=Counter('\\x00'*16)).encrypt('a'*32)
+        >>> first, second = cipher.encrypt('a'*20), other.encrypt('a'*20)
+        >>> first + cipher.encrypt('a'*12) == second + other.encrypt('a'*12) == reference
+        True
+        """
+        if self.mode == MODE_CTR and counter == None:
+            counter = copy.copy(self.chain.counter)
+            if counter is self.chain.counter:
+                raise ValueError("supply a counter object for the clone, the current one can't be copied")
+        other = self.__copy()
+        other.reset(IV,counter)
+        return other
+
+    def __copy(self):
+        # new cipher object with its own chaining state, for clone and copy:
+        #   the codebook and the values derived from the key are shared, the
+        #   ECB memo (with its statistics) isn't
+        other = _shallow_copy(self)
+        other.chain = _shallow_copy(self.chain)
+        if self.mode == MODE_ECB and self.chain.memo is not None:
+            other.chain.memo = BlockMemo(self.chain.memo.size)
+        return other
+
     def encrypt(self,plaintext,n=''):
         """Encrypt some plaintext
 
-            plaintext   = a string of binary data
+            plaintext   = a string of binary data, or a bytearray, buffer,
+                          memoryview or mmap object
             n           = the 'tweak' value when the chaining mode is XTS
 
         The encrypt function will encrypt the supplied plaintext.
@@ -133,12 +361,31 @@ class BlockCipher():
         Everytime the function is called, the hash from the input data is calculated.
         No finalizing needed.
         The hashlength is equal to block size of the used block cipher.
+        To hash data supplied in pieces, use update() and digest() instead.
+
+        PMAC:
+        -----
+        Same as CMAC.
+
+        GCM:
+        ----
+        Acts as a stream cipher, the ciphertext is authenticated while it
+          is produced. Supply the additional authenticated data with
+          update() before encrypting, get the tag with digest().
+
+        OCB:
+        ----
+        Full blocks are encrypted immediately, a remaining partial block is
+          cached. Call final() after the last data to encrypt that partial
+          block, then get the tag with digest(). Additional authenticated
+          data can be supplied with update() at any time.
         """
         #self.ed = 'e' if chain is encrypting, 'd' if decrypting,
         # None if nothing happened with the chain yet
         #assert self.ed in ('e',None) 
         # makes sure you don't encrypt with a cipher that has started decrypting
         self.ed = 'e'
+        plaintext = _string(plaintext)
         if self.mode == MODE_XTS:
             # data sequence number (or 'tweak') has to be provided when in XTS mode
             return self.chain.update(plaintext,'e',n)
@@ -148,7 +395,8 @@ class BlockCipher():
     def decrypt(self,ciphertext,n=''):
         """Decrypt some ciphertext
 
-            ciphertext  = a string of binary data
+            ciphertext  = a string of binary data, or a bytearray, buffer,
+                          memoryview or mmap object
             n           = the 'tweak' value when the chaining mode is XTS
 
         The decrypt function will decrypt the supplied ciphertext.
@@ -175,21 +423,309 @@ class BlockCipher():
         Every decrypt function called on a XTS cipher will output
           a decrypted block based on the current supplied ciphertext block.
 
-        CMAC:
-        -----
+        CMAC, PMAC:
+        -----------
         Mode not supported for decryption as this does not make sense.
+
+        GCM:
+        ----
+        Acts as a stream cipher. Supply the additional authenticated data
+          with update() before decrypting and check the tag with verify()
+          when all ciphertext is decrypted.
+
+        OCB:
+        ----
+        As for encryption: call final() after the last ciphertext to
+          decrypt the cached partial block, then check the tag with verify().
         """
         #self.ed = 'e' if chain is encrypting, 'd' if decrypting,
         # None if nothing happened with the chain yet
         #assert self.ed in ('d',None)
         # makes sure you don't decrypt with a cipher that has started encrypting
         self.ed = 'd'
+        ciphertext = _string(ciphertext)
         if self.mode == MODE_XTS:
             # data sequence number (or 'tweak') has to be provided when in XTS mode
             return self.chain.update(ciphertext,'d',n)
         else:
             return self.chain.update(ciphertext,'d')
 
+    def encrypt_into(self,plaintext,out,n=''):
+        """Encrypt plaintext and write the result into a preallocated buffer
+
+            plaintext   = a string of binary data, or a bytearray, buffer,
+                          memoryview or mmap object
+            out         = a writable buffer (bytearray, writable memoryview
+                          or mmap object) big enough for the output
+            n           = the 'tweak' value when the chaining mode is XTS
+
+        The output is the same as for encrypt(plaintext,n), but it is
+          written to out starting at offset 0. Large inputs are processed in
+          chunks of CHUNK_SIZE bytes, so no copy of the whole input or output
+          is ever made (except for XTS, which needs the whole data unit).
+        Returns the amount of bytes written.
+
+        >>> from CryptoPlus.Cipher import python_AES
+        >>> key = '2b7e151628aed2a6abf7158809cf4f3c'.decode('hex')
+        >>> data = bytearray(range(256))*3
+        >>> out = bytearray(len(data))
+        >>> cipher = python_AES.new(key,python_AES.MODE_CBC,'\\x00'*16)
+        >>> cipher.encrypt_into(data,out)
+        768
+        >>> str(out) == python_AES.new(key,python_AES.MODE_CBC,'\\x00'*16).encrypt(str(data))
+        True
+        """
+        assert self.mode not in (MODE_CMAC, MODE_PMAC)
+        self.ed = 'e'
+        return self.__crypt_into(plaintext,out,'e',n)
+
+    def decrypt_into(self,ciphertext,out,n=''):
+        """Decrypt ciphertext and write the result into a preallocated buffer
+
+        Same arguments as encrypt_into, returns the amount of bytes written.
+        """
+        assert self.mode not in (MODE_CMAC, MODE_PMAC)
+        self.ed = 'd'
+        return self.__crypt_into(ciphertext,out,'d',n)
+
+    def encrypt_stream(self,src,dst,chunk_size=CHUNK_SIZE,padfct=padding.PKCS7):
+        """Encrypt everything read from src and write it to dst
+
+            src         = file-like object to read the plaintext from
+            dst         = file-like object the ciphertext is written to
+            chunk_size  = amount of bytes read from src at once
+            padfct      = padding function used at the end of the stream
+                          for ECB and CBC, None to keep the remaining bytes
+                          in the cache (see final())
+
+        src is read into one reusable buffer of chunk_size bytes, so memory
+          use doesn't depend on the size of the stream.
+        Stream modes (CFB, OFB, CTR) aren't padded.
+        Returns the amount of bytes written.
+
+        >>> from CryptoPlus.Cipher import python_AES
+        >>> from StringIO import StringIO
+        >>> key = '2b7e151628aed2a6abf7158809cf4f3c'.decode('hex')
+        >>> plaintext = 'x'*1000
+        >>> ciphertext = StringIO()
+        >>> cipher = python_AES.new(key,python_AES.MODE_CBC,'\\x00'*16)
+        >>> cipher.encrypt_stream(StringIO(plaintext),ciphertext,chunk_size=100)
+        1008
+        >>> decipher = python_AES.new(key,python_AES.MODE_CBC,'\\x00'*16)
+        >>> ''.join(decipher.decrypt_iter(StringIO(ciphertext.getvalue()))) == plaintext
+        True
+        """
+        written = 0
+        for output in self.encrypt_iter(src,chunk_size,padfct):
+            dst.write(output)
+            written += len(output)
+        return written
+
+    def decrypt_stream(self,src,dst,chunk_size=CHUNK_SIZE,padfct=padding.PKCS7):
+        """Decrypt everything read from src and write it to dst
+
+        Same arguments as encrypt_stream, for ECB and CBC the padding is
+          removed using padfct at the end of the stream.
+        For ECB and CBC, ValueError is raised at the end of a stream that
+          isn't a whole number of blocks, with or without padfct.
+        Returns the amount of bytes written.
+
+        >>> from CryptoPlus.Cipher import python_AES
+        >>> from StringIO import StringIO
+        >>> key = '2b7e151628aed2a6abf7158809cf4f3c'.decode('hex')
+        >>> ciphertext = python_AES.new(key,python_AES.MODE_ECB).encrypt('x'*32)
+        >>> decipher = python_AES.new(key,python_AES.MODE_ECB)
+        >>> decipher.decrypt_stream(StringIO(ciphertext[:-1]),StringIO(),padfct=None)
+        Traceback (most recent call last):
+        ...
+        ValueError: the ciphertext length should be a multiple of 16 bytes
+        """
+        written = 0
+        for output in self.decrypt_iter(src,chunk_size,padfct):
+            dst.write(output)
+            written += len(output)
+        return written
+
+    def encrypt_iter(self,src,chunk_size=CHUNK_SIZE,padfct=padding.PKCS7):
+        """Generator form of encrypt_stream: yields the ciphertext in pieces"""
+        assert self.mode not in (MODE_XTS, MODE_CMAC, MODE_PMAC)
+        self.ed = 'e'
+        for chunk in _read_chunks(src,chunk_size):
+            output = self.chain.update(chunk,'e')
+            if output:
+                yield output
+        if padfct is not None and self.mode in (MODE_ECB,MODE_CBC):
+            yield self.final(padfct)
+        elif self.mode == MODE_OCB:
+            yield self.final()
+
+    def decrypt_iter(self,src,chunk_size=CHUNK_SIZE,padfct=padding.PKCS7):
+        """Generator form of decrypt_stream: yields the plaintext in pieces"""
+        assert self.mode not in (MODE_XTS, MODE_CMAC, MODE_PMAC)
+        self.ed = 'd'
+        unpad = padfct is not None and self.mode in (MODE_ECB,MODE_CBC)
+        pending = '' # last block, held back to remove the padding at the end
+        for chunk in _read_chunks(src,chunk_size):
+            output = self.chain.update(chunk,'d')
+            if unpad and output:
+                output = pending + output
+                pending = output[-self.blocksize:]
+                output = output[:-self.blocksize]
+            if output:
+                yield output
+        if self.mode in (MODE_ECB,MODE_CBC) and self.chain.cache:
+            raise ValueError("the ciphertext length should be a multiple of %i bytes"%self.blocksize)
+        if unpad and pending:
+            yield padfct(pending,padding.UNPAD)
+        elif self.mode == MODE_OCB:
+            yield self.final()
+
+    def __crypt_into(self,data,out,ed,n):
+        size = len(data)
+        if self.mode in (MODE_ECB,MODE_CBC,MODE_OCB):
+            # cached bytes are processed first, the remainder is cached
+            outsize = (len(self.chain.cache) + size)//self.blocksize*self.blocksize
+        else:
+            outsize = size
+        if outsize > len(out):
+            raise ValueError("output buffer too small, %i bytes needed"%outsize)
+        if self.mode == MODE_XTS:
+            out[:outsize] = self.chain.update(_string(data),ed,n)
+            return outsize
+        written = 0
+        for i in xrange(0,size,CHUNK_SIZE):
+            output = self.chain.update(_string(data[i:i+CHUNK_SIZE]),ed)
+            out[written:written+len(output)] = output
+            written += len(output)
+        return written
+
+    def seek(self,offset):
+        """Position a CTR mode cipher at byte offset of its stream
+
+            offset  = amount of bytes from the start of the stream
+
+        The next encrypt/decrypt call processes data as if all the data
+          before offset had already been supplied. The counter object has
+          to provide a seek(n) method (as CryptoPlus.Util.util.Counter does)
+          that sets it to the value of the n'th block.
+        Only one counter block gets encrypted, regardless of the offset.
+        """
+        assert self.mode == MODE_CTR # the keystream is only directly computable in CTR mode
+        self.chain.seek(offset)
+
+    def encrypt_sectors(self,data,first_sector,sector_size=512):
+        """Encrypt consecutive XTS data units (the sectors of a disk image)
+
+            data            = a string of binary data or a buffer supporting
+                              slicing (a mmap object for example), a
+                              multiple of sector_size bytes
+            first_sector    = sequence number of the first sector in data
+            sector_size     = size of a sector in bytes, a multiple of 16
+
+        Every sector is encrypted using its sequence number as tweak value,
+          the same as encrypt(sector,n) with n the sector number as a
+          little-endian string.
+        See CryptoPlus.Cipher.parallel to spread the sectors over worker processes.
+        """
+        assert self.mode == MODE_XTS
+        self.ed = 'e'
+        return self.chain.crypt_sectors('e',data,first_sector,sector_size)
+
+    def decrypt_sectors(self,data,first_sector,sector_size=512):
+        """Decrypt consecutive XTS data units (the sectors of a disk image)
+
+        Same arguments as encrypt_sectors.
+        """
+        assert self.mode == MODE_XTS
+        self.ed = 'd'
+        return self.chain.crypt_sectors('d',data,first_sector,sector_size)
+
+    def update(self,data):
+        """Add data to the message authenticated by a CMAC, PMAC, GCM or OCB cipher
+
+            data    = a string of binary data
+
+        CMAC, PMAC:
+              data is added to the hashed message. Full blocks are processed
+              as soon as they are available, only the last block is kept
+              until digest() is called.
+        GCM:  data is added to the additional authenticated data, which has
+              to be supplied before any data is encrypted or decrypted.
+        OCB:  data is added to the additional authenticated data.
+        """
+        assert self.mode in (MODE_CMAC, MODE_PMAC, MODE_GCM, MODE_OCB)
+        self.chain.feed(_string(data))
+
+    def digest(self):
+        """Return the CMAC, PMAC, GCM or OCB tag of all the data supplied so far
+
+        The state isn't changed: update() (CMAC) or encrypt() (GCM) can
+          still be called afterwards.
+        For OCB, a partial block still in the cache is included as the last
+          block of the message (final() has to be called to get its output).
+        """
+        assert self.mode in (MODE_CMAC, MODE_PMAC, MODE_GCM, MODE_OCB)
+        return self.chain.digest()
+
+    def hexdigest(self):
+        """Same as digest(), but the result is hex encoded"""
+        return self.digest().encode('hex')
+
+    def verify(self,tag):
+        """Check a received tag against digest(), raises ValueError if it doesn't match"""
+        expected = self.digest()
+        if len(tag) <> len(expected):
+            raise ValueError("MAC check failed")
+        # compare every byte, so the time taken doesn't depend on the first mismatch
+        result = 0
+        for x, y in zip(expected, tag):
+            result |= ord(x) ^ ord(y)
+        if result:
+            raise ValueError("MAC check failed")
+
+    def copy(self):
+        """Return a copy of a CMAC, PMAC, GCM or OCB cipher, including the data supplied so far"""
+        assert self.mode in (MODE_CMAC, MODE_PMAC, MODE_GCM, MODE_OCB)
+        return self.__copy()
+
+    def enable_memo(self,size=4096):
+        """Remember the output for recently processed blocks (ECB only)
+
+            size    = maximum amount of blocks remembered per direction
+
+        Data with many identical blocks (zero pages in disk images, ...)
+          then only needs one block cipher call per distinct block.
+        The memo is only used in ECB mode: in every other mode the same
+          input block doesn't give the same output, so nothing is enabled.
+        Returns the BlockMemo object (holding the hit statistics), or None
+          when the mode isn't ECB.
+
+        >>> from CryptoPlus.Cipher import python_AES
+        >>> cipher = python_AES.new('2b7e151628aed2a6abf7158809cf4f3c'.decode('hex'),python_AES.MODE_ECB)
+        >>> memo = cipher.enable_memo(256)
+        >>> ciphertext = cipher.encrypt('\\x00'*16*99 + 'x'*16)
+        >>> ciphertext == python_AES.new('2b7e151628aed2a6abf7158809cf4f3c'.decode('hex')).encrypt('\\x00'*16*99 + 'x'*16)
+        True
+        >>> memo.hits, memo.misses, memo.hit_rate()
+        (98, 2, 0.98)
+        >>> other = cipher.clone()
+        >>> other.encrypt('\\x00'*16*3) == ciphertext[:16*3]
+        True
+        >>> other.chain.memo is memo, other.chain.memo.misses, memo.misses
+        (False, 1, 2)
+        >>> python_AES.new('2b7e151628aed2a6abf7158809cf4f3c'.decode('hex'),python_AES.MODE_CBC).enable_memo() is None
+        True
+        """
+        if self.mode <> MODE_ECB:
+            return None
+        self.chain.memo = BlockMemo(size)
+        return self.chain.memo
+
+    def disable_memo(self):
+        """Stop using the memo set up by enable_memo"""
+        if self.mode == MODE_ECB:
+            self.chain.memo = None
+
     def final(self,padfct=padding.PKCS7):
         # TODO: after calling final, reset the IV? so the cipher is as good as new?
         """Finalizes the encryption by padding the cache
@@ -208,8 +744,14 @@ class BlockCipher():
 
         After finalization, the chain can still be used but the IV, counter etc
           aren't reset but just continue as they were after the last step (finalization step).
+
+        For OCB, no padding is used: the partial block in the cache is
+          encrypted or decrypted as the last block of the message, for both
+          directions. No more data can be processed afterwards.
         """
-        assert self.mode not in (MODE_XTS, MODE_CMAC) # finalizing (=padding) doesn't make sense when in XTS or CMAC mode
+        if self.mode == MODE_OCB:
+            return self.chain.finish()
+        assert self.mode not in (MODE_XTS, MODE_CMAC, MODE_PMAC, MODE_GCM) # finalizing (=padding) doesn't make sense when in XTS, CMAC, PMAC or GCM mode
         if self.ed == 'e':
             # when the chain is in encryption mode, finalizing will pad the cache and encrypt this last block
             if self.mode in (MODE_OFB,MODE_CFB,MODE_CTR):
@@ -222,6 +764,397 @@ class BlockCipher():
             # final function doesn't make sense when decrypting => padding should be removed manually
             pass
 
+class BlockCipherKey(object):
+    """Base class for the immutable expanded keys of the cipher modules
+
+    A key object only holds the key schedule: it keeps no chaining mode state
+      and can't be changed after its creation. One key object can be shared by
+      any number of threads using the one-shot functions of this module
+      (encrypt_cbc, encrypt_ctr, ...), which keep their state in local variables.
+    Cipher modules subclass it as Key, e.g. python_AES.Key(key).
+
+        key             = the raw key
+        blocksize       = block size of the cipher in bytes
+        encrypt_blocks  = function encrypting a string of contiguous blocks (ECB)
+        decrypt_blocks  = function decrypting a string of contiguous blocks (ECB)
+        codebook        = the cipher object of the underlying implementation
+    """
+    key_error_message = "Wrong key size" #should be overwritten in child classes
+
+    def __init__(self,key,blocksize,cipher_module,args={}):
+        if hasattr(self,'keylen_valid'): #wrappers for pycrypto functions don't have this function
+            if not self.keylen_valid(key):
+                raise ValueError(self.key_error_message)
+        codebook = key_schedule_cache.get(cipher_module,key,args)
+        encrypt_blocks, decrypt_blocks = _crypt_blocks(codebook,blocksize)
+        attributes = {'key':key, 'blocksize':blocksize, 'codebook':codebook,
+                      'encrypt_blocks':encrypt_blocks, 'decrypt_blocks':decrypt_blocks}
+        for name, value in attributes.items():
+            object.__setattr__(self,name,value)
+
+    def __setattr__(self,name,value):
+        raise AttributeError("key objects are immutable")
+
+    def __delattr__(self,name):
+        raise AttributeError("key objects are immutable")
+
+def _check_blocks(key,data):
+    if len(data) % key.blocksize:
+        raise ValueError("the data length should be a multiple of %i bytes, see CryptoPlus.Util.padding"%key.blocksize)
+
+def _check_IV(key,IV):
+    if len(IV) <> key.blocksize:
+        raise ValueError("the IV length should be %i bytes"%key.blocksize)
+
+def encrypt_ecb(key,data):
+    """Encrypt data in ECB mode with a key object, data is a multiple of the blocksize"""
+    data = _string(data)
+    _check_blocks(key,data)
+    return key.encrypt_blocks(data)
+
+def decrypt_ecb(key,data):
+    """Decrypt data in ECB mode with a key object, data is a multiple of the blocksize"""
+    data = _string(data)
+    _check_blocks(key,data)
+    return key.decrypt_blocks(data)
+
+def encrypt_cbc(key,IV,data):
+    """Encrypt a whole message in CBC mode with a key object
+
+        key     = key object of a cipher module (e.g. python_AES.Key)
+        IV      = raw string of one block
+        data    = a string of binary data (or a buffer), a multiple of the
+                  blocksize: pad it first with CryptoPlus.Util.padding
+
+    No state is kept between calls, the key object can be shared by threads.
+
+    >>> from CryptoPlus.Cipher import python_AES
+    >>> key = python_AES.Key('2b7e151628aed2a6abf7158809cf4f3c'.decode('hex'))
+    >>> IV = '000102030405060708090a0b0c0d0e0f'.decode('hex')
+    >>> ciphertext = python_AES.encrypt_cbc(key,IV,'6bc1bee22e409f96e93d7e117393172aae2d8a571e03ac9c9eb76fac45af8e51'.decode('hex'))
+    >>> ciphertext.encode('hex')
+    '7649abac8119b246cee98e9b12e9197d5086cb9b507219ee95db113a917678b2'
+    >>> python_AES.decrypt_cbc(key,IV,ciphertext).encode('hex')
+    '6bc1bee22e409f96e93d7e117393172aae2d8a571e03ac9c9eb76fac45af8e51'
+    >>> python_AES.encrypt_cbc(key,IV,'too short')
+    Traceback (most recent call last):
+    ...
+    ValueError: the data length should be a multiple of 16 bytes, see CryptoPlus.Util.padding
+    """
+    data = _string(data)
+    _check_IV(key,IV)
+    _check_blocks(key,data)
+    blocksize = key.blocksize
+    encrypt_blocks = key.encrypt_blocks
+    output = []
+    for i in xrange(0,len(data),blocksize):
+        IV = encrypt_blocks(strxor(data[i:i+blocksize],IV))
+        output.append(IV)
+    return ''.join(output)
+
+def decrypt_cbc(key,IV,data):
+    """Decrypt a whole message in CBC mode with a key object, see encrypt_cbc
+
+    All the blocks are decrypted in one call.
+    """
+    data = _string(data)
+    _check_IV(key,IV)
+    _check_blocks(key,data)
+    if not data:
+        return ''
+    return strxor(IV + data[:-key.blocksize],key.decrypt_blocks(data))
+
+def encrypt_ctr(key,nonce,data,initial_value=0):
+    """Encrypt a whole message in CTR mode with a key object
+
+        key             = key object of a cipher module (e.g. python_AES.Key)
+        nonce           = raw string, the fixed first part of every counter block
+        data            = a string of binary data (or a buffer) of any length
+        initial_value   = value of the big endian counter in the last
+                          blocksize - len(nonce) bytes of the first counter block
+
+    No state is kept between calls, the key object can be shared by threads.
+    Decryption is the same operation (decrypt_ctr).
+
+    >>> from CryptoPlus.Cipher import python_AES
+    >>> key = python_AES.Key('2b7e151628aed2a6abf7158809cf4f3c'.decode('hex'))
+    >>> nonce = 'f0f1f2f3f4f5f6f7f8f9fafbfcfd'.decode('hex')
+    >>> ciphertext = python_AES.encrypt_ctr(key,nonce,'6bc1bee22e409f96e93d7e117393172aae2d8a571e03ac9c9eb76fac45af8e51'.decode('hex'),0xfeff)
+    >>> ciphertext.encode('hex')
+    '874d6191b620e3261bef6864990db6ce9806f66b7970fdff8617187bb9fffdff'
+    >>> python_AES.decrypt_ctr(key,nonce,ciphertext,0xfeff).encode('hex')
+    '6bc1bee22e409f96e93d7e117393172aae2d8a571e03ac9c9eb76fac45af8e51'
+    """
+    data = _string(data)
+    blocksize = key.blocksize
+    if len(nonce) >= blocksize:
+        raise ValueError("the nonce should be shorter than %i bytes"%blocksize)
+    if not data:
+        return ''
+    counter = util.Counter(nonce + util.number2string_N(initial_value,blocksize-len(nonce)),len(nonce))
+    nblocks = (len(data) + blocksize - 1) // blocksize
+    keystream = key.encrypt_blocks(counter.next_blocks(nblocks))
+    return strxor(data,keystream[:len(data)])
+
+decrypt_ctr = encrypt_ctr
+
+def encrypt_cbc_multi(sessions):
+    """Encrypt many independent messages in CBC mode, advancing all the chains in lockstep
+
+        sessions = list of (key, IV, data) tuples as for encrypt_cbc, the
+                   key objects of one cipher module (and block size)
+
+    Returns the list of ciphertexts, in the order of the sessions. The result
+      is the same as calling encrypt_cbc for every session.
+    CBC encryption of one message is serial, but the n'th blocks of all the
+      messages can be encrypted together: every step encrypts one block of
+      every message that isn't finished yet in one call. Messages of
+      different lengths drop out of the steps once they're done.
+    With the rijndael based ciphers (python_AES, python_Rijndael) the lanes
+      are processed with NumPy when it is installed and there are enough of
+      them, other ciphers encrypt the lanes sharing a key object in one call.
+
+    >>> from CryptoPlus.Cipher import python_AES
+    >>> keys = [python_AES.Key(chr(i)*16) for i in xrange(3)]
+    >>> sessions = [(keys[i],chr(i)*16,'m'*16*(i+1)) for i in xrange(3)]
+    >>> ciphertexts = python_AES.encrypt_cbc_multi(sessions)
+    >>> ciphertexts == [python_AES.encrypt_cbc(*session) for session in sessions]
+    True
+    """
+    if not sessions:
+        return []
+    sessions = [(key,IV,_string(data)) for key,IV,data in sessions]
+    blocksize = sessions[0][0].blocksize
+    for key,IV,data in sessions:
+        if key.blocksize <> blocksize:
+            raise ValueError("all the keys should have the same block size")
+        _check_IV(key,IV)
+        _check_blocks(key,data)
+    # longest messages first: the lanes still busy in a step are always the first ones
+    order = sorted(xrange(len(sessions)),key=lambda i: -len(sessions[i][2]))
+    messages = [sessions[i][2] for i in order]
+    lanes = _lanes([sessions[i][0] for i in order])
+    X = ''.join([sessions[i][1] for i in order])
+    steps = []
+    active = len(messages)
+    for offset in xrange(0,len(messages[0]),blocksize):
+        while len(messages[active-1]) <= offset:
+            active -= 1
+        plaintext = ''.join([data[offset:offset+blocksize] for data in messages[:active]])
+        X = lanes(strxor(plaintext,X[:active*blocksize]))
+        steps.append(X)
+    output = [None]*len(sessions)
+    for lane, i in enumerate(order):
+        start, end = lane*blocksize, (lane+1)*blocksize
+        output[i] = ''.join([X[start:end] for X in steps[:len(messages[lane])//blocksize]])
+    return output
+
+def _lanes(keys):
+    """Get a function encrypting one block for each of the first n keys in one call"""
+    codebooks = [key.codebook for key in keys]
+    cls = codebooks[0].__class__
+    if hasattr(cls,'lanes') and all([codebook.__class__ is cls for codebook in codebooks]):
+        return cls.lanes(codebooks).encrypt
+    # lanes sharing a key object are encrypted in one call
+    blocksize = keys[0].blocksize
+    groups = OrderedDict()
+    for lane, key in enumerate(keys):
+        groups.setdefault(id(key),(key,[]))[1].append(lane)
+    def encrypt(data):
+        n = len(data)//blocksize
+        output = [None]*n
+        for key, lanes in groups.itervalues():
+            lanes = [lane for lane in lanes if lane < n]
+            if not lanes:
+                continue
+            blocks = key.encrypt_blocks(''.join([data[lane*blocksize:(lane+1)*blocksize] for lane in lanes]))
+            for j, lane in enumerate(lanes):
+                output[lane] = blocks[j*blocksize:(j+1)*blocksize]
+        return ''.join(output)
+    return encrypt
+
+def _string(data):
+    """Get the contents of a buffer type object as a raw string"""
+    if isinstance(data,str):
+        return data
+    if isinstance(data,memoryview):
+        return data.tobytes()
+    if isinstance(data,(bytearray,buffer)):
+        return str(data)
+    # mmap objects and other types supporting slicing
+    return data[:]
+
+def _shallow_copy(obj):
+    """copy.copy, without its dispatching for the (old-style) cipher and chain objects"""
+    if type(obj) is types.InstanceType:
+        return types.InstanceType(obj.__class__, obj.__dict__.copy())
+    return copy.copy(obj)
+
+def _read_chunks(src, chunk_size):
+    """Read a file-like object in chunks, reusing one buffer if possible"""
+    readinto = getattr(src,'readinto',None)
+    if readinto is None:
+        while True:
+            data = src.read(chunk_size)
+            if not data:
+                return
+            yield data
+    buf = bytearray(chunk_size)
+    while True:
+        n = readinto(buf)
+        if not n:
+            return
+        yield str(buffer(buf,0,n))
+
+def _ghash_tables(H):
+    """Multiplication tables for GHASH with the hash subkey H (a long)
+
+    Returns 16 tables of 256 entries: table i holds H multiplied by every
+      value of byte i (0 = most significant) of a 128-bit block, so a
+      product is the XOR of 16 table lookups.
+    """
+    # P[j] = H mul x^j, x^0 being the most significant bit of a block
+    P = []
+    V = H
+    for j in xrange(128):
+        P.append(V)
+        if V & 1:
+            V = (V >> 1) ^ 0xe1000000000000000000000000000000L
+        else:
+            V = V >> 1
+    tables = []
+    for i in xrange(16):
+        table = [0]*256
+        for k in xrange(7,-1,-1):
+            bit = 0x80 >> k
+            for b in xrange(bit):
+                table[b | bit] = table[b] ^ P[8*i + k]
+        tables.append(table)
+    return tables
+
+def _ghash(tables, Y, data):
+    """GHASH data (a multiple of 16 bytes) starting from the value Y"""
+    T0,T1,T2,T3,T4,T5,T6,T7,T8,T9,T10,T11,T12,T13,T14,T15 = tables
+    words = struct.unpack('>%dQ' % (len(data)//8), data)
+    for i in xrange(0, len(words), 2):
+        y = Y ^ (words[i] << 64 | words[i+1])
+        Y = (T0[y >> 120] ^ T1[(y >> 112) & 0xff] ^ T2[(y >> 104) & 0xff] ^ T3[(y >> 96) & 0xff] ^
+             T4[(y >> 88) & 0xff] ^ T5[(y >> 80) & 0xff] ^ T6[(y >> 72) & 0xff] ^ T7[(y >> 64) & 0xff] ^
+             T8[(y >> 56) & 0xff] ^ T9[(y >> 48) & 0xff] ^ T10[(y >> 40) & 0xff] ^ T11[(y >> 32) & 0xff] ^
+             T12[(y >> 24) & 0xff] ^ T13[(y >> 16) & 0xff] ^ T14[(y >> 8) & 0xff] ^ T15[y & 0xff])
+    return Y
+
+def _double(S):
+    """Multiply a 128-bit block (a long) by x in GF(2^128), as used by OCB"""
+    if S >> 127:
+        return ((S << 1) & 0xffffffffffffffffffffffffffffffffL) ^ 0x87
+    return S << 1
+
+def _gf_mul(a, b):
+    """Multiply two 128-bit blocks (longs) in GF(2^128), with the bit order of _double"""
+    result = 0
+    while b:
+        if b & 1:
+            result ^= a
+        b >>= 1
+        a <<= 1
+        if a >> 128:
+            a ^= 0x100000000000000000000000000000087L
+    return result
+
+def _gf_pow_x(n):
+    """x to the power n in GF(2^128), by square-and-multiply"""
+    result = 1
+    for bit in bin(n)[2:]:
+        result = _gf_mul(result, result)
+        if bit == '1':
+            result <<= 1
+            if result >> 128:
+                result ^= 0x100000000000000000000000000000087L
+    return result
+
+def _crypt_blocks(codebook, blocksize):
+    """Get functions to encrypt/decrypt many contiguous blocks in one call
+
+    Cipher cores can provide encrypt_blocks/decrypt_blocks methods that
+      process a string of contiguous blocks at once.
+    For codebooks that don't (pycrypto objects, third party ciphers),
+      the returned functions call encrypt/decrypt once per block.
+    """
+    encrypt_blocks = getattr(codebook, 'encrypt_blocks', None)
+    if encrypt_blocks is None:
+        encrypt_blocks = _blockwise(codebook.encrypt, blocksize)
+    decrypt_blocks = getattr(codebook, 'decrypt_blocks', None)
+    if decrypt_blocks is None:
+        decrypt_blocks = _blockwise(codebook.decrypt, blocksize)
+    return encrypt_blocks, decrypt_blocks
+
+def _blockwise(crypt, blocksize):
+    def crypt_blocks(data):
+        return ''.join([crypt(data[i:i+blocksize]) for i in xrange(0, len(data), blocksize)])
+    return crypt_blocks
+
+def _counter_blocks(counter, n):
+    """Get the next n counter blocks as one string
+
+    Uses the next_blocks(n) method of the counter object if it has one
+      (CryptoPlus.Util.util.Counter does), any other callable is called n times.
+    """
+    if hasattr(counter, 'next_blocks'):
+        return counter.next_blocks(n)
+    return ''.join([counter() for i in xrange(n)])
+
+class BlockMemo:
+    """Bounded LRU memo of block cipher output, for the ECB mode
+
+        size    = maximum amount of blocks remembered per direction
+        hits    = amount of blocks found in the memo (or processed once
+                  for several identical blocks in one call)
+        misses  = amount of blocks that had to be processed
+    """
+    def __init__(self, size):
+        self.size = size
+        self.hits = 0
+        self.misses = 0
+        self.__blocks = {'e':OrderedDict(), 'd':OrderedDict()}
+
+    def hit_rate(self):
+        """Fraction of the blocks that didn't need a block cipher call"""
+        total = self.hits + self.misses
+        if total == 0:
+            return 0.0
+        return float(self.hits) / total
+
+    def crypt(self, data, blocksize, ed, crypt_blocks):
+        """Process data (a multiple of blocksize), only passing unknown blocks to crypt_blocks"""
+        memo = self.__blocks[ed]
+        output = []
+        missing = {} # block -> positions in output
+        for i in xrange(0, len(data), blocksize):
+            block = data[i:i+blocksize]
+            result = memo.pop(block, None)
+            if result is None:
+                missing.setdefault(block, []).append(len(output))
+            else:
+                self.hits += 1
+                # reinsert as most recently used
+                memo[block] = result
+            output.append(result)
+        if missing:
+            blocks = missing.keys()
+            results = crypt_blocks(''.join(blocks))
+            for j in xrange(len(blocks)):
+                result = results[j*blocksize:(j+1)*blocksize]
+                positions = missing[blocks[j]]
+                for position in positions:
+                    output[position] = result
+                self.misses += 1
+                self.hits += len(positions) - 1
+                memo[blocks[j]] = result
+            while len(memo) > self.size:
+                memo.popitem(last=False)
+        return ''.join(output)
+
 class ECB:
     """ECB chaining mode
     """
@@ -229,6 +1162,12 @@ class ECB:
         self.cache = ''
         self.codebook = codebook
         self.blocksize = blocksize
+        self.encrypt_blocks, self.decrypt_blocks = _crypt_blocks(codebook, blocksize)
+        self.memo = None # BlockMemo, see BlockCipher.enable_memo
+
+    def reset(self):
+        """Forget the cached data, the memo is kept"""
+        self.cache = ''
 
     def update(self, data, ed):
         """Processes the given ciphertext/plaintext
@@ -245,27 +1184,35 @@ class ECB:
           the new data will be concatenated to the cache and then
           cache+data will be processed and full blocks will be outputted.
         """
-        output_blocks = []
         self.cache += data
         if len(self.cache) < self.blocksize:
             return ''
-        for i in xrange(0, len(self.cache)-self.blocksize+1, self.blocksize):
-            #the only difference between encryption/decryption in the chain is the cipher block
-            if ed == 'e':
-                output_blocks.append(self.codebook.encrypt( self.cache[i:i + self.blocksize] ))
-            else:
-                output_blocks.append(self.codebook.decrypt( self.cache[i:i + self.blocksize] ))
-        self.cache = self.cache[i+self.blocksize:]
-        return ''.join(output_blocks)
+        n = len(self.cache) - len(self.cache) % self.blocksize
+        #the only difference between encryption/decryption in the chain is the cipher block
+        if ed == 'e':
+            crypt_blocks = self.encrypt_blocks
+        else:
+            crypt_blocks = self.decrypt_blocks
+        if self.memo is not None:
+            output = self.memo.crypt(self.cache[:n], self.blocksize, ed, crypt_blocks)
+        else:
+            output = crypt_blocks(self.cache[:n])
+        self.cache = self.cache[n:]
+        return output
 
 class CBC:
     """CBC chaining mode
     """
     def __init__(self, codebook, blocksize, IV):
-        self.IV = IV
-        self.cache = ''
         self.codebook = codebook
         self.blocksize = blocksize
+        self.decrypt_blocks = _crypt_blocks(codebook, blocksize)[1]
+        self.reset(IV)
+
+    def reset(self, IV):
+        """Start a new message with the given IV"""
+        self.IV = IV
+        self.cache = ''
 
     def update(self, data, ed):
         """Processes the given ciphertext/plaintext
@@ -282,27 +1229,28 @@ class CBC:
           the new data will be concatenated to the cache and then
           cache+data will be processed and full blocks will be outputted.
         """
+        blocksize = self.blocksize
+        cache = self.cache + data
+        if len(cache) < blocksize:
+            self.cache = cache
+            return ''
+        n = len(cache) - len(cache) % blocksize
         if ed == 'e':
-            encrypted_blocks = ''
-            self.cache += data
-            if len(self.cache) < self.blocksize:
-                return ''
-            for i in xrange(0, len(self.cache)-self.blocksize+1, self.blocksize):
-                self.IV = self.codebook.encrypt(util.xorstring(self.cache[i:i+self.blocksize],self.IV))
-                encrypted_blocks += self.IV
-            self.cache = self.cache[i+self.blocksize:]
-            return encrypted_blocks
+            IV = self.IV
+            output = []
+            encrypt = self.codebook.encrypt
+            for i in xrange(0, n, blocksize):
+                IV = encrypt(strxor(cache[i:i+blocksize],IV))
+                output.append(IV)
+            self.IV = IV
+            output = ''.join(output)
         else:
-            decrypted_blocks = ''
-            self.cache += data
-            if len(self.cache) < self.blocksize:
-                return ''
-            for i in xrange(0, len(self.cache)-self.blocksize+1, self.blocksize):
-                plaintext = util.xorstring(self.IV,self.codebook.decrypt(self.cache[i:i + self.blocksize]))
-                self.IV = self.cache[i:i + self.blocksize]
-                decrypted_blocks+=plaintext
-            self.cache = self.cache[i+self.blocksize:]
-            return decrypted_blocks
+            # P_i = D(C_i) xor C_(i-1): all blocks are decrypted in one call
+            #   and XORed with the ciphertext shifted by one block
+            output = strxor(self.IV + cache[:n-blocksize], self.decrypt_blocks(cache[:n]))
+            self.IV = cache[n-blocksize:n]
+        self.cache = cache[n:]
+        return output
 
 class CFB:
     # TODO: bit access instead of only byte level access
@@ -313,12 +1261,17 @@ class CFB:
 
     def __init__(self, codebook, blocksize, IV,segment_size):
         self.codebook = codebook
-        self.IV = IV
         self.blocksize = blocksize
         self.segment_size = segment_size/8
-        self.keystream = []
+        self.encrypt_blocks = _crypt_blocks(codebook, blocksize)[0]
+        self.reset(IV)
+
+    def reset(self, IV):
+        """Start a new message with the given IV"""
+        self.IV = IV
+        self.keystream = '' # holds the unused part of the current segment
         self.totalbytes = 0
-        
+
     def update(self, data, ed):
         """Processes the given ciphertext/plaintext
 
@@ -331,26 +1284,61 @@ class CFB:
         The encrypt/decrypt functions will always process all of the supplied
           input data immediately. No cache will be kept.
         """
-        output = list(data)
-
-        for i in xrange(len(data)):
-            if ed =='e':
-                if len(self.keystream) == 0:
-                    block = self.codebook.encrypt(self.IV)
-                    self.keystream = list(block)[:self.segment_size] # keystream consists of the s MSB's
-                    self.IV = self.IV[self.segment_size:] # keeping (b-s) LSB's
-                output[i] = chr(ord(output[i]) ^ ord(self.keystream.pop(0)))
-                self.IV += output[i] # the IV for the next block in the chain is being built byte per byte as the ciphertext flows in
-            else:
-                if len(self.keystream) == 0:
-                    block = self.codebook.encrypt(self.IV)
-                    self.keystream = list(block)[:self.segment_size]
-                    self.IV = self.IV[self.segment_size:]
-                self.IV += output[i]
-                output[i] = chr(ord(output[i]) ^ ord(self.keystream.pop(0)))
-        self.totalbytes += len(output)
+        if ed == 'd':
+            return self.__decrypt(data)
+        s = self.segment_size
+        encrypt = self.codebook.encrypt
+        self.totalbytes += len(data)
+        # finish the current segment first
+        k = min(len(self.keystream), len(data))
+        output = [strxor(data[:k], self.keystream[:k])] if k else []
+        self.keystream = self.keystream[k:]
+        IV = self.IV + ''.join(output)
+        # one codebook call per segment: the keystream consists of the s MSB's,
+        #   the shift register keeps the (b-s) LSB's and takes the ciphertext
+        end = len(data) - (len(data) - k) % s
+        for i in xrange(k, end, s):
+            segment = strxor(data[i:i+s], encrypt(IV)[:s])
+            IV = IV[s:] + segment
+            output.append(segment)
+        # a trailing partial segment keeps its unused keystream for the next call
+        if end < len(data):
+            keystream = encrypt(IV)[:s]
+            segment = strxor(data[end:], keystream[:len(data)-end])
+            IV = IV[s:] + segment
+            self.keystream = keystream[len(segment):]
+            output.append(segment)
+        self.IV = IV
         return ''.join(output)
 
+    def __decrypt(self, data):
+        # The input of every block cipher call is known from the ciphertext:
+        #   all calls for the supplied data are done at once.
+        s = self.segment_size
+        b = self.blocksize
+        self.totalbytes += len(data)
+        # finish the current segment first
+        k = min(len(self.keystream), len(data))
+        output = strxor(data[:k], self.keystream[:k]) if k else ''
+        self.keystream = self.keystream[k:]
+        self.IV += data[:k]
+        rest = data[k:]
+        if not rest:
+            return output
+        # the shift register for segment j holds bytes j*s ... j*s+b of IV + ciphertext
+        stream = self.IV + rest
+        m = (len(rest) + s - 1) // s
+        if s == b:
+            keystream = self.encrypt_blocks(stream[:m*b])
+        else:
+            blocks = self.encrypt_blocks(''.join([stream[j*s:j*s+b] for j in xrange(m)]))
+            keystream = ''.join([blocks[j*b:j*b+s] for j in xrange(m)])
+        output += strxor(rest, keystream[:len(rest)])
+        # unused keystream of a partial last segment is kept for the next call
+        self.keystream = keystream[len(rest):]
+        self.IV = stream[m*s:]
+        return output
+
 class OFB:
     """OFB Chaining Mode
 
@@ -358,11 +1346,15 @@ class OFB:
     """
     def __init__(self, codebook, blocksize, IV):
         self.codebook = codebook
-        self.IV = IV
         self.blocksize = blocksize
-        self.keystream = []
+        self.reset(IV)
+
+    def reset(self, IV):
+        """Start a new message with the given IV"""
+        self.IV = IV
+        self.keystream = '' #holds the unused part of the last output block
         self.totalbytes = 0
-        
+
     def update(self, data, ed):
         """Processes the given ciphertext/plaintext
 
@@ -377,30 +1369,42 @@ class OFB:
         """
         #no difference between encryption and decryption mode
         n = len(data)
-        blocksize = self.blocksize
-        output = list(data)
-
-        for i in xrange(n):
-            if len(self.keystream) == 0: #encrypt a new counter block when the current keystream is fully used
-                self.IV = self.codebook.encrypt(self.IV)
-                self.keystream = list(self.IV)
-            output[i] = chr(ord(output[i]) ^ ord(self.keystream.pop(0))) #as long as an encrypted counter value is available, the output is just "input XOR keystream"
-        
-        self.totalbytes += len(output)
-        return ''.join(output)
+        if n == 0:
+            return ''
+        keystream = self.keystream
+
+        if n > len(keystream):
+            # the output blocks needed for this call are generated in one go
+            nblocks = (n - len(keystream) + self.blocksize - 1) // self.blocksize
+            encrypt = self.codebook.encrypt
+            IV = self.IV
+            blocks = [keystream]
+            for i in xrange(nblocks):
+                IV = encrypt(IV)
+                blocks.append(IV)
+            self.IV = IV
+            keystream = ''.join(blocks)
+        self.keystream = keystream[n:]
+        self.totalbytes += n
+        return strxor(data, keystream[:n])
 
 class CTR:
     """CTR Chaining Mode
 
     Can be accessed as a stream cipher.
     """
-    # initial counter value can be choosen, decryption always starts from beginning
-    #   -> you can start from anywhere yourself: just feed the cipher encoded blocks and feed a counter with the corresponding value
+    # initial counter value can be choosen, decryption starts from beginning
+    #   -> use seek() to start from anywhere else, it needs a counter that supports seek()
     def __init__(self, codebook, blocksize, counter):
         self.codebook = codebook
-        self.counter = counter
         self.blocksize = blocksize
-        self.keystream = [] #holds the output of the current encrypted counter value
+        self.encrypt_blocks = _crypt_blocks(codebook, blocksize)[0]
+        self.reset(counter)
+
+    def reset(self, counter):
+        """Start a new message with the given counter object"""
+        self.counter = counter
+        self.keystream = '' #holds the unused part of the last encrypted counter value
         self.totalbytes = 0
 
     def update(self, data, ed):
@@ -417,16 +1421,31 @@ class CTR:
         """
         # no need for the encryption/decryption distinction: both are the same
         n = len(data)
+        if n == 0:
+            return ''
         blocksize = self.blocksize
-
-        output = list(data)
-        for i in xrange(n):
-            if len(self.keystream) == 0: #encrypt a new counter block when the current keystream is fully used
-                block = self.codebook.encrypt(self.counter())
-                self.keystream = list(block)
-            output[i] = chr(ord(output[i])^ord(self.keystream.pop(0))) #as long as an encrypted counter value is available, the output is just "input XOR keystream"
-        self.totalbytes += len(output)
-        return ''.join(output)
+        keystream = self.keystream
+
+        if n > len(keystream):
+            # encrypt all the counter blocks needed for this call in one go
+            nblocks = (n - len(keystream) + blocksize - 1) // blocksize
+            keystream += self.encrypt_blocks(_counter_blocks(self.counter, nblocks))
+        # keystream left over from a partial block is kept for the next call
+        self.keystream = keystream[n:]
+        self.totalbytes += n
+        return strxor(data, keystream[:n])
+
+    def seek(self, offset):
+        """Position the counter and keystream at byte offset of the stream"""
+        if not hasattr(self.counter, 'seek'):
+            raise TypeError("the counter object doesn't support seeking")
+        blocks, partial = divmod(offset, self.blocksize)
+        self.counter.seek(blocks)
+        if partial:
+            self.keystream = self.encrypt_blocks(self.counter())[partial:]
+        else:
+            self.keystream = ''
+        self.totalbytes = offset
 
 class XTS:
     """XTS Chaining Mode
@@ -438,6 +1457,12 @@ class XTS:
         self.cache = ''
         self.codebook1 = codebook1
         self.codebook2 = codebook2
+        self.encrypt_blocks, self.decrypt_blocks = _crypt_blocks(codebook1, 16)
+        self.encrypt_blocks2 = _crypt_blocks(codebook2, 16)[0]
+
+    def reset(self):
+        """Forget the cached data"""
+        self.cache = ''
 
     def update(self, data, ed,tweak=''):
         # supply n as a raw string
@@ -449,54 +1474,117 @@ class XTS:
         Every decrypt function called on a XTS cipher will output
           a decrypted block based on the current supplied ciphertext block.
         """
-        output = ''
         assert len(data) > 15, "At least one block of 128 bits needs to be supplied"
         assert len(data) < 128*pow(2,20)
 
-        # initializing T
+        self.set_tweak(tweak)
+        # All blocks but one last full block and opt one last partial block
+        #   are processed at once: when the data supplied is a multiple
+        #   of 16 bytes, that is every block.
+        i = len(data) // 16
+        if len(data) % 16:
+            i -= 1
+        output = self.crypt_blocks(ed,data[:i*16])
+        if len(data) % 16:
+            output += self.crypt_tail(ed,data[i*16:])
+        return output
+
+    def set_tweak(self,tweak):
+        """Initialize T for the data unit with sequence number 'tweak'"""
         # e_k2_n = E_K2(tweak)
         e_k2_n = self.codebook2.encrypt(tweak+ '\x00' * (16-len(tweak)))[::-1]
         self.T = util.string2number(e_k2_n)
 
-        i=0
-        while i < ((len(data) // 16)-1): #Decrypt all the blocks but one last full block and opt one last partial block
-            # C = E_K1(P xor T) xor T
-            output += self.__xts_step(ed,data[i*16:(i+1)*16],self.T)
-            # T = E_K2(n) mul (a pow i)
-            self.__T_update()
-            i+=1
-
-        # Check if the data supplied is a multiple of 16 bytes -> one last full block and we're done
-        if len(data[i*16:]) == 16:
-            # C = E_K1(P xor T) xor T
-            output += self.__xts_step(ed,data[i*16:(i+1)*16],self.T)
-            # T = E_K2(n) mul (a pow i)
-            self.__T_update()
+    def crypt_blocks(self,ed,data):
+        """Process full blocks starting at the current T, updating T
+
+        data: raw string, a multiple of 16 bytes
+        """
+        if not data:
+            return ''
+        return self.__crypt_T(ed,data,self.__T_string(len(data) // 16))
+
+    def crypt_sectors(self,ed,data,first_sector,sector_size):
+        """Process consecutive data units, each using its sequence number as tweak
+
+        data: raw string or buffer, a multiple of sector_size bytes
+        """
+        if sector_size < 16 or sector_size % 16:
+            raise ValueError("sector size should be a multiple of 16 bytes")
+        if len(data) % sector_size:
+            raise ValueError("data should be a multiple of the sector size")
+        nsectors = len(data) // sector_size
+        if nsectors == 0:
+            return ''
+        # E_K2 of every tweak (little-endian sector number) in one go
+        tweaks = ''.join([util.number2string_N(i,16)[::-1] for i in xrange(first_sector,first_sector+nsectors)])
+        e_k2_n = self.encrypt_blocks2(tweaks)
+        T_strings = []
+        for i in xrange(0,len(e_k2_n),16):
+            self.T = util.string2number(e_k2_n[i:i+16][::-1])
+            T_strings.append(self.__T_string(sector_size // 16))
+        return self.__crypt_T(ed,data[:],''.join(T_strings))
+
+    def __crypt_T(self,ed,data,T_string):
+        # C = E_K1(P xor T) xor T
+        if ed == 'd':
+            return strxor(T_string, self.decrypt_blocks(strxor(T_string, data)))
         else:
-            T_temp = [self.T]
-            self.__T_update()
-            T_temp.append(self.T)
-            if ed=='d':
-                # Permutation of the last two indexes
-                T_temp.reverse()
-            # Decrypt/Encrypt the last two blocks when data is not a multiple of 16 bytes
-            Cm1 = data[i*16:(i+1)*16]
-            Cm = data[(i+1)*16:]
-            PP = self.__xts_step(ed,Cm1,T_temp[0])
-            Cp = PP[len(Cm):]
-            Pm = PP[:len(Cm)]
-            CC = Cm+Cp
-            Pm1 = self.__xts_step(ed,CC,T_temp[1])
-            output += Pm1 + Pm
-        return output
+            return strxor(T_string, self.encrypt_blocks(strxor(T_string, data)))
+
+    def __T_string(self,n):
+        # The T values (as little-endian strings) of the next n blocks, updating T
+        # T = E_K2(n) mul (a pow i)
+        # Up to 32 T values are put next to each other in one long and
+        #   converted to a string at once, reversing the string then gives
+        #   the little-endian T values in the right order.
+        T = self.T
+        parts = []
+        while n:
+            m = min(n,32)
+            X = 0
+            for j in xrange(m):
+                X |= T << (128*j)
+                T <<= 1
+                if T >> 128:
+                    T ^= 0x100000000000000000000000000000087L
+            parts.append(util.number2string_N(X,16*m)[::-1])
+            n -= m
+        self.T = T
+        return ''.join(parts)
+
+    def skip_blocks(self,n):
+        """Update T as if n blocks were processed: T = T mul (a pow n)"""
+        self.T = _gf_mul(self.T, _gf_pow_x(n))
+
+    def crypt_tail(self,ed,data):
+        """Process one last full block and a partial block using ciphertext stealing
+
+        data: raw string between 17 and 31 bytes
+        """
+        T_temp = [self.T]
+        self.__T_update()
+        T_temp.append(self.T)
+        if ed=='d':
+            # Permutation of the last two indexes
+            T_temp.reverse()
+        # Decrypt/Encrypt the last two blocks when data is not a multiple of 16 bytes
+        Cm1 = data[:16]
+        Cm = data[16:]
+        PP = self.__xts_step(ed,Cm1,T_temp[0])
+        Cp = PP[len(Cm):]
+        Pm = PP[:len(Cm)]
+        CC = Cm+Cp
+        Pm1 = self.__xts_step(ed,CC,T_temp[1])
+        return Pm1 + Pm
 
     def __xts_step(self,ed,tocrypt,T):
         T_string = util.number2string_N(T,16)[::-1]
         # C = E_K1(P xor T) xor T
         if ed == 'd':
-            return util.xorstring(T_string, self.codebook1.decrypt(util.xorstring(T_string, tocrypt)))
+            return strxor(T_string, self.codebook1.decrypt(strxor(T_string, tocrypt)))
         else:
-            return util.xorstring(T_string, self.codebook1.encrypt(util.xorstring(T_string, tocrypt)))
+            return strxor(T_string, self.codebook1.encrypt(strxor(T_string, tocrypt)))
 
     def __T_update(self):
         # Used for calculating T for a certain step using the T value from the previous step
@@ -517,18 +1605,15 @@ class CMAC:
     Usable with blockciphers with a 8 or 16-byte blocksize
     """
     # TODO: move to hash module?
-    # TODO: change update behaviour to .update() and .digest() as for all hash modules?
-    #       -> other hash functions in pycrypto: calling update, concatenates current input with previous input and hashes everything
+    # update() hashes one complete message, feed() and digest() hash a message supplied in pieces
     __Rb_dictionary = {64:0x000000000000001b,128:0x00000000000000000000000000000087}
     supported_blocksizes = __Rb_dictionary.keys()
     def __init__(self,codebook,blocksize,IV):
         # Purpose of init: calculate Lu & Lu2
         #blocksize (in bytes): to select the Rb constant in the dictionary
         #Rb as a dictionary: adding support for other blocksizes is easy
-        self.cache=''
         self.blocksize = blocksize
         self.codebook = codebook
-        self.IV = IV
 
         #Rb_dictionary: holds values for Rb for different blocksizes
         # values for 64 and 128 bits found here: http://www.nuee.nagoya-u.ac.jp/labs/tiwata/omac/omac.html
@@ -540,25 +1625,30 @@ class CMAC:
 
         self.Rb = self.__Rb_dictionary[blocksize*8]
 
-        mask1 = int(('\xff'*blocksize).encode('hex'),16)
-        mask2 = int(('\x80' + '\x00'*(blocksize-1) ).encode('hex'),16)
+        self.L = int(self.codebook.encrypt('\x00'*blocksize).encode('hex'),16)
+        Lu = self.double(self.L)
+        Lu2 = self.double(Lu)
+
+        self.Lu =util.number2string_N(Lu,self.blocksize)
+        self.Lu2=util.number2string_N(Lu2,self.blocksize)
+        self.reset(IV)
 
-        L = int(self.codebook.encrypt('\x00'*blocksize).encode('hex'),16)
+    def reset(self, IV):
+        """Start a new message, the subkeys are kept"""
+        self.IV = IV
+        # state of the message supplied in pieces: the chaining value after
+        #   the blocks processed so far and the last (maybe full) block in cache
+        self.X = IV
+        self.cache = ''
 
+    def double(self, L):
+        """Multiply L (a long) by u in GF(2^blocksize)"""
+        mask1 = int(('\xff'*self.blocksize).encode('hex'),16)
+        mask2 = int(('\x80' + '\x00'*(self.blocksize-1) ).encode('hex'),16)
         if L & mask2:
-            Lu = ((L << 1) & mask1) ^ self.Rb
+            return ((L << 1) & mask1) ^ self.Rb
         else:
-            Lu = L << 1
-            Lu = Lu & mask1
-
-        if Lu & mask2:
-            Lu2 = ((Lu << 1) & mask1)^ self.Rb
-        else:
-            Lu2 = Lu << 1
-            Lu2 = Lu2 & mask1
-
-        self.Lu =util.number2string_N(Lu,self.blocksize)
-        self.Lu2=util.number2string_N(Lu2,self.blocksize)
+            return (L << 1) & mask1
 
     def update(self, data, ed):
         """Processes the given ciphertext/plaintext
@@ -574,19 +1664,394 @@ class CMAC:
         No finalizing needed.
         """
         assert ed == 'e'
+        X, last = self.__chain(self.IV,data)
+        return self.__last(X,last)
+
+    def feed(self, data):
+        """Add data to the message hashed by digest()"""
+        self.X, self.cache = self.__chain(self.X,self.cache + data)
+
+    def digest(self):
+        """CMAC of the data supplied to feed() so far, the state isn't changed"""
+        return self.__last(self.X,self.cache)
+
+    def __chain(self, X, data):
+        # CBC-MAC over every block of data except the last one (full or not),
+        #   returns the chaining value and the last block
         blocksize = self.blocksize
+        n = ((len(data)-1)//blocksize)*blocksize if data else 0
+        encrypt = self.codebook.encrypt
+        for i in xrange(0,n,blocksize):
+            X = encrypt(strxor(data[i:i+blocksize],X))
+        return X, data[n:]
+
+    def __last(self, X, last):
+        blocksize = self.blocksize
+        if len(last) == blocksize:
+            X = strxor(strxor(last,X),self.Lu)
+        else:
+            tmp = last + '\x80' + '\x00'*(blocksize - len(last)-1)
+            X = strxor(strxor(tmp,X),self.Lu2)
+        return self.codebook.encrypt(X)
+
+class GCM:
+    """Galois/Counter Mode
+
+    Usable with blockciphers with a 16-byte blocksize.
+    Can be accessed as a stream cipher, the ciphertext is authenticated
+      in the same pass using GHASH.
+    NIST Special Publication 800-38D
+    """
+    def __init__(self, codebook, blocksize, IV):
+        self.codebook = codebook
+        self.blocksize = blocksize
+        self.encrypt_blocks = _crypt_blocks(codebook, blocksize)[0]
+        # the multiplications by the hash subkey H = E_K(0^128) use tables
+        #   computed once per key (8-bit tables, 16*256 entries)
+        self.tables = _ghash_tables(util.string2number(codebook.encrypt('\x00'*16)))
+        self.reset(IV)
+
+    def reset(self, IV):
+        """Start a new message with the given nonce, the GHASH tables are kept"""
+        codebook = self.codebook
+        if len(IV) == 12:
+            J0 = IV + '\x00\x00\x00\x01'
+        else:
+            padded = IV + '\x00'*(-len(IV) % 16) + struct.pack('>QQ', 0, len(IV)*8)
+            J0 = util.number2string_N(_ghash(self.tables, 0, padded), 16)
+        self.E_J0 = codebook.encrypt(J0)
+        # counter blocks: the first 96 bits of J0 and a 32-bit counter
+        self.prefix = J0[:12]
+        self.counter = struct.unpack('>I', J0[12:])[0]
+
+        self.Y = 0 # GHASH value of the full blocks processed so far
+        self.cache = '' # bytes of the current AAD or ciphertext block not hashed yet
+        self.aad_len = 0
+        self.data_len = 0
+        self.keystream = '' # holds the unused part of the last encrypted counter value
+        self.totalbytes = 0
+
+    def feed(self, data):
+        """Add additional authenticated data"""
+        if self.data_len:
+            raise Exception,"additional authenticated data must be supplied before any data is processed"
+        self.aad_len += len(data)
+        self.__hash(data)
+
+    def update(self, data, ed):
+        """Processes the given ciphertext/plaintext
+
+        Inputs:
+            data: raw string of any multiple of bytes
+            ed:   'e' for encryption, 'd' for decryption
+        Output:
+            processed raw string
+
+        The encrypt/decrypt functions will always process all of the supplied
+          input data immediately. No cache will be kept.
+        """
+        n = len(data)
+        if n == 0:
+            return ''
+        if self.data_len == 0 and self.cache:
+            # the AAD is padded with zeros to a full block
+            self.Y = _ghash(self.tables, self.Y, self.cache + '\x00'*(16 - len(self.cache)))
+            self.cache = ''
+        keystream = self.keystream
+        if n > len(keystream):
+            # encrypt all the counter blocks needed for this call in one go
+            nblocks = (n - len(keystream) + 15) // 16
+            prefix = self.prefix
+            c = self.counter
+            keystream += self.encrypt_blocks(''.join([prefix + struct.pack('>I', (c + i) & 0xffffffff) for i in xrange(1, nblocks+1)]))
+            self.counter = (c + nblocks) & 0xffffffff
+        self.keystream = keystream[n:]
+        output = strxor(data, keystream[:n])
+        # GHASH always runs over the ciphertext
+        if ed == 'e':
+            self.__hash(output)
+        else:
+            self.__hash(data)
+        self.data_len += n
+        self.totalbytes += n
+        return output
+
+    def digest(self):
+        """Authentication tag of the AAD and data processed so far, the state isn't changed"""
+        Y = self.Y
+        if self.cache:
+            Y = _ghash(self.tables, Y, self.cache + '\x00'*(16 - len(self.cache)))
+        Y = _ghash(self.tables, Y, struct.pack('>QQ', self.aad_len*8, self.data_len*8))
+        return strxor(util.number2string_N(Y, 16), self.E_J0)
+
+    def __hash(self, data):
+        data = self.cache + data
+        n = len(data) - len(data) % 16
+        if n:
+            self.Y = _ghash(self.tables, self.Y, data[:n])
+        self.cache = data[n:]
+
+class OCB:
+    """OCB Mode (OCB3, RFC 7253) with a 128-bit tag
+
+    Usable with blockciphers with a 16-byte blocksize.
+    Every full block is processed independently: the offsets of a run of
+      blocks are computed first, then all blocks are encrypted in one call.
+    """
+    def __init__(self, codebook, blocksize, nonce):
+        self.codebook = codebook
+        self.blocksize = blocksize
+        self.encrypt_blocks, self.decrypt_blocks = _crypt_blocks(codebook, blocksize)
+        # L_i table, computed once per key and extended when needed
+        self.L_star = util.string2number(codebook.encrypt('\x00'*16))
+        self.L_dollar = _double(self.L_star)
+        self.L = [_double(self.L_dollar)]
+        self.reset(nonce)
+
+    def reset(self, nonce):
+        """Start a new message with the given nonce, the L table is kept"""
+        self.cache = ''
+        self.ed = None
+        self.finished = False
+        self.nblocks = 0 # amount of full blocks processed
+        self.checksum = 0
+        self.totalbytes = 0
+        # HASH(K,A) state
+        self.aad_cache = ''
+        self.aad_blocks = 0
+        self.aad_offset = 0
+        self.aad_sum = 0
+        if nonce is not None:
+            self.offset = self.__initial_offset(nonce)
+
+    def __initial_offset(self, nonce):
+        # Nonce = num2str(TAGLEN mod 128,7) || zeros(120-bitlen(N)) || 1 || N
+        nonce = '\x00'*(15-len(nonce)) + '\x01' + nonce
+        bottom = ord(nonce[15]) & 0x3f
+        Ktop = util.string2number(self.codebook.encrypt(nonce[:15] + chr(ord(nonce[15]) & 0xc0)))
+        Stretch = Ktop << 64 | ((Ktop >> 64) ^ (Ktop >> 56)) & 0xffffffffffffffffL
+        return (Stretch >> (64 - bottom)) & 0xffffffffffffffffffffffffffffffffL
+
+    def __L_table(self, i):
+        # L_0 ... L_ntz(j) for every j <= i
+        L = self.L
+        while len(L) < i.bit_length():
+            L.append(_double(L[-1]))
+        return L
+
+    def __offsets(self, offset, start, n):
+        # Offsets of the blocks start+1 ... start+n as one string
+        #   Offset_i = Offset_{i-1} xor L_{ntz(i)}
+        L = self.__L_table(start + n)
+        words = []
+        append = words.append
+        for i in xrange(start + 1, start + n + 1):
+            offset ^= L[(i & -i).bit_length() - 1]
+            append(offset >> 64)
+            append(offset & 0xffffffffffffffffL)
+        return struct.pack('>%dQ' % len(words), *words), offset
+
+    def offset_at(self, i):
+        """Offset of full block i, computed from the current offset in O(log i)"""
+        # Offset_i = Offset_0 xor L_k for every bit k set in gray(i) = i xor (i >> 1)
+        L = self.__L_table(max(i, self.nblocks, 1))
+        g = (i ^ (i >> 1)) ^ (self.nblocks ^ (self.nblocks >> 1))
+        offset = self.offset
+        k = 0
+        while g:
+            if g & 1:
+                offset ^= L[k]
+            g >>= 1
+            k += 1
+        return offset
+
+    def crypt_blocks(self, ed, data, start, offset):
+        """Process full blocks following block number start, which has the given offset
+
+        Returns the output, the offset of the last block and the XOR of the
+          plaintext blocks.
+        """
+        offsets, offset = self.__offsets(offset, start, len(data) // 16)
+        # C_i = Offset_i xor E(P_i xor Offset_i)
+        if ed == 'e':
+            output = strxor(offsets, self.encrypt_blocks(strxor(data, offsets)))
+            return output, offset, xor_blocks(data)
+        else:
+            output = strxor(offsets, self.decrypt_blocks(strxor(data, offsets)))
+            return output, offset, xor_blocks(output)
+
+    def update(self, data, ed):
+        """Processes the given ciphertext/plaintext
+
+        Inputs:
+            data: raw string of any length
+            ed:   'e' for encryption, 'd' for decryption
+        Output:
+            processed raw string block(s), if any
 
-        m = (len(data)+blocksize-1)/blocksize #m = amount of datablocks
-        i=0
-        for i in range(1,m):
-            self.IV = self.codebook.encrypt( util.xorstring(data[(i-1)*blocksize:(i)*blocksize],self.IV) )
+        When the supplied data is not a multiple of the blocksize
+          of the cipher, then the remaining input data will be cached
+          until more data is supplied or finish() is called.
+        """
+        if self.finished:
+            raise Exception,"the OCB message has been finished already"
+        self.ed = ed
+        cache = self.cache + data
+        n = len(cache) - len(cache) % 16
+        self.cache = cache[n:]
+        if n == 0:
+            return ''
+        output, self.offset, checksum = self.crypt_blocks(ed, cache[:n], self.nblocks, self.offset)
+        self.checksum ^= checksum
+        self.nblocks += n // 16
+        self.totalbytes += n
+        return output
 
-        if len(data[(i)*blocksize:])==blocksize:
-            X = util.xorstring(util.xorstring(data[(i)*blocksize:],self.IV),self.Lu)
+    def finish(self):
+        """Process the cached partial block as the last block of the message"""
+        output, self.offset, self.checksum = self.__tail()
+        self.totalbytes += len(output)
+        self.cache = ''
+        self.finished = True
+        return output
+
+    def __tail(self):
+        # output, offset and checksum after processing the cached partial block
+        if not self.cache:
+            return '', self.offset, self.checksum
+        offset = self.offset ^ self.L_star
+        pad = self.codebook.encrypt(util.number2string_N(offset, 16))
+        output = strxor(self.cache, pad[:len(self.cache)])
+        if self.ed == 'e':
+            plaintext = self.cache
         else:
-            tmp = data[(i)*blocksize:] + '\x80' + '\x00'*(blocksize - len(data[(i)*blocksize:])-1)
-            X = util.xorstring(util.xorstring(tmp,self.IV),self.Lu2)
+            plaintext = output
+        checksum = self.checksum ^ util.string2number(plaintext + '\x80' + '\x00'*(15 - len(plaintext)))
+        return output, offset, checksum
+
+    def feed(self, data):
+        """Add additional authenticated data"""
+        cache = self.aad_cache + data
+        n = len(cache) - len(cache) % 16
+        self.aad_cache = cache[n:]
+        if n:
+            offsets, self.aad_offset = self.__offsets(self.aad_offset, self.aad_blocks, n // 16)
+            # Sum_i = Sum_{i-1} xor E(A_i xor Offset_i)
+            self.aad_sum ^= xor_blocks(self.encrypt_blocks(strxor(cache[:n], offsets)))
+            self.aad_blocks += n // 16
+
+    def digest(self):
+        """Tag of the AAD and data processed so far, the state isn't changed"""
+        aad_sum = self.aad_sum
+        if self.aad_cache:
+            padded = self.aad_cache + '\x80' + '\x00'*(15 - len(self.aad_cache))
+            offset = util.number2string_N(self.aad_offset ^ self.L_star, 16)
+            aad_sum ^= util.string2number(self.codebook.encrypt(strxor(padded, offset)))
+        output, offset, checksum = self.__tail()
+        tag = self.codebook.encrypt(util.number2string_N(checksum ^ offset ^ self.L_dollar, 16))
+        return util.number2string_N(util.string2number(tag) ^ aad_sum, 16)
+
+class PMAC(CMAC):
+    """PMAC chaining mode (PMAC1)
+
+    Supports the same blocksizes as CMAC and uses the same Rb constants.
+    The hashlength is equal to block size of the used block cipher.
+    Every block but the last one is encrypted independently and the
+      results are XORed, so blocks are processed in batches and ranges of
+      blocks can be hashed separately (see partial_sum).
+    http://www.cs.ucdavis.edu/~rogaway/ocb/pmac.htm
+    """
+    def __init__(self,codebook,blocksize,IV):
+        CMAC.__init__(self,codebook,blocksize,IV)
+        self.encrypt_blocks = _crypt_blocks(codebook, blocksize)[0]
+        # L(i) = L mul u^i, extended when needed
+        self.L_table = [self.L]
+        # L(-1) = L mul u^-1
+        if self.L & 1:
+            self.L_inv = (self.L >> 1) ^ (self.Rb >> 1) ^ (1 << (blocksize*8 - 1))
+        else:
+            self.L_inv = self.L >> 1
+        self.reset(IV)
+
+    def reset(self, IV):
+        """Start a new message, the L table is kept"""
+        CMAC.reset(self, IV)
+        self.sum = 0 # XOR of the encrypted blocks processed so far
+        self.nblocks = 0
+
+    def update(self, data, ed):
+        """Processes the given plaintext
 
-        T = self.codebook.encrypt(X)
-        return T
+        Inputs:
+            data: raw string of any length
+            ed:   'e', decryption isn't supported
+        Output:
+            hashed data as raw string
 
+        As for CMAC, every call hashes one complete message.
+        """
+        assert ed == 'e'
+        n = self.__split(data)
+        return self.tag(self.partial_sum(data[:n],0),data[n:])
+
+    def feed(self, data):
+        """Add data to the message hashed by digest()"""
+        data = self.cache + data
+        n = self.__split(data)
+        self.sum ^= self.partial_sum(data[:n],self.nblocks)
+        self.nblocks += n // self.blocksize
+        self.cache = data[n:]
+
+    def digest(self):
+        """PMAC of the data supplied to feed() so far, the state isn't changed"""
+        return self.tag(self.sum,self.cache)
+
+    def partial_sum(self, data, start):
+        """XOR of E(M_i xor offset_i) for the blocks of data, numbered from start+1
+
+        data:   raw string, a multiple of the blocksize and not holding
+                the last block of the message
+        start:  amount of message blocks before data
+        The partial sums of the ranges of a message are XORed to get the
+          sum of the whole message.
+        """
+        blocksize = self.blocksize
+        n = len(data) // blocksize
+        if n == 0:
+            return 0
+        L = self.L_table
+        while len(L) < (start + n).bit_length():
+            L.append(self.double(L[-1]))
+        # offset_i = offset_{i-1} xor L(ntz(i)), which is the XOR of L(k)
+        #   for every bit k set in gray(i) = i xor (i >> 1)
+        offset = 0
+        g = start ^ (start >> 1)
+        k = 0
+        while g:
+            if g & 1:
+                offset ^= L[k]
+            g >>= 1
+            k += 1
+        words = []
+        append = words.append
+        for i in xrange(start + 1, start + n + 1):
+            offset ^= L[(i & -i).bit_length() - 1]
+            if blocksize == 16:
+                append(offset >> 64)
+                append(offset & 0xffffffffffffffffL)
+            else:
+                append(offset)
+        offsets = struct.pack('>%dQ' % len(words), *words)
+        return xor_blocks(self.encrypt_blocks(strxor(data, offsets)), blocksize)
+
+    def __split(self, data):
+        # length of data without its last block (full or not)
+        return ((len(data)-1)//self.blocksize)*self.blocksize if data else 0
+
+    def tag(self, sum, last):
+        """PMAC of a message, given the sum of its blocks but the last one and that last block"""
+        if len(last) == self.blocksize:
+            sum ^= util.string2number(last) ^ self.L_inv
+        else:
+            sum ^= util.string2number(last + '\x80' + '\x00'*(self.blocksize - len(last) - 1))
+        return self.codebook.encrypt(util.number2string_N(sum, self.blocksize))
@@ -0,0 +1,148 @@
+"""DES and Triple DES on 32-bit integers
+
+A faster replacement for the bit list core of pyDes, used by python_DES and
+python_DES3. The two halves of the state are 32-bit integers and a round
+costs eight lookups in SP tables, which combine every S-box with the P
+permutation. IP and FP are done with byte-indexed tables, and the subkeys
+are precomputed as 6-bit groups aligned on the bytes of two words. As in
+Outerbridge's d3des, the halves are kept rotated left by one bit, which
+aligns the groups of the expansion E on bytes. The tables are generated by
+tools/gen_tables.py, see des32_tables.py.
+
+The objects only hold the subkeys, so they can be shared between threads.
+
+>>> from CryptoPlus.Cipher.des32 import des, triple_des
+>>> cipher = des('7CA110454A1A6E57'.decode('hex'))
+>>> cipher.encrypt('01A1D6D039776742'.decode('hex')).encode('hex')
+'690f5b0d9a26939b'
+>>> cipher.decrypt('690f5b0d9a26939b'.decode('hex')).encode('hex')
+'01a1d6d039776742'
+>>> cipher = triple_des('0123456789abcdef23456789abcdef01456789abcdef0123'.decode('hex'))
+>>> cipher.decrypt(cipher.encrypt('a'*24)) == 'a'*24
+True
+"""
+import struct
+
+from des32_tables import IPL, IPR, FPH, FPL, SP1, SP2, SP3, SP4, SP5, SP6, SP7, SP8, PC2C, PC2D
+
+# permuted choice 1, selecting C and D from the 64 key bits (0 being the
+#   most significant one)
+PC1 = [56, 48, 40, 32, 24, 16,  8,
+        0, 57, 49, 41, 33, 25, 17,
+        9,  1, 58, 50, 42, 34, 26,
+       18, 10,  2, 59, 51, 43, 35,
+       62, 54, 46, 38, 30, 22, 14,
+        6, 61, 53, 45, 37, 29, 21,
+       13,  5, 60, 52, 44, 36, 28,
+       20, 12,  4, 27, 19, 11,  3]
+
+# left rotations of C and D before every round
+ROTATIONS = [1, 1, 2, 2, 2, 2, 2, 2, 1, 2, 2, 2, 2, 2, 2, 1]
+
+def subkeys(key):
+    """Get the 16 subkeys of an 8 byte key
+
+    Every subkey is a pair of words holding its 6-bit groups 1, 3, 5, 7 and
+      2, 4, 6, 8 in their bytes.
+    """
+    if len(key) != 8:
+        raise ValueError("Invalid DES key size. Key must be exactly 8 bytes long.")
+    k = struct.unpack('>Q', key)[0]
+    cd = 0
+    for position in PC1:
+        cd = cd << 1 | (k >> (63 - position)) & 1
+    c, d = cd >> 28, cd & 0xFFFFFFF
+    c0, c1, c2, c3 = PC2C
+    d0, d1, d2, d3 = PC2D
+    keys = []
+    for s in ROTATIONS:
+        c = ((c << s) | (c >> (28 - s))) & 0xFFFFFFF
+        d = ((d << s) | (d >> (28 - s))) & 0xFFFFFFF
+        v = c0[c >> 21] | c1[(c >> 14) & 0x7F] | c2[(c >> 7) & 0x7F] | c3[c & 0x7F] | \
+            d0[d >> 21] | d1[(d >> 14) & 0x7F] | d2[(d >> 7) & 0x7F] | d3[d & 0x7F]
+        keys.append((v >> 32, v & 0xFFFFFFFF))
+    return keys
+
+def _schedule(keys):
+    # the 16 rounds as 8 pairs of rounds: (ka, kb) of both rounds
+    return [keys[i] + keys[i + 1] for i in xrange(0, 16, 2)]
+
+def _crypt(data, stages):
+    """Run every 8 byte block of data through the rounds of all stages
+
+    stages: list of schedules (see _schedule), one per DES operation. The FP
+      of a stage and the IP of the next one cancel out, so the state goes
+      from one stage to the next unchanged, apart from the final swap.
+    """
+    if len(data) % 8:
+        raise ValueError("Invalid data length, data must be a multiple of 8 bytes\n.")
+    ip0, ip1, ip2, ip3, ip4, ip5, ip6, ip7 = IPL
+    iq0, iq1, iq2, iq3, iq4, iq5, iq6, iq7 = IPR
+    fp0, fp1, fp2, fp3, fp4, fp5, fp6, fp7 = FPH
+    fq0, fq1, fq2, fq3, fq4, fq5, fq6, fq7 = FPL
+    sp1, sp2, sp3, sp4, sp5, sp6, sp7, sp8 = SP1, SP2, SP3, SP4, SP5, SP6, SP7, SP8
+    octets = struct.unpack('%dB' % len(data), data)
+    result = []
+    append = result.append
+    for i in xrange(0, len(octets), 8):
+        b0, b1, b2, b3, b4, b5, b6, b7 = octets[i:i + 8]
+        l = ip0[b0] | ip1[b1] | ip2[b2] | ip3[b3] | ip4[b4] | ip5[b5] | ip6[b6] | ip7[b7]
+        r = iq0[b0] | iq1[b1] | iq2[b2] | iq3[b3] | iq4[b4] | iq5[b5] | iq6[b6] | iq7[b7]
+        for schedule in stages:
+            for ka1, kb1, ka2, kb2 in schedule:
+                w = ((r << 28) | (r >> 4)) ^ ka1
+                x = r ^ kb1
+                l ^= sp7[w & 0x3F] | sp5[(w >> 8) & 0x3F] | sp3[(w >> 16) & 0x3F] | sp1[(w >> 24) & 0x3F] | \
+                     sp8[x & 0x3F] | sp6[(x >> 8) & 0x3F] | sp4[(x >> 16) & 0x3F] | sp2[(x >> 24) & 0x3F]
+                w = ((l << 28) | (l >> 4)) ^ ka2
+                x = l ^ kb2
+                r ^= sp7[w & 0x3F] | sp5[(w >> 8) & 0x3F] | sp3[(w >> 16) & 0x3F] | sp1[(w >> 24) & 0x3F] | \
+                     sp8[x & 0x3F] | sp6[(x >> 8) & 0x3F] | sp4[(x >> 16) & 0x3F] | sp2[(x >> 24) & 0x3F]
+            l, r = r, l
+        b0, b1, b2, b3 = l >> 24, (l >> 16) & 0xFF, (l >> 8) & 0xFF, l & 0xFF
+        b4, b5, b6, b7 = r >> 24, (r >> 16) & 0xFF, (r >> 8) & 0xFF, r & 0xFF
+        append(fp0[b0] | fp1[b1] | fp2[b2] | fp3[b3] | fp4[b4] | fp5[b5] | fp6[b6] | fp7[b7])
+        append(fq0[b0] | fq1[b1] | fq2[b2] | fq3[b3] | fq4[b4] | fq5[b5] | fq6[b6] | fq7[b7])
+    return struct.pack('>%dL' % len(result), *result)
+
+class des:
+    """DES on 32-bit integers
+
+    des(key): key is a string of 8 bytes
+    encrypt/decrypt work on any number of contiguous 8 byte blocks (ECB).
+    """
+    block_size = 8
+
+    def __init__(self, key):
+        keys = subkeys(key)
+        self.encryption = [_schedule(keys)]
+        self.decryption = [_schedule(keys[::-1])]
+
+    def encrypt(self, data):
+        return _crypt(data, self.encryption)
+
+    def decrypt(self, data):
+        return _crypt(data, self.decryption)
+
+    encrypt_blocks = encrypt
+    decrypt_blocks = decrypt
+
+    def get_block_size(self):
+        return 8
+
+class triple_des(des):
+    """Triple DES (EDE) on 32-bit integers
+
+    triple_des(key): key is a string of 24 bytes (DES-EDE3) or 16 bytes
+      (DES-EDE2, the third key being the first one)
+    """
+    def __init__(self, key):
+        if len(key) not in (16, 24):
+            raise ValueError("Invalid triple DES key size. Key must be either 16 or 24 bytes long")
+        k1, k2 = subkeys(key[:8]), subkeys(key[8:16])
+        k3 = k1
+        if len(key) == 24:
+            k3 = subkeys(key[16:])
+        # encrypt with k1, decrypt with k2, encrypt with k3, in one pass
+        self.encryption = [_schedule(k1), _schedule(k2[::-1]), _schedule(k3)]
+        self.decryption = [_schedule(k3[::-1]), _schedule(k2), _schedule(k1[::-1])]
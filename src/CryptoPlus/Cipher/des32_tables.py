@@ -0,0 +1,1827 @@
+# Precomputed tables of the integer DES core
+#
+# Generated by tools/gen_tables.py from the algorithmic definition,
+# do not edit.
+
+IPL = [[0x00000000, 0x00000002, 0x00000000, 0x00000002, 0x00000200, 0x00000202,
+        0x00000200, 0x00000202, 0x00000000, 0x00000002, 0x00000000, 0x00000002,
+        0x00000200, 0x00000202, 0x00000200, 0x00000202, 0x00020000, 0x00020002,
+        0x00020000, 0x00020002, 0x00020200, 0x00020202, 0x00020200, 0x00020202,
+        0x00020000, 0x00020002, 0x00020000, 0x00020002, 0x00020200, 0x00020202,
+        0x00020200, 0x00020202, 0x00000000, 0x00000002, 0x00000000, 0x00000002,
+        0x00000200, 0x00000202, 0x00000200, 0x00000202, 0x00000000, 0x00000002,
+        0x00000000, 0x00000002, 0x00000200, 0x00000202, 0x00000200, 0x00000202,
+        0x00020000, 0x00020002, 0x00020000, 0x00020002, 0x00020200, 0x00020202,
+        0x00020200, 0x00020202, 0x00020000, 0x00020002, 0x00020000, 0x00020002,
+        0x00020200, 0x00020202, 0x00020200, 0x00020202, 0x02000000, 0x02000002,
+        0x02000000, 0x02000002, 0x02000200, 0x02000202, 0x02000200, 0x02000202,
+        0x02000000, 0x02000002, 0x02000000, 0x02000002, 0x02000200, 0x02000202,
+        0x02000200, 0x02000202, 0x02020000, 0x02020002, 0x02020000, 0x02020002,
+        0x02020200, 0x02020202, 0x02020200, 0x02020202, 0x02020000, 0x02020002,
+        0x02020000, 0x02020002, 0x02020200, 0x02020202, 0x02020200, 0x02020202,
+        0x02000000, 0x02000002, 0x02000000, 0x02000002, 0x02000200, 0x02000202,
+        0x02000200, 0x02000202, 0x02000000, 0x02000002, 0x02000000, 0x02000002,
+        0x02000200, 0x02000202, 0x02000200, 0x02000202, 0x02020000, 0x02020002,
+        0x02020000, 0x02020002, 0x02020200, 0x02020202, 0x02020200, 0x02020202,
+        0x02020000, 0x02020002, 0x02020000, 0x02020002, 0x02020200, 0x02020202,
+        0x02020200, 0x02020202, 0x00000000, 0x00000002, 0x00000000, 0x00000002,
+        0x00000200, 0x00000202, 0x00000200, 0x00000202, 0x00000000, 0x00000002,
+        0x00000000, 0x00000002, 0x00000200, 0x00000202, 0x00000200, 0x00000202,
+        0x00020000, 0x00020002, 0x00020000, 0x00020002, 0x00020200, 0x00020202,
+        0x00020200, 0x00020202, 0x00020000, 0x00020002, 0x00020000, 0x00020002,
+        0x00020200, 0x00020202, 0x00020200, 0x00020202, 0x00000000, 0x00000002,
+        0x00000000, 0x00000002, 0x00000200, 0x00000202, 0x00000200, 0x00000202,
+        0x00000000, 0x00000002, 0x00000000, 0x00000002, 0x00000200, 0x00000202,
+        0x00000200, 0x00000202, 0x00020000, 0x00020002, 0x00020000, 0x00020002,
+        0x00020200, 0x00020202, 0x00020200, 0x00020202, 0x00020000, 0x00020002,
+        0x00020000, 0x00020002, 0x00020200, 0x00020202, 0x00020200, 0x00020202,
+        0x02000000, 0x02000002, 0x02000000, 0x02000002, 0x02000200, 0x02000202,
+        0x02000200, 0x02000202, 0x02000000, 0x02000002, 0x02000000, 0x02000002,
+        0x02000200, 0x02000202, 0x02000200, 0x02000202, 0x02020000, 0x02020002,
+        0x02020000, 0x02020002, 0x02020200, 0x02020202, 0x02020200, 0x02020202,
+        0x02020000, 0x02020002, 0x02020000, 0x02020002, 0x02020200, 0x02020202,
+        0x02020200, 0x02020202, 0x02000000, 0x02000002, 0x02000000, 0x02000002,
+        0x02000200, 0x02000202, 0x02000200, 0x02000202, 0x02000000, 0x02000002,
+        0x02000000, 0x02000002, 0x02000200, 0x02000202, 0x02000200, 0x02000202,
+        0x02020000, 0x02020002, 0x02020000, 0x02020002, 0x02020200, 0x02020202,
+        0x02020200, 0x02020202, 0x02020000, 0x02020002, 0x02020000, 0x02020002,
+        0x02020200, 0x02020202, 0x02020200, 0x02020202],
+       [0x00000000, 0x00000004, 0x00000000, 0x00000004, 0x00000400, 0x00000404,
+        0x00000400, 0x00000404, 0x00000000, 0x00000004, 0x00000000, 0x00000004,
+        0x00000400, 0x00000404, 0x00000400, 0x00000404, 0x00040000, 0x00040004,
+        0x00040000, 0x00040004, 0x00040400, 0x00040404, 0x00040400, 0x00040404,
+        0x00040000, 0x00040004, 0x00040000, 0x00040004, 0x00040400, 0x00040404,
+        0x00040400, 0x00040404, 0x00000000, 0x00000004, 0x00000000, 0x00000004,
+        0x00000400, 0x00000404, 0x00000400, 0x00000404, 0x00000000, 0x00000004,
+        0x00000000, 0x00000004, 0x00000400, 0x00000404, 0x00000400, 0x00000404,
+        0x00040000, 0x00040004, 0x00040000, 0x00040004, 0x00040400, 0x00040404,
+        0x00040400, 0x00040404, 0x00040000, 0x00040004, 0x00040000, 0x00040004,
+        0x00040400, 0x00040404, 0x00040400, 0x00040404, 0x04000000, 0x04000004,
+        0x04000000, 0x04000004, 0x04000400, 0x04000404, 0x04000400, 0x04000404,
+        0x04000000, 0x04000004, 0x04000000, 0x04000004, 0x04000400, 0x04000404,
+        0x04000400, 0x04000404, 0x04040000, 0x04040004, 0x04040000, 0x04040004,
+        0x04040400, 0x04040404, 0x04040400, 0x04040404, 0x04040000, 0x04040004,
+        0x04040000, 0x04040004, 0x04040400, 0x04040404, 0x04040400, 0x04040404,
+        0x04000000, 0x04000004, 0x04000000, 0x04000004, 0x04000400, 0x04000404,
+        0x04000400, 0x04000404, 0x04000000, 0x04000004, 0x04000000, 0x04000004,
+        0x04000400, 0x04000404, 0x04000400, 0x04000404, 0x04040000, 0x04040004,
+        0x04040000, 0x04040004, 0x04040400, 0x04040404, 0x04040400, 0x04040404,
+        0x04040000, 0x04040004, 0x04040000, 0x04040004, 0x04040400, 0x04040404,
+        0x04040400, 0x04040404, 0x00000000, 0x00000004, 0x00000000, 0x00000004,
+        0x00000400, 0x00000404, 0x00000400, 0x00000404, 0x00000000, 0x00000004,
+        0x00000000, 0x00000004, 0x00000400, 0x00000404, 0x00000400, 0x00000404,
+        0x00040000, 0x00040004, 0x00040000, 0x00040004, 0x00040400, 0x00040404,
+        0x00040400, 0x00040404, 0x00040000, 0x00040004, 0x00040000, 0x00040004,
+        0x00040400, 0x00040404, 0x00040400, 0x00040404, 0x00000000, 0x00000004,
+        0x00000000, 0x00000004, 0x00000400, 0x00000404, 0x00000400, 0x00000404,
+        0x00000000, 0x00000004, 0x00000000, 0x00000004, 0x00000400, 0x00000404,
+        0x00000400, 0x00000404, 0x00040000, 0x00040004, 0x00040000, 0x00040004,
+        0x00040400, 0x00040404, 0x00040400, 0x00040404, 0x00040000, 0x00040004,
+        0x00040000, 0x00040004, 0x00040400, 0x00040404, 0x00040400, 0x00040404,
+        0x04000000, 0x04000004, 0x04000000, 0x04000004, 0x04000400, 0x04000404,
+        0x04000400, 0x04000404, 0x04000000, 0x04000004, 0x04000000, 0x04000004,
+        0x04000400, 0x04000404, 0x04000400, 0x04000404, 0x04040000, 0x04040004,
+        0x04040000, 0x04040004, 0x04040400, 0x04040404, 0x04040400, 0x04040404,
+        0x04040000, 0x04040004, 0x04040000, 0x04040004, 0x04040400, 0x04040404,
+        0x04040400, 0x04040404, 0x04000000, 0x04000004, 0x04000000, 0x04000004,
+        0x04000400, 0x04000404, 0x04000400, 0x04000404, 0x04000000, 0x04000004,
+        0x04000000, 0x04000004, 0x04000400, 0x04000404, 0x04000400, 0x04000404,
+        0x04040000, 0x04040004, 0x04040000, 0x04040004, 0x04040400, 0x04040404,
+        0x04040400, 0x04040404, 0x04040000, 0x04040004, 0x04040000, 0x04040004,
+        0x04040400, 0x04040404, 0x04040400, 0x04040404],
+       [0x00000000, 0x00000008, 0x00000000, 0x00000008, 0x00000800, 0x00000808,
+        0x00000800, 0x00000808, 0x00000000, 0x00000008, 0x00000000, 0x00000008,
+        0x00000800, 0x00000808, 0x00000800, 0x00000808, 0x00080000, 0x00080008,
+        0x00080000, 0x00080008, 0x00080800, 0x00080808, 0x00080800, 0x00080808,
+        0x00080000, 0x00080008, 0x00080000, 0x00080008, 0x00080800, 0x00080808,
+        0x00080800, 0x00080808, 0x00000000, 0x00000008, 0x00000000, 0x00000008,
+        0x00000800, 0x00000808, 0x00000800, 0x00000808, 0x00000000, 0x00000008,
+        0x00000000, 0x00000008, 0x00000800, 0x00000808, 0x00000800, 0x00000808,
+        0x00080000, 0x00080008, 0x00080000, 0x00080008, 0x00080800, 0x00080808,
+        0x00080800, 0x00080808, 0x00080000, 0x00080008, 0x00080000, 0x00080008,
+        0x00080800, 0x00080808, 0x00080800, 0x00080808, 0x08000000, 0x08000008,
+        0x08000000, 0x08000008, 0x08000800, 0x08000808, 0x08000800, 0x08000808,
+        0x08000000, 0x08000008, 0x08000000, 0x08000008, 0x08000800, 0x08000808,
+        0x08000800, 0x08000808, 0x08080000, 0x08080008, 0x08080000, 0x08080008,
+        0x08080800, 0x08080808, 0x08080800, 0x08080808, 0x08080000, 0x08080008,
+        0x08080000, 0x08080008, 0x08080800, 0x08080808, 0x08080800, 0x08080808,
+        0x08000000, 0x08000008, 0x08000000, 0x08000008, 0x08000800, 0x08000808,
+        0x08000800, 0x08000808, 0x08000000, 0x08000008, 0x08000000, 0x08000008,
+        0x08000800, 0x08000808, 0x08000800, 0x08000808, 0x08080000, 0x08080008,
+        0x08080000, 0x08080008, 0x08080800, 0x08080808, 0x08080800, 0x08080808,
+        0x08080000, 0x08080008, 0x08080000, 0x08080008, 0x08080800, 0x08080808,
+        0x08080800, 0x08080808, 0x00000000, 0x00000008, 0x00000000, 0x00000008,
+        0x00000800, 0x00000808, 0x00000800, 0x00000808, 0x00000000, 0x00000008,
+        0x00000000, 0x00000008, 0x00000800, 0x00000808, 0x00000800, 0x00000808,
+        0x00080000, 0x00080008, 0x00080000, 0x00080008, 0x00080800, 0x00080808,
+        0x00080800, 0x00080808, 0x00080000, 0x00080008, 0x00080000, 0x00080008,
+        0x00080800, 0x00080808, 0x00080800, 0x00080808, 0x00000000, 0x00000008,
+        0x00000000, 0x00000008, 0x00000800, 0x00000808, 0x00000800, 0x00000808,
+        0x00000000, 0x00000008, 0x00000000, 0x00000008, 0x00000800, 0x00000808,
+        0x00000800, 0x00000808, 0x00080000, 0x00080008, 0x00080000, 0x00080008,
+        0x00080800, 0x00080808, 0x00080800, 0x00080808, 0x00080000, 0x00080008,
+        0x00080000, 0x00080008, 0x00080800, 0x00080808, 0x00080800, 0x00080808,
+        0x08000000, 0x08000008, 0x08000000, 0x08000008, 0x08000800, 0x08000808,
+        0x08000800, 0x08000808, 0x08000000, 0x08000008, 0x08000000, 0x08000008,
+        0x08000800, 0x08000808, 0x08000800, 0x08000808, 0x08080000, 0x08080008,
+        0x08080000, 0x08080008, 0x08080800, 0x08080808, 0x08080800, 0x08080808,
+        0x08080000, 0x08080008, 0x08080000, 0x08080008, 0x08080800, 0x08080808,
+        0x08080800, 0x08080808, 0x08000000, 0x08000008, 0x08000000, 0x08000008,
+        0x08000800, 0x08000808, 0x08000800, 0x08000808, 0x08000000, 0x08000008,
+        0x08000000, 0x08000008, 0x08000800, 0x08000808, 0x08000800, 0x08000808,
+        0x08080000, 0x08080008, 0x08080000, 0x08080008, 0x08080800, 0x08080808,
+        0x08080800, 0x08080808, 0x08080000, 0x08080008, 0x08080000, 0x08080008,
+        0x08080800, 0x08080808, 0x08080800, 0x08080808],
+       [0x00000000, 0x00000010, 0x00000000, 0x00000010, 0x00001000, 0x00001010,
+        0x00001000, 0x00001010, 0x00000000, 0x00000010, 0x00000000, 0x00000010,
+        0x00001000, 0x00001010, 0x00001000, 0x00001010, 0x00100000, 0x00100010,
+        0x00100000, 0x00100010, 0x00101000, 0x00101010, 0x00101000, 0x00101010,
+        0x00100000, 0x00100010, 0x00100000, 0x00100010, 0x00101000, 0x00101010,
+        0x00101000, 0x00101010, 0x00000000, 0x00000010, 0x00000000, 0x00000010,
+        0x00001000, 0x00001010, 0x00001000, 0x00001010, 0x00000000, 0x00000010,
+        0x00000000, 0x00000010, 0x00001000, 0x00001010, 0x00001000, 0x00001010,
+        0x00100000, 0x00100010, 0x00100000, 0x00100010, 0x00101000, 0x00101010,
+        0x00101000, 0x00101010, 0x00100000, 0x00100010, 0x00100000, 0x00100010,
+        0x00101000, 0x00101010, 0x00101000, 0x00101010, 0x10000000, 0x10000010,
+        0x10000000, 0x10000010, 0x10001000, 0x10001010, 0x10001000, 0x10001010,
+        0x10000000, 0x10000010, 0x10000000, 0x10000010, 0x10001000, 0x10001010,
+        0x10001000, 0x10001010, 0x10100000, 0x10100010, 0x10100000, 0x10100010,
+        0x10101000, 0x10101010, 0x10101000, 0x10101010, 0x10100000, 0x10100010,
+        0x10100000, 0x10100010, 0x10101000, 0x10101010, 0x10101000, 0x10101010,
+        0x10000000, 0x10000010, 0x10000000, 0x10000010, 0x10001000, 0x10001010,
+        0x10001000, 0x10001010, 0x10000000, 0x10000010, 0x10000000, 0x10000010,
+        0x10001000, 0x10001010, 0x10001000, 0x10001010, 0x10100000, 0x10100010,
+        0x10100000, 0x10100010, 0x10101000, 0x10101010, 0x10101000, 0x10101010,
+        0x10100000, 0x10100010, 0x10100000, 0x10100010, 0x10101000, 0x10101010,
+        0x10101000, 0x10101010, 0x00000000, 0x00000010, 0x00000000, 0x00000010,
+        0x00001000, 0x00001010, 0x00001000, 0x00001010, 0x00000000, 0x00000010,
+        0x00000000, 0x00000010, 0x00001000, 0x00001010, 0x00001000, 0x00001010,
+        0x00100000, 0x00100010, 0x00100000, 0x00100010, 0x00101000, 0x00101010,
+        0x00101000, 0x00101010, 0x00100000, 0x00100010, 0x00100000, 0x00100010,
+        0x00101000, 0x00101010, 0x00101000, 0x00101010, 0x00000000, 0x00000010,
+        0x00000000, 0x00000010, 0x00001000, 0x00001010, 0x00001000, 0x00001010,
+        0x00000000, 0x00000010, 0x00000000, 0x00000010, 0x00001000, 0x00001010,
+        0x00001000, 0x00001010, 0x00100000, 0x00100010, 0x00100000, 0x00100010,
+        0x00101000, 0x00101010, 0x00101000, 0x00101010, 0x00100000, 0x00100010,
+        0x00100000, 0x00100010, 0x00101000, 0x00101010, 0x00101000, 0x00101010,
+        0x10000000, 0x10000010, 0x10000000, 0x10000010, 0x10001000, 0x10001010,
+        0x10001000, 0x10001010, 0x10000000, 0x10000010, 0x10000000, 0x10000010,
+        0x10001000, 0x10001010, 0x10001000, 0x10001010, 0x10100000, 0x10100010,
+        0x10100000, 0x10100010, 0x10101000, 0x10101010, 0x10101000, 0x10101010,
+        0x10100000, 0x10100010, 0x10100000, 0x10100010, 0x10101000, 0x10101010,
+        0x10101000, 0x10101010, 0x10000000, 0x10000010, 0x10000000, 0x10000010,
+        0x10001000, 0x10001010, 0x10001000, 0x10001010, 0x10000000, 0x10000010,
+        0x10000000, 0x10000010, 0x10001000, 0x10001010, 0x10001000, 0x10001010,
+        0x10100000, 0x10100010, 0x10100000, 0x10100010, 0x10101000, 0x10101010,
+        0x10101000, 0x10101010, 0x10100000, 0x10100010, 0x10100000, 0x10100010,
+        0x10101000, 0x10101010, 0x10101000, 0x10101010],
+       [0x00000000, 0x00000020, 0x00000000, 0x00000020, 0x00002000, 0x00002020,
+        0x00002000, 0x00002020, 0x00000000, 0x00000020, 0x00000000, 0x00000020,
+        0x00002000, 0x00002020, 0x00002000, 0x00002020, 0x00200000, 0x00200020,
+        0x00200000, 0x00200020, 0x00202000, 0x00202020, 0x00202000, 0x00202020,
+        0x00200000, 0x00200020, 0x00200000, 0x00200020, 0x00202000, 0x00202020,
+        0x00202000, 0x00202020, 0x00000000, 0x00000020, 0x00000000, 0x00000020,
+        0x00002000, 0x00002020, 0x00002000, 0x00002020, 0x00000000, 0x00000020,
+        0x00000000, 0x00000020, 0x00002000, 0x00002020, 0x00002000, 0x00002020,
+        0x00200000, 0x00200020, 0x00200000, 0x00200020, 0x00202000, 0x00202020,
+        0x00202000, 0x00202020, 0x00200000, 0x00200020, 0x00200000, 0x00200020,
+        0x00202000, 0x00202020, 0x00202000, 0x00202020, 0x20000000, 0x20000020,
+        0x20000000, 0x20000020, 0x20002000, 0x20002020, 0x20002000, 0x20002020,
+        0x20000000, 0x20000020, 0x20000000, 0x20000020, 0x20002000, 0x20002020,
+        0x20002000, 0x20002020, 0x20200000, 0x20200020, 0x20200000, 0x20200020,
+        0x20202000, 0x20202020, 0x20202000, 0x20202020, 0x20200000, 0x20200020,
+        0x20200000, 0x20200020, 0x20202000, 0x20202020, 0x20202000, 0x20202020,
+        0x20000000, 0x20000020, 0x20000000, 0x20000020, 0x20002000, 0x20002020,
+        0x20002000, 0x20002020, 0x20000000, 0x20000020, 0x20000000, 0x20000020,
+        0x20002000, 0x20002020, 0x20002000, 0x20002020, 0x20200000, 0x20200020,
+        0x20200000, 0x20200020, 0x20202000, 0x20202020, 0x20202000, 0x20202020,
+        0x20200000, 0x20200020, 0x20200000, 0x20200020, 0x20202000, 0x20202020,
+        0x20202000, 0x20202020, 0x00000000, 0x00000020, 0x00000000, 0x00000020,
+        0x00002000, 0x00002020, 0x00002000, 0x00002020, 0x00000000, 0x00000020,
+        0x00000000, 0x00000020, 0x00002000, 0x00002020, 0x00002000, 0x00002020,
+        0x00200000, 0x00200020, 0x00200000, 0x00200020, 0x00202000, 0x00202020,
+        0x00202000, 0x00202020, 0x00200000, 0x00200020, 0x00200000, 0x00200020,
+        0x00202000, 0x00202020, 0x00202000, 0x00202020, 0x00000000, 0x00000020,
+        0x00000000, 0x00000020, 0x00002000, 0x00002020, 0x00002000, 0x00002020,
+        0x00000000, 0x00000020, 0x00000000, 0x00000020, 0x00002000, 0x00002020,
+        0x00002000, 0x00002020, 0x00200000, 0x00200020, 0x00200000, 0x00200020,
+        0x00202000, 0x00202020, 0x00202000, 0x00202020, 0x00200000, 0x00200020,
+        0x00200000, 0x00200020, 0x00202000, 0x00202020, 0x00202000, 0x00202020,
+        0x20000000, 0x20000020, 0x20000000, 0x20000020, 0x20002000, 0x20002020,
+        0x20002000, 0x20002020, 0x20000000, 0x20000020, 0x20000000, 0x20000020,
+        0x20002000, 0x20002020, 0x20002000, 0x20002020, 0x20200000, 0x20200020,
+        0x20200000, 0x20200020, 0x20202000, 0x20202020, 0x20202000, 0x20202020,
+        0x20200000, 0x20200020, 0x20200000, 0x20200020, 0x20202000, 0x20202020,
+        0x20202000, 0x20202020, 0x20000000, 0x20000020, 0x20000000, 0x20000020,
+        0x20002000, 0x20002020, 0x20002000, 0x20002020, 0x20000000, 0x20000020,
+        0x20000000, 0x20000020, 0x20002000, 0x20002020, 0x20002000, 0x20002020,
+        0x20200000, 0x20200020, 0x20200000, 0x20200020, 0x20202000, 0x20202020,
+        0x20202000, 0x20202020, 0x20200000, 0x20200020, 0x20200000, 0x20200020,
+        0x20202000, 0x20202020, 0x20202000, 0x20202020],
+       [0x00000000, 0x00000040, 0x00000000, 0x00000040, 0x00004000, 0x00004040,
+        0x00004000, 0x00004040, 0x00000000, 0x00000040, 0x00000000, 0x00000040,
+        0x00004000, 0x00004040, 0x00004000, 0x00004040, 0x00400000, 0x00400040,
+        0x00400000, 0x00400040, 0x00404000, 0x00404040, 0x00404000, 0x00404040,
+        0x00400000, 0x00400040, 0x00400000, 0x00400040, 0x00404000, 0x00404040,
+        0x00404000, 0x00404040, 0x00000000, 0x00000040, 0x00000000, 0x00000040,
+        0x00004000, 0x00004040, 0x00004000, 0x00004040, 0x00000000, 0x00000040,
+        0x00000000, 0x00000040, 0x00004000, 0x00004040, 0x00004000, 0x00004040,
+        0x00400000, 0x00400040, 0x00400000, 0x00400040, 0x00404000, 0x00404040,
+        0x00404000, 0x00404040, 0x00400000, 0x00400040, 0x00400000, 0x00400040,
+        0x00404000, 0x00404040, 0x00404000, 0x00404040, 0x40000000, 0x40000040,
+        0x40000000, 0x40000040, 0x40004000, 0x40004040, 0x40004000, 0x40004040,
+        0x40000000, 0x40000040, 0x40000000, 0x40000040, 0x40004000, 0x40004040,
+        0x40004000, 0x40004040, 0x40400000, 0x40400040, 0x40400000, 0x40400040,
+        0x40404000, 0x40404040, 0x40404000, 0x40404040, 0x40400000, 0x40400040,
+        0x40400000, 0x40400040, 0x40404000, 0x40404040, 0x40404000, 0x40404040,
+        0x40000000, 0x40000040, 0x40000000, 0x40000040, 0x40004000, 0x40004040,
+        0x40004000, 0x40004040, 0x40000000, 0x40000040, 0x40000000, 0x40000040,
+        0x40004000, 0x40004040, 0x40004000, 0x40004040, 0x40400000, 0x40400040,
+        0x40400000, 0x40400040, 0x40404000, 0x40404040, 0x40404000, 0x40404040,
+        0x40400000, 0x40400040, 0x40400000, 0x40400040, 0x40404000, 0x40404040,
+        0x40404000, 0x40404040, 0x00000000, 0x00000040, 0x00000000, 0x00000040,
+        0x00004000, 0x00004040, 0x00004000, 0x00004040, 0x00000000, 0x00000040,
+        0x00000000, 0x00000040, 0x00004000, 0x00004040, 0x00004000, 0x00004040,
+        0x00400000, 0x00400040, 0x00400000, 0x00400040, 0x00404000, 0x00404040,
+        0x00404000, 0x00404040, 0x00400000, 0x00400040, 0x00400000, 0x00400040,
+        0x00404000, 0x00404040, 0x00404000, 0x00404040, 0x00000000, 0x00000040,
+        0x00000000, 0x00000040, 0x00004000, 0x00004040, 0x00004000, 0x00004040,
+        0x00000000, 0x00000040, 0x00000000, 0x00000040, 0x00004000, 0x00004040,
+        0x00004000, 0x00004040, 0x00400000, 0x00400040, 0x00400000, 0x00400040,
+        0x00404000, 0x00404040, 0x00404000, 0x00404040, 0x00400000, 0x00400040,
+        0x00400000, 0x00400040, 0x00404000, 0x00404040, 0x00404000, 0x00404040,
+        0x40000000, 0x40000040, 0x40000000, 0x40000040, 0x40004000, 0x40004040,
+        0x40004000, 0x40004040, 0x40000000, 0x40000040, 0x40000000, 0x40000040,
+        0x40004000, 0x40004040, 0x40004000, 0x40004040, 0x40400000, 0x40400040,
+        0x40400000, 0x40400040, 0x40404000, 0x40404040, 0x40404000, 0x40404040,
+        0x40400000, 0x40400040, 0x40400000, 0x40400040, 0x40404000, 0x40404040,
+        0x40404000, 0x40404040, 0x40000000, 0x40000040, 0x40000000, 0x40000040,
+        0x40004000, 0x40004040, 0x40004000, 0x40004040, 0x40000000, 0x40000040,
+        0x40000000, 0x40000040, 0x40004000, 0x40004040, 0x40004000, 0x40004040,
+        0x40400000, 0x40400040, 0x40400000, 0x40400040, 0x40404000, 0x40404040,
+        0x40404000, 0x40404040, 0x40400000, 0x40400040, 0x40400000, 0x40400040,
+        0x40404000, 0x40404040, 0x40404000, 0x40404040],
+       [0x00000000, 0x00000080, 0x00000000, 0x00000080, 0x00008000, 0x00008080,
+        0x00008000, 0x00008080, 0x00000000, 0x00000080, 0x00000000, 0x00000080,
+        0x00008000, 0x00008080, 0x00008000, 0x00008080, 0x00800000, 0x00800080,
+        0x00800000, 0x00800080, 0x00808000, 0x00808080, 0x00808000, 0x00808080,
+        0x00800000, 0x00800080, 0x00800000, 0x00800080, 0x00808000, 0x00808080,
+        0x00808000, 0x00808080, 0x00000000, 0x00000080, 0x00000000, 0x00000080,
+        0x00008000, 0x00008080, 0x00008000, 0x00008080, 0x00000000, 0x00000080,
+        0x00000000, 0x00000080, 0x00008000, 0x00008080, 0x00008000, 0x00008080,
+        0x00800000, 0x00800080, 0x00800000, 0x00800080, 0x00808000, 0x00808080,
+        0x00808000, 0x00808080, 0x00800000, 0x00800080, 0x00800000, 0x00800080,
+        0x00808000, 0x00808080, 0x00808000, 0x00808080, 0x80000000, 0x80000080,
+        0x80000000, 0x80000080, 0x80008000, 0x80008080, 0x80008000, 0x80008080,
+        0x80000000, 0x80000080, 0x80000000, 0x80000080, 0x80008000, 0x80008080,
+        0x80008000, 0x80008080, 0x80800000, 0x80800080, 0x80800000, 0x80800080,
+        0x80808000, 0x80808080, 0x80808000, 0x80808080, 0x80800000, 0x80800080,
+        0x80800000, 0x80800080, 0x80808000, 0x80808080, 0x80808000, 0x80808080,
+        0x80000000, 0x80000080, 0x80000000, 0x80000080, 0x80008000, 0x80008080,
+        0x80008000, 0x80008080, 0x80000000, 0x80000080, 0x80000000, 0x80000080,
+        0x80008000, 0x80008080, 0x80008000, 0x80008080, 0x80800000, 0x80800080,
+        0x80800000, 0x80800080, 0x80808000, 0x80808080, 0x80808000, 0x80808080,
+        0x80800000, 0x80800080, 0x80800000, 0x80800080, 0x80808000, 0x80808080,
+        0x80808000, 0x80808080, 0x00000000, 0x00000080, 0x00000000, 0x00000080,
+        0x00008000, 0x00008080, 0x00008000, 0x00008080, 0x00000000, 0x00000080,
+        0x00000000, 0x00000080, 0x00008000, 0x00008080, 0x00008000, 0x00008080,
+        0x00800000, 0x00800080, 0x00800000, 0x00800080, 0x00808000, 0x00808080,
+        0x00808000, 0x00808080, 0x00800000, 0x00800080, 0x00800000, 0x00800080,
+        0x00808000, 0x00808080, 0x00808000, 0x00808080, 0x00000000, 0x00000080,
+        0x00000000, 0x00000080, 0x00008000, 0x00008080, 0x00008000, 0x00008080,
+        0x00000000, 0x00000080, 0x00000000, 0x00000080, 0x00008000, 0x00008080,
+        0x00008000, 0x00008080, 0x00800000, 0x00800080, 0x00800000, 0x00800080,
+        0x00808000, 0x00808080, 0x00808000, 0x00808080, 0x00800000, 0x00800080,
+        0x00800000, 0x00800080, 0x00808000, 0x00808080, 0x00808000, 0x00808080,
+        0x80000000, 0x80000080, 0x80000000, 0x80000080, 0x80008000, 0x80008080,
+        0x80008000, 0x80008080, 0x80000000, 0x80000080, 0x80000000, 0x80000080,
+        0x80008000, 0x80008080, 0x80008000, 0x80008080, 0x80800000, 0x80800080,
+        0x80800000, 0x80800080, 0x80808000, 0x80808080, 0x80808000, 0x80808080,
+        0x80800000, 0x80800080, 0x80800000, 0x80800080, 0x80808000, 0x80808080,
+        0x80808000, 0x80808080, 0x80000000, 0x80000080, 0x80000000, 0x80000080,
+        0x80008000, 0x80008080, 0x80008000, 0x80008080, 0x80000000, 0x80000080,
+        0x80000000, 0x80000080, 0x80008000, 0x80008080, 0x80008000, 0x80008080,
+        0x80800000, 0x80800080, 0x80800000, 0x80800080, 0x80808000, 0x80808080,
+        0x80808000, 0x80808080, 0x80800000, 0x80800080, 0x80800000, 0x80800080,
+        0x80808000, 0x80808080, 0x80808000, 0x80808080],
+       [0x00000000, 0x00000100, 0x00000000, 0x00000100, 0x00010000, 0x00010100,
+        0x00010000, 0x00010100, 0x00000000, 0x00000100, 0x00000000, 0x00000100,
+        0x00010000, 0x00010100, 0x00010000, 0x00010100, 0x01000000, 0x01000100,
+        0x01000000, 0x01000100, 0x01010000, 0x01010100, 0x01010000, 0x01010100,
+        0x01000000, 0x01000100, 0x01000000, 0x01000100, 0x01010000, 0x01010100,
+        0x01010000, 0x01010100, 0x00000000, 0x00000100, 0x00000000, 0x00000100,
+        0x00010000, 0x00010100, 0x00010000, 0x00010100, 0x00000000, 0x00000100,
+        0x00000000, 0x00000100, 0x00010000, 0x00010100, 0x00010000, 0x00010100,
+        0x01000000, 0x01000100, 0x01000000, 0x01000100, 0x01010000, 0x01010100,
+        0x01010000, 0x01010100, 0x01000000, 0x01000100, 0x01000000, 0x01000100,
+        0x01010000, 0x01010100, 0x01010000, 0x01010100, 0x00000001, 0x00000101,
+        0x00000001, 0x00000101, 0x00010001, 0x00010101, 0x00010001, 0x00010101,
+        0x00000001, 0x00000101, 0x00000001, 0x00000101, 0x00010001, 0x00010101,
+        0x00010001, 0x00010101, 0x01000001, 0x01000101, 0x01000001, 0x01000101,
+        0x01010001, 0x01010101, 0x01010001, 0x01010101, 0x01000001, 0x01000101,
+        0x01000001, 0x01000101, 0x01010001, 0x01010101, 0x01010001, 0x01010101,
+        0x00000001, 0x00000101, 0x00000001, 0x00000101, 0x00010001, 0x00010101,
+        0x00010001, 0x00010101, 0x00000001, 0x00000101, 0x00000001, 0x00000101,
+        0x00010001, 0x00010101, 0x00010001, 0x00010101, 0x01000001, 0x01000101,
+        0x01000001, 0x01000101, 0x01010001, 0x01010101, 0x01010001, 0x01010101,
+        0x01000001, 0x01000101, 0x01000001, 0x01000101, 0x01010001, 0x01010101,
+        0x01010001, 0x01010101, 0x00000000, 0x00000100, 0x00000000, 0x00000100,
+        0x00010000, 0x00010100, 0x00010000, 0x00010100, 0x00000000, 0x00000100,
+        0x00000000, 0x00000100, 0x00010000, 0x00010100, 0x00010000, 0x00010100,
+        0x01000000, 0x01000100, 0x01000000, 0x01000100, 0x01010000, 0x01010100,
+        0x01010000, 0x01010100, 0x01000000, 0x01000100, 0x01000000, 0x01000100,
+        0x01010000, 0x01010100, 0x01010000, 0x01010100, 0x00000000, 0x00000100,
+        0x00000000, 0x00000100, 0x00010000, 0x00010100, 0x00010000, 0x00010100,
+        0x00000000, 0x00000100, 0x00000000, 0x00000100, 0x00010000, 0x00010100,
+        0x00010000, 0x00010100, 0x01000000, 0x01000100, 0x01000000, 0x01000100,
+        0x01010000, 0x01010100, 0x01010000, 0x01010100, 0x01000000, 0x01000100,
+        0x01000000, 0x01000100, 0x01010000, 0x01010100, 0x01010000, 0x01010100,
+        0x00000001, 0x00000101, 0x00000001, 0x00000101, 0x00010001, 0x00010101,
+        0x00010001, 0x00010101, 0x00000001, 0x00000101, 0x00000001, 0x00000101,
+        0x00010001, 0x00010101, 0x00010001, 0x00010101, 0x01000001, 0x01000101,
+        0x01000001, 0x01000101, 0x01010001, 0x01010101, 0x01010001, 0x01010101,
+        0x01000001, 0x01000101, 0x01000001, 0x01000101, 0x01010001, 0x01010101,
+        0x01010001, 0x01010101, 0x00000001, 0x00000101, 0x00000001, 0x00000101,
+        0x00010001, 0x00010101, 0x00010001, 0x00010101, 0x00000001, 0x00000101,
+        0x00000001, 0x00000101, 0x00010001, 0x00010101, 0x00010001, 0x00010101,
+        0x01000001, 0x01000101, 0x01000001, 0x01000101, 0x01010001, 0x01010101,
+        0x01010001, 0x01010101, 0x01000001, 0x01000101, 0x01000001, 0x01000101,
+        0x01010001, 0x01010101, 0x01010001, 0x01010101]]
+
+IPR = [[0x00000000, 0x00000000, 0x00000002, 0x00000002, 0x00000000, 0x00000000,
+        0x00000002, 0x00000002, 0x00000200, 0x00000200, 0x00000202, 0x00000202,
+        0x00000200, 0x00000200, 0x00000202, 0x00000202, 0x00000000, 0x00000000,
+        0x00000002, 0x00000002, 0x00000000, 0x00000000, 0x00000002, 0x00000002,
+        0x00000200, 0x00000200, 0x00000202, 0x00000202, 0x00000200, 0x00000200,
+        0x00000202, 0x00000202, 0x00020000, 0x00020000, 0x00020002, 0x00020002,
+        0x00020000, 0x00020000, 0x00020002, 0x00020002, 0x00020200, 0x00020200,
+        0x00020202, 0x00020202, 0x00020200, 0x00020200, 0x00020202, 0x00020202,
+        0x00020000, 0x00020000, 0x00020002, 0x00020002, 0x00020000, 0x00020000,
+        0x00020002, 0x00020002, 0x00020200, 0x00020200, 0x00020202, 0x00020202,
+        0x00020200, 0x00020200, 0x00020202, 0x00020202, 0x00000000, 0x00000000,
+        0x00000002, 0x00000002, 0x00000000, 0x00000000, 0x00000002, 0x00000002,
+        0x00000200, 0x00000200, 0x00000202, 0x00000202, 0x00000200, 0x00000200,
+        0x00000202, 0x00000202, 0x00000000, 0x00000000, 0x00000002, 0x00000002,
+        0x00000000, 0x00000000, 0x00000002, 0x00000002, 0x00000200, 0x00000200,
+        0x00000202, 0x00000202, 0x00000200, 0x00000200, 0x00000202, 0x00000202,
+        0x00020000, 0x00020000, 0x00020002, 0x00020002, 0x00020000, 0x00020000,
+        0x00020002, 0x00020002, 0x00020200, 0x00020200, 0x00020202, 0x00020202,
+        0x00020200, 0x00020200, 0x00020202, 0x00020202, 0x00020000, 0x00020000,
+        0x00020002, 0x00020002, 0x00020000, 0x00020000, 0x00020002, 0x00020002,
+        0x00020200, 0x00020200, 0x00020202, 0x00020202, 0x00020200, 0x00020200,
+        0x00020202, 0x00020202, 0x02000000, 0x02000000, 0x02000002, 0x02000002,
+        0x02000000, 0x02000000, 0x02000002, 0x02000002, 0x02000200, 0x02000200,
+        0x02000202, 0x02000202, 0x02000200, 0x02000200, 0x02000202, 0x02000202,
+        0x02000000, 0x02000000, 0x02000002, 0x02000002, 0x02000000, 0x02000000,
+        0x02000002, 0x02000002, 0x02000200, 0x02000200, 0x02000202, 0x02000202,
+        0x02000200, 0x02000200, 0x02000202, 0x02000202, 0x02020000, 0x02020000,
+        0x02020002, 0x02020002, 0x02020000, 0x02020000, 0x02020002, 0x02020002,
+        0x02020200, 0x02020200, 0x02020202, 0x02020202, 0x02020200, 0x02020200,
+        0x02020202, 0x02020202, 0x02020000, 0x02020000, 0x02020002, 0x02020002,
+        0x02020000, 0x02020000, 0x02020002, 0x02020002, 0x02020200, 0x02020200,
+        0x02020202, 0x02020202, 0x02020200, 0x02020200, 0x02020202, 0x02020202,
+        0x02000000, 0x02000000, 0x02000002, 0x02000002, 0x02000000, 0x02000000,
+        0x02000002, 0x02000002, 0x02000200, 0x02000200, 0x02000202, 0x02000202,
+        0x02000200, 0x02000200, 0x02000202, 0x02000202, 0x02000000, 0x02000000,
+        0x02000002, 0x02000002, 0x02000000, 0x02000000, 0x02000002, 0x02000002,
+        0x02000200, 0x02000200, 0x02000202, 0x02000202, 0x02000200, 0x02000200,
+        0x02000202, 0x02000202, 0x02020000, 0x02020000, 0x02020002, 0x02020002,
+        0x02020000, 0x02020000, 0x02020002, 0x02020002, 0x02020200, 0x02020200,
+        0x02020202, 0x02020202, 0x02020200, 0x02020200, 0x02020202, 0x02020202,
+        0x02020000, 0x02020000, 0x02020002, 0x02020002, 0x02020000, 0x02020000,
+        0x02020002, 0x02020002, 0x02020200, 0x02020200, 0x02020202, 0x02020202,
+        0x02020200, 0x02020200, 0x02020202, 0x02020202],
+       [0x00000000, 0x00000000, 0x00000004, 0x00000004, 0x00000000, 0x00000000,
+        0x00000004, 0x00000004, 0x00000400, 0x00000400, 0x00000404, 0x00000404,
+        0x00000400, 0x00000400, 0x00000404, 0x00000404, 0x00000000, 0x00000000,
+        0x00000004, 0x00000004, 0x00000000, 0x00000000, 0x00000004, 0x00000004,
+        0x00000400, 0x00000400, 0x00000404, 0x00000404, 0x00000400, 0x00000400,
+        0x00000404, 0x00000404, 0x00040000, 0x00040000, 0x00040004, 0x00040004,
+        0x00040000, 0x00040000, 0x00040004, 0x00040004, 0x00040400, 0x00040400,
+        0x00040404, 0x00040404, 0x00040400, 0x00040400, 0x00040404, 0x00040404,
+        0x00040000, 0x00040000, 0x00040004, 0x00040004, 0x00040000, 0x00040000,
+        0x00040004, 0x00040004, 0x00040400, 0x00040400, 0x00040404, 0x00040404,
+        0x00040400, 0x00040400, 0x00040404, 0x00040404, 0x00000000, 0x00000000,
+        0x00000004, 0x00000004, 0x00000000, 0x00000000, 0x00000004, 0x00000004,
+        0x00000400, 0x00000400, 0x00000404, 0x00000404, 0x00000400, 0x00000400,
+        0x00000404, 0x00000404, 0x00000000, 0x00000000, 0x00000004, 0x00000004,
+        0x00000000, 0x00000000, 0x00000004, 0x00000004, 0x00000400, 0x00000400,
+        0x00000404, 0x00000404, 0x00000400, 0x00000400, 0x00000404, 0x00000404,
+        0x00040000, 0x00040000, 0x00040004, 0x00040004, 0x00040000, 0x00040000,
+        0x00040004, 0x00040004, 0x00040400, 0x00040400, 0x00040404, 0x00040404,
+        0x00040400, 0x00040400, 0x00040404, 0x00040404, 0x00040000, 0x00040000,
+        0x00040004, 0x00040004, 0x00040000, 0x00040000, 0x00040004, 0x00040004,
+        0x00040400, 0x00040400, 0x00040404, 0x00040404, 0x00040400, 0x00040400,
+        0x00040404, 0x00040404, 0x04000000, 0x04000000, 0x04000004, 0x04000004,
+        0x04000000, 0x04000000, 0x04000004, 0x04000004, 0x04000400, 0x04000400,
+        0x04000404, 0x04000404, 0x04000400, 0x04000400, 0x04000404, 0x04000404,
+        0x04000000, 0x04000000, 0x04000004, 0x04000004, 0x04000000, 0x04000000,
+        0x04000004, 0x04000004, 0x04000400, 0x04000400, 0x04000404, 0x04000404,
+        0x04000400, 0x04000400, 0x04000404, 0x04000404, 0x04040000, 0x04040000,
+        0x04040004, 0x04040004, 0x04040000, 0x04040000, 0x04040004, 0x04040004,
+        0x04040400, 0x04040400, 0x04040404, 0x04040404, 0x04040400, 0x04040400,
+        0x04040404, 0x04040404, 0x04040000, 0x04040000, 0x04040004, 0x04040004,
+        0x04040000, 0x04040000, 0x04040004, 0x04040004, 0x04040400, 0x04040400,
+        0x04040404, 0x04040404, 0x04040400, 0x04040400, 0x04040404, 0x04040404,
+        0x04000000, 0x04000000, 0x04000004, 0x04000004, 0x04000000, 0x04000000,
+        0x04000004, 0x04000004, 0x04000400, 0x04000400, 0x04000404, 0x04000404,
+        0x04000400, 0x04000400, 0x04000404, 0x04000404, 0x04000000, 0x04000000,
+        0x04000004, 0x04000004, 0x04000000, 0x04000000, 0x04000004, 0x04000004,
+        0x04000400, 0x04000400, 0x04000404, 0x04000404, 0x04000400, 0x04000400,
+        0x04000404, 0x04000404, 0x04040000, 0x04040000, 0x04040004, 0x04040004,
+        0x04040000, 0x04040000, 0x04040004, 0x04040004, 0x04040400, 0x04040400,
+        0x04040404, 0x04040404, 0x04040400, 0x04040400, 0x04040404, 0x04040404,
+        0x04040000, 0x04040000, 0x04040004, 0x04040004, 0x04040000, 0x04040000,
+        0x04040004, 0x04040004, 0x04040400, 0x04040400, 0x04040404, 0x04040404,
+        0x04040400, 0x04040400, 0x04040404, 0x04040404],
+       [0x00000000, 0x00000000, 0x00000008, 0x00000008, 0x00000000, 0x00000000,
+        0x00000008, 0x00000008, 0x00000800, 0x00000800, 0x00000808, 0x00000808,
+        0x00000800, 0x00000800, 0x00000808, 0x00000808, 0x00000000, 0x00000000,
+        0x00000008, 0x00000008, 0x00000000, 0x00000000, 0x00000008, 0x00000008,
+        0x00000800, 0x00000800, 0x00000808, 0x00000808, 0x00000800, 0x00000800,
+        0x00000808, 0x00000808, 0x00080000, 0x00080000, 0x00080008, 0x00080008,
+        0x00080000, 0x00080000, 0x00080008, 0x00080008, 0x00080800, 0x00080800,
+        0x00080808, 0x00080808, 0x00080800, 0x00080800, 0x00080808, 0x00080808,
+        0x00080000, 0x00080000, 0x00080008, 0x00080008, 0x00080000, 0x00080000,
+        0x00080008, 0x00080008, 0x00080800, 0x00080800, 0x00080808, 0x00080808,
+        0x00080800, 0x00080800, 0x00080808, 0x00080808, 0x00000000, 0x00000000,
+        0x00000008, 0x00000008, 0x00000000, 0x00000000, 0x00000008, 0x00000008,
+        0x00000800, 0x00000800, 0x00000808, 0x00000808, 0x00000800, 0x00000800,
+        0x00000808, 0x00000808, 0x00000000, 0x00000000, 0x00000008, 0x00000008,
+        0x00000000, 0x00000000, 0x00000008, 0x00000008, 0x00000800, 0x00000800,
+        0x00000808, 0x00000808, 0x00000800, 0x00000800, 0x00000808, 0x00000808,
+        0x00080000, 0x00080000, 0x00080008, 0x00080008, 0x00080000, 0x00080000,
+        0x00080008, 0x00080008, 0x00080800, 0x00080800, 0x00080808, 0x00080808,
+        0x00080800, 0x00080800, 0x00080808, 0x00080808, 0x00080000, 0x00080000,
+        0x00080008, 0x00080008, 0x00080000, 0x00080000, 0x00080008, 0x00080008,
+        0x00080800, 0x00080800, 0x00080808, 0x00080808, 0x00080800, 0x00080800,
+        0x00080808, 0x00080808, 0x08000000, 0x08000000, 0x08000008, 0x08000008,
+        0x08000000, 0x08000000, 0x08000008, 0x08000008, 0x08000800, 0x08000800,
+        0x08000808, 0x08000808, 0x08000800, 0x08000800, 0x08000808, 0x08000808,
+        0x08000000, 0x08000000, 0x08000008, 0x08000008, 0x08000000, 0x08000000,
+        0x08000008, 0x08000008, 0x08000800, 0x08000800, 0x08000808, 0x08000808,
+        0x08000800, 0x08000800, 0x08000808, 0x08000808, 0x08080000, 0x08080000,
+        0x08080008, 0x08080008, 0x08080000, 0x08080000, 0x08080008, 0x08080008,
+        0x08080800, 0x08080800, 0x08080808, 0x08080808, 0x08080800, 0x08080800,
+        0x08080808, 0x08080808, 0x08080000, 0x08080000, 0x08080008, 0x08080008,
+        0x08080000, 0x08080000, 0x08080008, 0x08080008, 0x08080800, 0x08080800,
+        0x08080808, 0x08080808, 0x08080800, 0x08080800, 0x08080808, 0x08080808,
+        0x08000000, 0x08000000, 0x08000008, 0x08000008, 0x08000000, 0x08000000,
+        0x08000008, 0x08000008, 0x08000800, 0x08000800, 0x08000808, 0x08000808,
+        0x08000800, 0x08000800, 0x08000808, 0x08000808, 0x08000000, 0x08000000,
+        0x08000008, 0x08000008, 0x08000000, 0x08000000, 0x08000008, 0x08000008,
+        0x08000800, 0x08000800, 0x08000808, 0x08000808, 0x08000800, 0x08000800,
+        0x08000808, 0x08000808, 0x08080000, 0x08080000, 0x08080008, 0x08080008,
+        0x08080000, 0x08080000, 0x08080008, 0x08080008, 0x08080800, 0x08080800,
+        0x08080808, 0x08080808, 0x08080800, 0x08080800, 0x08080808, 0x08080808,
+        0x08080000, 0x08080000, 0x08080008, 0x08080008, 0x08080000, 0x08080000,
+        0x08080008, 0x08080008, 0x08080800, 0x08080800, 0x08080808, 0x08080808,
+        0x08080800, 0x08080800, 0x08080808, 0x08080808],
+       [0x00000000, 0x00000000, 0x00000010, 0x00000010, 0x00000000, 0x00000000,
+        0x00000010, 0x00000010, 0x00001000, 0x00001000, 0x00001010, 0x00001010,
+        0x00001000, 0x00001000, 0x00001010, 0x00001010, 0x00000000, 0x00000000,
+        0x00000010, 0x00000010, 0x00000000, 0x00000000, 0x00000010, 0x00000010,
+        0x00001000, 0x00001000, 0x00001010, 0x00001010, 0x00001000, 0x00001000,
+        0x00001010, 0x00001010, 0x00100000, 0x00100000, 0x00100010, 0x00100010,
+        0x00100000, 0x00100000, 0x00100010, 0x00100010, 0x00101000, 0x00101000,
+        0x00101010, 0x00101010, 0x00101000, 0x00101000, 0x00101010, 0x00101010,
+        0x00100000, 0x00100000, 0x00100010, 0x00100010, 0x00100000, 0x00100000,
+        0x00100010, 0x00100010, 0x00101000, 0x00101000, 0x00101010, 0x00101010,
+        0x00101000, 0x00101000, 0x00101010, 0x00101010, 0x00000000, 0x00000000,
+        0x00000010, 0x00000010, 0x00000000, 0x00000000, 0x00000010, 0x00000010,
+        0x00001000, 0x00001000, 0x00001010, 0x00001010, 0x00001000, 0x00001000,
+        0x00001010, 0x00001010, 0x00000000, 0x00000000, 0x00000010, 0x00000010,
+        0x00000000, 0x00000000, 0x00000010, 0x00000010, 0x00001000, 0x00001000,
+        0x00001010, 0x00001010, 0x00001000, 0x00001000, 0x00001010, 0x00001010,
+        0x00100000, 0x00100000, 0x00100010, 0x00100010, 0x00100000, 0x00100000,
+        0x00100010, 0x00100010, 0x00101000, 0x00101000, 0x00101010, 0x00101010,
+        0x00101000, 0x00101000, 0x00101010, 0x00101010, 0x00100000, 0x00100000,
+        0x00100010, 0x00100010, 0x00100000, 0x00100000, 0x00100010, 0x00100010,
+        0x00101000, 0x00101000, 0x00101010, 0x00101010, 0x00101000, 0x00101000,
+        0x00101010, 0x00101010, 0x10000000, 0x10000000, 0x10000010, 0x10000010,
+        0x10000000, 0x10000000, 0x10000010, 0x10000010, 0x10001000, 0x10001000,
+        0x10001010, 0x10001010, 0x10001000, 0x10001000, 0x10001010, 0x10001010,
+        0x10000000, 0x10000000, 0x10000010, 0x10000010, 0x10000000, 0x10000000,
+        0x10000010, 0x10000010, 0x10001000, 0x10001000, 0x10001010, 0x10001010,
+        0x10001000, 0x10001000, 0x10001010, 0x10001010, 0x10100000, 0x10100000,
+        0x10100010, 0x10100010, 0x10100000, 0x10100000, 0x10100010, 0x10100010,
+        0x10101000, 0x10101000, 0x10101010, 0x10101010, 0x10101000, 0x10101000,
+        0x10101010, 0x10101010, 0x10100000, 0x10100000, 0x10100010, 0x10100010,
+        0x10100000, 0x10100000, 0x10100010, 0x10100010, 0x10101000, 0x10101000,
+        0x10101010, 0x10101010, 0x10101000, 0x10101000, 0x10101010, 0x10101010,
+        0x10000000, 0x10000000, 0x10000010, 0x10000010, 0x10000000, 0x10000000,
+        0x10000010, 0x10000010, 0x10001000, 0x10001000, 0x10001010, 0x10001010,
+        0x10001000, 0x10001000, 0x10001010, 0x10001010, 0x10000000, 0x10000000,
+        0x10000010, 0x10000010, 0x10000000, 0x10000000, 0x10000010, 0x10000010,
+        0x10001000, 0x10001000, 0x10001010, 0x10001010, 0x10001000, 0x10001000,
+        0x10001010, 0x10001010, 0x10100000, 0x10100000, 0x10100010, 0x10100010,
+        0x10100000, 0x10100000, 0x10100010, 0x10100010, 0x10101000, 0x10101000,
+        0x10101010, 0x10101010, 0x10101000, 0x10101000, 0x10101010, 0x10101010,
+        0x10100000, 0x10100000, 0x10100010, 0x10100010, 0x10100000, 0x10100000,
+        0x10100010, 0x10100010, 0x10101000, 0x10101000, 0x10101010, 0x10101010,
+        0x10101000, 0x10101000, 0x10101010, 0x10101010],
+       [0x00000000, 0x00000000, 0x00000020, 0x00000020, 0x00000000, 0x00000000,
+        0x00000020, 0x00000020, 0x00002000, 0x00002000, 0x00002020, 0x00002020,
+        0x00002000, 0x00002000, 0x00002020, 0x00002020, 0x00000000, 0x00000000,
+        0x00000020, 0x00000020, 0x00000000, 0x00000000, 0x00000020, 0x00000020,
+        0x00002000, 0x00002000, 0x00002020, 0x00002020, 0x00002000, 0x00002000,
+        0x00002020, 0x00002020, 0x00200000, 0x00200000, 0x00200020, 0x00200020,
+        0x00200000, 0x00200000, 0x00200020, 0x00200020, 0x00202000, 0x00202000,
+        0x00202020, 0x00202020, 0x00202000, 0x00202000, 0x00202020, 0x00202020,
+        0x00200000, 0x00200000, 0x00200020, 0x00200020, 0x00200000, 0x00200000,
+        0x00200020, 0x00200020, 0x00202000, 0x00202000, 0x00202020, 0x00202020,
+        0x00202000, 0x00202000, 0x00202020, 0x00202020, 0x00000000, 0x00000000,
+        0x00000020, 0x00000020, 0x00000000, 0x00000000, 0x00000020, 0x00000020,
+        0x00002000, 0x00002000, 0x00002020, 0x00002020, 0x00002000, 0x00002000,
+        0x00002020, 0x00002020, 0x00000000, 0x00000000, 0x00000020, 0x00000020,
+        0x00000000, 0x00000000, 0x00000020, 0x00000020, 0x00002000, 0x00002000,
+        0x00002020, 0x00002020, 0x00002000, 0x00002000, 0x00002020, 0x00002020,
+        0x00200000, 0x00200000, 0x00200020, 0x00200020, 0x00200000, 0x00200000,
+        0x00200020, 0x00200020, 0x00202000, 0x00202000, 0x00202020, 0x00202020,
+        0x00202000, 0x00202000, 0x00202020, 0x00202020, 0x00200000, 0x00200000,
+        0x00200020, 0x00200020, 0x00200000, 0x00200000, 0x00200020, 0x00200020,
+        0x00202000, 0x00202000, 0x00202020, 0x00202020, 0x00202000, 0x00202000,
+        0x00202020, 0x00202020, 0x20000000, 0x20000000, 0x20000020, 0x20000020,
+        0x20000000, 0x20000000, 0x20000020, 0x20000020, 0x20002000, 0x20002000,
+        0x20002020, 0x20002020, 0x20002000, 0x20002000, 0x20002020, 0x20002020,
+        0x20000000, 0x20000000, 0x20000020, 0x20000020, 0x20000000, 0x20000000,
+        0x20000020, 0x20000020, 0x20002000, 0x20002000, 0x20002020, 0x20002020,
+        0x20002000, 0x20002000, 0x20002020, 0x20002020, 0x20200000, 0x20200000,
+        0x20200020, 0x20200020, 0x20200000, 0x20200000, 0x20200020, 0x20200020,
+        0x20202000, 0x20202000, 0x20202020, 0x20202020, 0x20202000, 0x20202000,
+        0x20202020, 0x20202020, 0x20200000, 0x20200000, 0x20200020, 0x20200020,
+        0x20200000, 0x20200000, 0x20200020, 0x20200020, 0x20202000, 0x20202000,
+        0x20202020, 0x20202020, 0x20202000, 0x20202000, 0x20202020, 0x20202020,
+        0x20000000, 0x20000000, 0x20000020, 0x20000020, 0x20000000, 0x20000000,
+        0x20000020, 0x20000020, 0x20002000, 0x20002000, 0x20002020, 0x20002020,
+        0x20002000, 0x20002000, 0x20002020, 0x20002020, 0x20000000, 0x20000000,
+        0x20000020, 0x20000020, 0x20000000, 0x20000000, 0x20000020, 0x20000020,
+        0x20002000, 0x20002000, 0x20002020, 0x20002020, 0x20002000, 0x20002000,
+        0x20002020, 0x20002020, 0x20200000, 0x20200000, 0x20200020, 0x20200020,
+        0x20200000, 0x20200000, 0x20200020, 0x20200020, 0x20202000, 0x20202000,
+        0x20202020, 0x20202020, 0x20202000, 0x20202000, 0x20202020, 0x20202020,
+        0x20200000, 0x20200000, 0x20200020, 0x20200020, 0x20200000, 0x20200000,
+        0x20200020, 0x20200020, 0x20202000, 0x20202000, 0x20202020, 0x20202020,
+        0x20202000, 0x20202000, 0x20202020, 0x20202020],
+       [0x00000000, 0x00000000, 0x00000040, 0x00000040, 0x00000000, 0x00000000,
+        0x00000040, 0x00000040, 0x00004000, 0x00004000, 0x00004040, 0x00004040,
+        0x00004000, 0x00004000, 0x00004040, 0x00004040, 0x00000000, 0x00000000,
+        0x00000040, 0x00000040, 0x00000000, 0x00000000, 0x00000040, 0x00000040,
+        0x00004000, 0x00004000, 0x00004040, 0x00004040, 0x00004000, 0x00004000,
+        0x00004040, 0x00004040, 0x00400000, 0x00400000, 0x00400040, 0x00400040,
+        0x00400000, 0x00400000, 0x00400040, 0x00400040, 0x00404000, 0x00404000,
+        0x00404040, 0x00404040, 0x00404000, 0x00404000, 0x00404040, 0x00404040,
+        0x00400000, 0x00400000, 0x00400040, 0x00400040, 0x00400000, 0x00400000,
+        0x00400040, 0x00400040, 0x00404000, 0x00404000, 0x00404040, 0x00404040,
+        0x00404000, 0x00404000, 0x00404040, 0x00404040, 0x00000000, 0x00000000,
+        0x00000040, 0x00000040, 0x00000000, 0x00000000, 0x00000040, 0x00000040,
+        0x00004000, 0x00004000, 0x00004040, 0x00004040, 0x00004000, 0x00004000,
+        0x00004040, 0x00004040, 0x00000000, 0x00000000, 0x00000040, 0x00000040,
+        0x00000000, 0x00000000, 0x00000040, 0x00000040, 0x00004000, 0x00004000,
+        0x00004040, 0x00004040, 0x00004000, 0x00004000, 0x00004040, 0x00004040,
+        0x00400000, 0x00400000, 0x00400040, 0x00400040, 0x00400000, 0x00400000,
+        0x00400040, 0x00400040, 0x00404000, 0x00404000, 0x00404040, 0x00404040,
+        0x00404000, 0x00404000, 0x00404040, 0x00404040, 0x00400000, 0x00400000,
+        0x00400040, 0x00400040, 0x00400000, 0x00400000, 0x00400040, 0x00400040,
+        0x00404000, 0x00404000, 0x00404040, 0x00404040, 0x00404000, 0x00404000,
+        0x00404040, 0x00404040, 0x40000000, 0x40000000, 0x40000040, 0x40000040,
+        0x40000000, 0x40000000, 0x40000040, 0x40000040, 0x40004000, 0x40004000,
+        0x40004040, 0x40004040, 0x40004000, 0x40004000, 0x40004040, 0x40004040,
+        0x40000000, 0x40000000, 0x40000040, 0x40000040, 0x40000000, 0x40000000,
+        0x40000040, 0x40000040, 0x40004000, 0x40004000, 0x40004040, 0x40004040,
+        0x40004000, 0x40004000, 0x40004040, 0x40004040, 0x40400000, 0x40400000,
+        0x40400040, 0x40400040, 0x40400000, 0x40400000, 0x40400040, 0x40400040,
+        0x40404000, 0x40404000, 0x40404040, 0x40404040, 0x40404000, 0x40404000,
+        0x40404040, 0x40404040, 0x40400000, 0x40400000, 0x40400040, 0x40400040,
+        0x40400000, 0x40400000, 0x40400040, 0x40400040, 0x40404000, 0x40404000,
+        0x40404040, 0x40404040, 0x40404000, 0x40404000, 0x40404040, 0x40404040,
+        0x40000000, 0x40000000, 0x40000040, 0x40000040, 0x40000000, 0x40000000,
+        0x40000040, 0x40000040, 0x40004000, 0x40004000, 0x40004040, 0x40004040,
+        0x40004000, 0x40004000, 0x40004040, 0x40004040, 0x40000000, 0x40000000,
+        0x40000040, 0x40000040, 0x40000000, 0x40000000, 0x40000040, 0x40000040,
+        0x40004000, 0x40004000, 0x40004040, 0x40004040, 0x40004000, 0x40004000,
+        0x40004040, 0x40004040, 0x40400000, 0x40400000, 0x40400040, 0x40400040,
+        0x40400000, 0x40400000, 0x40400040, 0x40400040, 0x40404000, 0x40404000,
+        0x40404040, 0x40404040, 0x40404000, 0x40404000, 0x40404040, 0x40404040,
+        0x40400000, 0x40400000, 0x40400040, 0x40400040, 0x40400000, 0x40400000,
+        0x40400040, 0x40400040, 0x40404000, 0x40404000, 0x40404040, 0x40404040,
+        0x40404000, 0x40404000, 0x40404040, 0x40404040],
+       [0x00000000, 0x00000000, 0x00000080, 0x00000080, 0x00000000, 0x00000000,
+        0x00000080, 0x00000080, 0x00008000, 0x00008000, 0x00008080, 0x00008080,
+        0x00008000, 0x00008000, 0x00008080, 0x00008080, 0x00000000, 0x00000000,
+        0x00000080, 0x00000080, 0x00000000, 0x00000000, 0x00000080, 0x00000080,
+        0x00008000, 0x00008000, 0x00008080, 0x00008080, 0x00008000, 0x00008000,
+        0x00008080, 0x00008080, 0x00800000, 0x00800000, 0x00800080, 0x00800080,
+        0x00800000, 0x00800000, 0x00800080, 0x00800080, 0x00808000, 0x00808000,
+        0x00808080, 0x00808080, 0x00808000, 0x00808000, 0x00808080, 0x00808080,
+        0x00800000, 0x00800000, 0x00800080, 0x00800080, 0x00800000, 0x00800000,
+        0x00800080, 0x00800080, 0x00808000, 0x00808000, 0x00808080, 0x00808080,
+        0x00808000, 0x00808000, 0x00808080, 0x00808080, 0x00000000, 0x00000000,
+        0x00000080, 0x00000080, 0x00000000, 0x00000000, 0x00000080, 0x00000080,
+        0x00008000, 0x00008000, 0x00008080, 0x00008080, 0x00008000, 0x00008000,
+        0x00008080, 0x00008080, 0x00000000, 0x00000000, 0x00000080, 0x00000080,
+        0x00000000, 0x00000000, 0x00000080, 0x00000080, 0x00008000, 0x00008000,
+        0x00008080, 0x00008080, 0x00008000, 0x00008000, 0x00008080, 0x00008080,
+        0x00800000, 0x00800000, 0x00800080, 0x00800080, 0x00800000, 0x00800000,
+        0x00800080, 0x00800080, 0x00808000, 0x00808000, 0x00808080, 0x00808080,
+        0x00808000, 0x00808000, 0x00808080, 0x00808080, 0x00800000, 0x00800000,
+        0x00800080, 0x00800080, 0x00800000, 0x00800000, 0x00800080, 0x00800080,
+        0x00808000, 0x00808000, 0x00808080, 0x00808080, 0x00808000, 0x00808000,
+        0x00808080, 0x00808080, 0x80000000, 0x80000000, 0x80000080, 0x80000080,
+        0x80000000, 0x80000000, 0x80000080, 0x80000080, 0x80008000, 0x80008000,
+        0x80008080, 0x80008080, 0x80008000, 0x80008000, 0x80008080, 0x80008080,
+        0x80000000, 0x80000000, 0x80000080, 0x80000080, 0x80000000, 0x80000000,
+        0x80000080, 0x80000080, 0x80008000, 0x80008000, 0x80008080, 0x80008080,
+        0x80008000, 0x80008000, 0x80008080, 0x80008080, 0x80800000, 0x80800000,
+        0x80800080, 0x80800080, 0x80800000, 0x80800000, 0x80800080, 0x80800080,
+        0x80808000, 0x80808000, 0x80808080, 0x80808080, 0x80808000, 0x80808000,
+        0x80808080, 0x80808080, 0x80800000, 0x80800000, 0x80800080, 0x80800080,
+        0x80800000, 0x80800000, 0x80800080, 0x80800080, 0x80808000, 0x80808000,
+        0x80808080, 0x80808080, 0x80808000, 0x80808000, 0x80808080, 0x80808080,
+        0x80000000, 0x80000000, 0x80000080, 0x80000080, 0x80000000, 0x80000000,
+        0x80000080, 0x80000080, 0x80008000, 0x80008000, 0x80008080, 0x80008080,
+        0x80008000, 0x80008000, 0x80008080, 0x80008080, 0x80000000, 0x80000000,
+        0x80000080, 0x80000080, 0x80000000, 0x80000000, 0x80000080, 0x80000080,
+        0x80008000, 0x80008000, 0x80008080, 0x80008080, 0x80008000, 0x80008000,
+        0x80008080, 0x80008080, 0x80800000, 0x80800000, 0x80800080, 0x80800080,
+        0x80800000, 0x80800000, 0x80800080, 0x80800080, 0x80808000, 0x80808000,
+        0x80808080, 0x80808080, 0x80808000, 0x80808000, 0x80808080, 0x80808080,
+        0x80800000, 0x80800000, 0x80800080, 0x80800080, 0x80800000, 0x80800000,
+        0x80800080, 0x80800080, 0x80808000, 0x80808000, 0x80808080, 0x80808080,
+        0x80808000, 0x80808000, 0x80808080, 0x80808080],
+       [0x00000000, 0x00000000, 0x00000100, 0x00000100, 0x00000000, 0x00000000,
+        0x00000100, 0x00000100, 0x00010000, 0x00010000, 0x00010100, 0x00010100,
+        0x00010000, 0x00010000, 0x00010100, 0x00010100, 0x00000000, 0x00000000,
+        0x00000100, 0x00000100, 0x00000000, 0x00000000, 0x00000100, 0x00000100,
+        0x00010000, 0x00010000, 0x00010100, 0x00010100, 0x00010000, 0x00010000,
+        0x00010100, 0x00010100, 0x01000000, 0x01000000, 0x01000100, 0x01000100,
+        0x01000000, 0x01000000, 0x01000100, 0x01000100, 0x01010000, 0x01010000,
+        0x01010100, 0x01010100, 0x01010000, 0x01010000, 0x01010100, 0x01010100,
+        0x01000000, 0x01000000, 0x01000100, 0x01000100, 0x01000000, 0x01000000,
+        0x01000100, 0x01000100, 0x01010000, 0x01010000, 0x01010100, 0x01010100,
+        0x01010000, 0x01010000, 0x01010100, 0x01010100, 0x00000000, 0x00000000,
+        0x00000100, 0x00000100, 0x00000000, 0x00000000, 0x00000100, 0x00000100,
+        0x00010000, 0x00010000, 0x00010100, 0x00010100, 0x00010000, 0x00010000,
+        0x00010100, 0x00010100, 0x00000000, 0x00000000, 0x00000100, 0x00000100,
+        0x00000000, 0x00000000, 0x00000100, 0x00000100, 0x00010000, 0x00010000,
+        0x00010100, 0x00010100, 0x00010000, 0x00010000, 0x00010100, 0x00010100,
+        0x01000000, 0x01000000, 0x01000100, 0x01000100, 0x01000000, 0x01000000,
+        0x01000100, 0x01000100, 0x01010000, 0x01010000, 0x01010100, 0x01010100,
+        0x01010000, 0x01010000, 0x01010100, 0x01010100, 0x01000000, 0x01000000,
+        0x01000100, 0x01000100, 0x01000000, 0x01000000, 0x01000100, 0x01000100,
+        0x01010000, 0x01010000, 0x01010100, 0x01010100, 0x01010000, 0x01010000,
+        0x01010100, 0x01010100, 0x00000001, 0x00000001, 0x00000101, 0x00000101,
+        0x00000001, 0x00000001, 0x00000101, 0x00000101, 0x00010001, 0x00010001,
+        0x00010101, 0x00010101, 0x00010001, 0x00010001, 0x00010101, 0x00010101,
+        0x00000001, 0x00000001, 0x00000101, 0x00000101, 0x00000001, 0x00000001,
+        0x00000101, 0x00000101, 0x00010001, 0x00010001, 0x00010101, 0x00010101,
+        0x00010001, 0x00010001, 0x00010101, 0x00010101, 0x01000001, 0x01000001,
+        0x01000101, 0x01000101, 0x01000001, 0x01000001, 0x01000101, 0x01000101,
+        0x01010001, 0x01010001, 0x01010101, 0x01010101, 0x01010001, 0x01010001,
+        0x01010101, 0x01010101, 0x01000001, 0x01000001, 0x01000101, 0x01000101,
+        0x01000001, 0x01000001, 0x01000101, 0x01000101, 0x01010001, 0x01010001,
+        0x01010101, 0x01010101, 0x01010001, 0x01010001, 0x01010101, 0x01010101,
+        0x00000001, 0x00000001, 0x00000101, 0x00000101, 0x00000001, 0x00000001,
+        0x00000101, 0x00000101, 0x00010001, 0x00010001, 0x00010101, 0x00010101,
+        0x00010001, 0x00010001, 0x00010101, 0x00010101, 0x00000001, 0x00000001,
+        0x00000101, 0x00000101, 0x00000001, 0x00000001, 0x00000101, 0x00000101,
+        0x00010001, 0x00010001, 0x00010101, 0x00010101, 0x00010001, 0x00010001,
+        0x00010101, 0x00010101, 0x01000001, 0x01000001, 0x01000101, 0x01000101,
+        0x01000001, 0x01000001, 0x01000101, 0x01000101, 0x01010001, 0x01010001,
+        0x01010101, 0x01010101, 0x01010001, 0x01010001, 0x01010101, 0x01010101,
+        0x01000001, 0x01000001, 0x01000101, 0x01000101, 0x01000001, 0x01000001,
+        0x01000101, 0x01000101, 0x01010001, 0x01010001, 0x01010101, 0x01010101,
+        0x01010001, 0x01010001, 0x01010101, 0x01010101]]
+
+FPH = [[0x00000000, 0x00000000, 0x40000000, 0x40000000, 0x00400000, 0x00400000,
+        0x40400000, 0x40400000, 0x00004000, 0x00004000, 0x40004000, 0x40004000,
+        0x00404000, 0x00404000, 0x40404000, 0x40404000, 0x00000040, 0x00000040,
+        0x40000040, 0x40000040, 0x00400040, 0x00400040, 0x40400040, 0x40400040,
+        0x00004040, 0x00004040, 0x40004040, 0x40004040, 0x00404040, 0x00404040,
+        0x40404040, 0x40404040, 0x00000000, 0x00000000, 0x40000000, 0x40000000,
+        0x00400000, 0x00400000, 0x40400000, 0x40400000, 0x00004000, 0x00004000,
+        0x40004000, 0x40004000, 0x00404000, 0x00404000, 0x40404000, 0x40404000,
+        0x00000040, 0x00000040, 0x40000040, 0x40000040, 0x00400040, 0x00400040,
+        0x40400040, 0x40400040, 0x00004040, 0x00004040, 0x40004040, 0x40004040,
+        0x00404040, 0x00404040, 0x40404040, 0x40404040, 0x00000000, 0x00000000,
+        0x40000000, 0x40000000, 0x00400000, 0x00400000, 0x40400000, 0x40400000,
+        0x00004000, 0x00004000, 0x40004000, 0x40004000, 0x00404000, 0x00404000,
+        0x40404000, 0x40404000, 0x00000040, 0x00000040, 0x40000040, 0x40000040,
+        0x00400040, 0x00400040, 0x40400040, 0x40400040, 0x00004040, 0x00004040,
+        0x40004040, 0x40004040, 0x00404040, 0x00404040, 0x40404040, 0x40404040,
+        0x00000000, 0x00000000, 0x40000000, 0x40000000, 0x00400000, 0x00400000,
+        0x40400000, 0x40400000, 0x00004000, 0x00004000, 0x40004000, 0x40004000,
+        0x00404000, 0x00404000, 0x40404000, 0x40404000, 0x00000040, 0x00000040,
+        0x40000040, 0x40000040, 0x00400040, 0x00400040, 0x40400040, 0x40400040,
+        0x00004040, 0x00004040, 0x40004040, 0x40004040, 0x00404040, 0x00404040,
+        0x40404040, 0x40404040, 0x00000000, 0x00000000, 0x40000000, 0x40000000,
+        0x00400000, 0x00400000, 0x40400000, 0x40400000, 0x00004000, 0x00004000,
+        0x40004000, 0x40004000, 0x00404000, 0x00404000, 0x40404000, 0x40404000,
+        0x00000040, 0x00000040, 0x40000040, 0x40000040, 0x00400040, 0x00400040,
+        0x40400040, 0x40400040, 0x00004040, 0x00004040, 0x40004040, 0x40004040,
+        0x00404040, 0x00404040, 0x40404040, 0x40404040, 0x00000000, 0x00000000,
+        0x40000000, 0x40000000, 0x00400000, 0x00400000, 0x40400000, 0x40400000,
+        0x00004000, 0x00004000, 0x40004000, 0x40004000, 0x00404000, 0x00404000,
+        0x40404000, 0x40404000, 0x00000040, 0x00000040, 0x40000040, 0x40000040,
+        0x00400040, 0x00400040, 0x40400040, 0x40400040, 0x00004040, 0x00004040,
+        0x40004040, 0x40004040, 0x00404040, 0x00404040, 0x40404040, 0x40404040,
+        0x00000000, 0x00000000, 0x40000000, 0x40000000, 0x00400000, 0x00400000,
+        0x40400000, 0x40400000, 0x00004000, 0x00004000, 0x40004000, 0x40004000,
+        0x00404000, 0x00404000, 0x40404000, 0x40404000, 0x00000040, 0x00000040,
+        0x40000040, 0x40000040, 0x00400040, 0x00400040, 0x40400040, 0x40400040,
+        0x00004040, 0x00004040, 0x40004040, 0x40004040, 0x00404040, 0x00404040,
+        0x40404040, 0x40404040, 0x00000000, 0x00000000, 0x40000000, 0x40000000,
+        0x00400000, 0x00400000, 0x40400000, 0x40400000, 0x00004000, 0x00004000,
+        0x40004000, 0x40004000, 0x00404000, 0x00404000, 0x40404000, 0x40404000,
+        0x00000040, 0x00000040, 0x40000040, 0x40000040, 0x00400040, 0x00400040,
+        0x40400040, 0x40400040, 0x00004040, 0x00004040, 0x40004040, 0x40004040,
+        0x00404040, 0x00404040, 0x40404040, 0x40404040],
+       [0x00000000, 0x00000000, 0x10000000, 0x10000000, 0x00100000, 0x00100000,
+        0x10100000, 0x10100000, 0x00001000, 0x00001000, 0x10001000, 0x10001000,
+        0x00101000, 0x00101000, 0x10101000, 0x10101000, 0x00000010, 0x00000010,
+        0x10000010, 0x10000010, 0x00100010, 0x00100010, 0x10100010, 0x10100010,
+        0x00001010, 0x00001010, 0x10001010, 0x10001010, 0x00101010, 0x00101010,
+        0x10101010, 0x10101010, 0x00000000, 0x00000000, 0x10000000, 0x10000000,
+        0x00100000, 0x00100000, 0x10100000, 0x10100000, 0x00001000, 0x00001000,
+        0x10001000, 0x10001000, 0x00101000, 0x00101000, 0x10101000, 0x10101000,
+        0x00000010, 0x00000010, 0x10000010, 0x10000010, 0x00100010, 0x00100010,
+        0x10100010, 0x10100010, 0x00001010, 0x00001010, 0x10001010, 0x10001010,
+        0x00101010, 0x00101010, 0x10101010, 0x10101010, 0x00000000, 0x00000000,
+        0x10000000, 0x10000000, 0x00100000, 0x00100000, 0x10100000, 0x10100000,
+        0x00001000, 0x00001000, 0x10001000, 0x10001000, 0x00101000, 0x00101000,
+        0x10101000, 0x10101000, 0x00000010, 0x00000010, 0x10000010, 0x10000010,
+        0x00100010, 0x00100010, 0x10100010, 0x10100010, 0x00001010, 0x00001010,
+        0x10001010, 0x10001010, 0x00101010, 0x00101010, 0x10101010, 0x10101010,
+        0x00000000, 0x00000000, 0x10000000, 0x10000000, 0x00100000, 0x00100000,
+        0x10100000, 0x10100000, 0x00001000, 0x00001000, 0x10001000, 0x10001000,
+        0x00101000, 0x00101000, 0x10101000, 0x10101000, 0x00000010, 0x00000010,
+        0x10000010, 0x10000010, 0x00100010, 0x00100010, 0x10100010, 0x10100010,
+        0x00001010, 0x00001010, 0x10001010, 0x10001010, 0x00101010, 0x00101010,
+        0x10101010, 0x10101010, 0x00000000, 0x00000000, 0x10000000, 0x10000000,
+        0x00100000, 0x00100000, 0x10100000, 0x10100000, 0x00001000, 0x00001000,
+        0x10001000, 0x10001000, 0x00101000, 0x00101000, 0x10101000, 0x10101000,
+        0x00000010, 0x00000010, 0x10000010, 0x10000010, 0x00100010, 0x00100010,
+        0x10100010, 0x10100010, 0x00001010, 0x00001010, 0x10001010, 0x10001010,
+        0x00101010, 0x00101010, 0x10101010, 0x10101010, 0x00000000, 0x00000000,
+        0x10000000, 0x10000000, 0x00100000, 0x00100000, 0x10100000, 0x10100000,
+        0x00001000, 0x00001000, 0x10001000, 0x10001000, 0x00101000, 0x00101000,
+        0x10101000, 0x10101000, 0x00000010, 0x00000010, 0x10000010, 0x10000010,
+        0x00100010, 0x00100010, 0x10100010, 0x10100010, 0x00001010, 0x00001010,
+        0x10001010, 0x10001010, 0x00101010, 0x00101010, 0x10101010, 0x10101010,
+        0x00000000, 0x00000000, 0x10000000, 0x10000000, 0x00100000, 0x00100000,
+        0x10100000, 0x10100000, 0x00001000, 0x00001000, 0x10001000, 0x10001000,
+        0x00101000, 0x00101000, 0x10101000, 0x10101000, 0x00000010, 0x00000010,
+        0x10000010, 0x10000010, 0x00100010, 0x00100010, 0x10100010, 0x10100010,
+        0x00001010, 0x00001010, 0x10001010, 0x10001010, 0x00101010, 0x00101010,
+        0x10101010, 0x10101010, 0x00000000, 0x00000000, 0x10000000, 0x10000000,
+        0x00100000, 0x00100000, 0x10100000, 0x10100000, 0x00001000, 0x00001000,
+        0x10001000, 0x10001000, 0x00101000, 0x00101000, 0x10101000, 0x10101000,
+        0x00000010, 0x00000010, 0x10000010, 0x10000010, 0x00100010, 0x00100010,
+        0x10100010, 0x10100010, 0x00001010, 0x00001010, 0x10001010, 0x10001010,
+        0x00101010, 0x00101010, 0x10101010, 0x10101010],
+       [0x00000000, 0x00000000, 0x04000000, 0x04000000, 0x00040000, 0x00040000,
+        0x04040000, 0x04040000, 0x00000400, 0x00000400, 0x04000400, 0x04000400,
+        0x00040400, 0x00040400, 0x04040400, 0x04040400, 0x00000004, 0x00000004,
+        0x04000004, 0x04000004, 0x00040004, 0x00040004, 0x04040004, 0x04040004,
+        0x00000404, 0x00000404, 0x04000404, 0x04000404, 0x00040404, 0x00040404,
+        0x04040404, 0x04040404, 0x00000000, 0x00000000, 0x04000000, 0x04000000,
+        0x00040000, 0x00040000, 0x04040000, 0x04040000, 0x00000400, 0x00000400,
+        0x04000400, 0x04000400, 0x00040400, 0x00040400, 0x04040400, 0x04040400,
+        0x00000004, 0x00000004, 0x04000004, 0x04000004, 0x00040004, 0x00040004,
+        0x04040004, 0x04040004, 0x00000404, 0x00000404, 0x04000404, 0x04000404,
+        0x00040404, 0x00040404, 0x04040404, 0x04040404, 0x00000000, 0x00000000,
+        0x04000000, 0x04000000, 0x00040000, 0x00040000, 0x04040000, 0x04040000,
+        0x00000400, 0x00000400, 0x04000400, 0x04000400, 0x00040400, 0x00040400,
+        0x04040400, 0x04040400, 0x00000004, 0x00000004, 0x04000004, 0x04000004,
+        0x00040004, 0x00040004, 0x04040004, 0x04040004, 0x00000404, 0x00000404,
+        0x04000404, 0x04000404, 0x00040404, 0x00040404, 0x04040404, 0x04040404,
+        0x00000000, 0x00000000, 0x04000000, 0x04000000, 0x00040000, 0x00040000,
+        0x04040000, 0x04040000, 0x00000400, 0x00000400, 0x04000400, 0x04000400,
+        0x00040400, 0x00040400, 0x04040400, 0x04040400, 0x00000004, 0x00000004,
+        0x04000004, 0x04000004, 0x00040004, 0x00040004, 0x04040004, 0x04040004,
+        0x00000404, 0x00000404, 0x04000404, 0x04000404, 0x00040404, 0x00040404,
+        0x04040404, 0x04040404, 0x00000000, 0x00000000, 0x04000000, 0x04000000,
+        0x00040000, 0x00040000, 0x04040000, 0x04040000, 0x00000400, 0x00000400,
+        0x04000400, 0x04000400, 0x00040400, 0x00040400, 0x04040400, 0x04040400,
+        0x00000004, 0x00000004, 0x04000004, 0x04000004, 0x00040004, 0x00040004,
+        0x04040004, 0x04040004, 0x00000404, 0x00000404, 0x04000404, 0x04000404,
+        0x00040404, 0x00040404, 0x04040404, 0x04040404, 0x00000000, 0x00000000,
+        0x04000000, 0x04000000, 0x00040000, 0x00040000, 0x04040000, 0x04040000,
+        0x00000400, 0x00000400, 0x04000400, 0x04000400, 0x00040400, 0x00040400,
+        0x04040400, 0x04040400, 0x00000004, 0x00000004, 0x04000004, 0x04000004,
+        0x00040004, 0x00040004, 0x04040004, 0x04040004, 0x00000404, 0x00000404,
+        0x04000404, 0x04000404, 0x00040404, 0x00040404, 0x04040404, 0x04040404,
+        0x00000000, 0x00000000, 0x04000000, 0x04000000, 0x00040000, 0x00040000,
+        0x04040000, 0x04040000, 0x00000400, 0x00000400, 0x04000400, 0x04000400,
+        0x00040400, 0x00040400, 0x04040400, 0x04040400, 0x00000004, 0x00000004,
+        0x04000004, 0x04000004, 0x00040004, 0x00040004, 0x04040004, 0x04040004,
+        0x00000404, 0x00000404, 0x04000404, 0x04000404, 0x00040404, 0x00040404,
+        0x04040404, 0x04040404, 0x00000000, 0x00000000, 0x04000000, 0x04000000,
+        0x00040000, 0x00040000, 0x04040000, 0x04040000, 0x00000400, 0x00000400,
+        0x04000400, 0x04000400, 0x00040400, 0x00040400, 0x04040400, 0x04040400,
+        0x00000004, 0x00000004, 0x04000004, 0x04000004, 0x00040004, 0x00040004,
+        0x04040004, 0x04040004, 0x00000404, 0x00000404, 0x04000404, 0x04000404,
+        0x00040404, 0x00040404, 0x04040404, 0x04040404],
+       [0x00000000, 0x00000000, 0x01000000, 0x01000000, 0x00010000, 0x00010000,
+        0x01010000, 0x01010000, 0x00000100, 0x00000100, 0x01000100, 0x01000100,
+        0x00010100, 0x00010100, 0x01010100, 0x01010100, 0x00000001, 0x00000001,
+        0x01000001, 0x01000001, 0x00010001, 0x00010001, 0x01010001, 0x01010001,
+        0x00000101, 0x00000101, 0x01000101, 0x01000101, 0x00010101, 0x00010101,
+        0x01010101, 0x01010101, 0x00000000, 0x00000000, 0x01000000, 0x01000000,
+        0x00010000, 0x00010000, 0x01010000, 0x01010000, 0x00000100, 0x00000100,
+        0x01000100, 0x01000100, 0x00010100, 0x00010100, 0x01010100, 0x01010100,
+        0x00000001, 0x00000001, 0x01000001, 0x01000001, 0x00010001, 0x00010001,
+        0x01010001, 0x01010001, 0x00000101, 0x00000101, 0x01000101, 0x01000101,
+        0x00010101, 0x00010101, 0x01010101, 0x01010101, 0x00000000, 0x00000000,
+        0x01000000, 0x01000000, 0x00010000, 0x00010000, 0x01010000, 0x01010000,
+        0x00000100, 0x00000100, 0x01000100, 0x01000100, 0x00010100, 0x00010100,
+        0x01010100, 0x01010100, 0x00000001, 0x00000001, 0x01000001, 0x01000001,
+        0x00010001, 0x00010001, 0x01010001, 0x01010001, 0x00000101, 0x00000101,
+        0x01000101, 0x01000101, 0x00010101, 0x00010101, 0x01010101, 0x01010101,
+        0x00000000, 0x00000000, 0x01000000, 0x01000000, 0x00010000, 0x00010000,
+        0x01010000, 0x01010000, 0x00000100, 0x00000100, 0x01000100, 0x01000100,
+        0x00010100, 0x00010100, 0x01010100, 0x01010100, 0x00000001, 0x00000001,
+        0x01000001, 0x01000001, 0x00010001, 0x00010001, 0x01010001, 0x01010001,
+        0x00000101, 0x00000101, 0x01000101, 0x01000101, 0x00010101, 0x00010101,
+        0x01010101, 0x01010101, 0x00000000, 0x00000000, 0x01000000, 0x01000000,
+        0x00010000, 0x00010000, 0x01010000, 0x01010000, 0x00000100, 0x00000100,
+        0x01000100, 0x01000100, 0x00010100, 0x00010100, 0x01010100, 0x01010100,
+        0x00000001, 0x00000001, 0x01000001, 0x01000001, 0x00010001, 0x00010001,
+        0x01010001, 0x01010001, 0x00000101, 0x00000101, 0x01000101, 0x01000101,
+        0x00010101, 0x00010101, 0x01010101, 0x01010101, 0x00000000, 0x00000000,
+        0x01000000, 0x01000000, 0x00010000, 0x00010000, 0x01010000, 0x01010000,
+        0x00000100, 0x00000100, 0x01000100, 0x01000100, 0x00010100, 0x00010100,
+        0x01010100, 0x01010100, 0x00000001, 0x00000001, 0x01000001, 0x01000001,
+        0x00010001, 0x00010001, 0x01010001, 0x01010001, 0x00000101, 0x00000101,
+        0x01000101, 0x01000101, 0x00010101, 0x00010101, 0x01010101, 0x01010101,
+        0x00000000, 0x00000000, 0x01000000, 0x01000000, 0x00010000, 0x00010000,
+        0x01010000, 0x01010000, 0x00000100, 0x00000100, 0x01000100, 0x01000100,
+        0x00010100, 0x00010100, 0x01010100, 0x01010100, 0x00000001, 0x00000001,
+        0x01000001, 0x01000001, 0x00010001, 0x00010001, 0x01010001, 0x01010001,
+        0x00000101, 0x00000101, 0x01000101, 0x01000101, 0x00010101, 0x00010101,
+        0x01010101, 0x01010101, 0x00000000, 0x00000000, 0x01000000, 0x01000000,
+        0x00010000, 0x00010000, 0x01010000, 0x01010000, 0x00000100, 0x00000100,
+        0x01000100, 0x01000100, 0x00010100, 0x00010100, 0x01010100, 0x01010100,
+        0x00000001, 0x00000001, 0x01000001, 0x01000001, 0x00010001, 0x00010001,
+        0x01010001, 0x01010001, 0x00000101, 0x00000101, 0x01000101, 0x01000101,
+        0x00010101, 0x00010101, 0x01010101, 0x01010101],
+       [0x00000000, 0x00000000, 0x80000000, 0x80000000, 0x00800000, 0x00800000,
+        0x80800000, 0x80800000, 0x00008000, 0x00008000, 0x80008000, 0x80008000,
+        0x00808000, 0x00808000, 0x80808000, 0x80808000, 0x00000080, 0x00000080,
+        0x80000080, 0x80000080, 0x00800080, 0x00800080, 0x80800080, 0x80800080,
+        0x00008080, 0x00008080, 0x80008080, 0x80008080, 0x00808080, 0x00808080,
+        0x80808080, 0x80808080, 0x00000000, 0x00000000, 0x80000000, 0x80000000,
+        0x00800000, 0x00800000, 0x80800000, 0x80800000, 0x00008000, 0x00008000,
+        0x80008000, 0x80008000, 0x00808000, 0x00808000, 0x80808000, 0x80808000,
+        0x00000080, 0x00000080, 0x80000080, 0x80000080, 0x00800080, 0x00800080,
+        0x80800080, 0x80800080, 0x00008080, 0x00008080, 0x80008080, 0x80008080,
+        0x00808080, 0x00808080, 0x80808080, 0x80808080, 0x00000000, 0x00000000,
+        0x80000000, 0x80000000, 0x00800000, 0x00800000, 0x80800000, 0x80800000,
+        0x00008000, 0x00008000, 0x80008000, 0x80008000, 0x00808000, 0x00808000,
+        0x80808000, 0x80808000, 0x00000080, 0x00000080, 0x80000080, 0x80000080,
+        0x00800080, 0x00800080, 0x80800080, 0x80800080, 0x00008080, 0x00008080,
+        0x80008080, 0x80008080, 0x00808080, 0x00808080, 0x80808080, 0x80808080,
+        0x00000000, 0x00000000, 0x80000000, 0x80000000, 0x00800000, 0x00800000,
+        0x80800000, 0x80800000, 0x00008000, 0x00008000, 0x80008000, 0x80008000,
+        0x00808000, 0x00808000, 0x80808000, 0x80808000, 0x00000080, 0x00000080,
+        0x80000080, 0x80000080, 0x00800080, 0x00800080, 0x80800080, 0x80800080,
+        0x00008080, 0x00008080, 0x80008080, 0x80008080, 0x00808080, 0x00808080,
+        0x80808080, 0x80808080, 0x00000000, 0x00000000, 0x80000000, 0x80000000,
+        0x00800000, 0x00800000, 0x80800000, 0x80800000, 0x00008000, 0x00008000,
+        0x80008000, 0x80008000, 0x00808000, 0x00808000, 0x80808000, 0x80808000,
+        0x00000080, 0x00000080, 0x80000080, 0x80000080, 0x00800080, 0x00800080,
+        0x80800080, 0x80800080, 0x00008080, 0x00008080, 0x80008080, 0x80008080,
+        0x00808080, 0x00808080, 0x80808080, 0x80808080, 0x00000000, 0x00000000,
+        0x80000000, 0x80000000, 0x00800000, 0x00800000, 0x80800000, 0x80800000,
+        0x00008000, 0x00008000, 0x80008000, 0x80008000, 0x00808000, 0x00808000,
+        0x80808000, 0x80808000, 0x00000080, 0x00000080, 0x80000080, 0x80000080,
+        0x00800080, 0x00800080, 0x80800080, 0x80800080, 0x00008080, 0x00008080,
+        0x80008080, 0x80008080, 0x00808080, 0x00808080, 0x80808080, 0x80808080,
+        0x00000000, 0x00000000, 0x80000000, 0x80000000, 0x00800000, 0x00800000,
+        0x80800000, 0x80800000, 0x00008000, 0x00008000, 0x80008000, 0x80008000,
+        0x00808000, 0x00808000, 0x80808000, 0x80808000, 0x00000080, 0x00000080,
+        0x80000080, 0x80000080, 0x00800080, 0x00800080, 0x80800080, 0x80800080,
+        0x00008080, 0x00008080, 0x80008080, 0x80008080, 0x00808080, 0x00808080,
+        0x80808080, 0x80808080, 0x00000000, 0x00000000, 0x80000000, 0x80000000,
+        0x00800000, 0x00800000, 0x80800000, 0x80800000, 0x00008000, 0x00008000,
+        0x80008000, 0x80008000, 0x00808000, 0x00808000, 0x80808000, 0x80808000,
+        0x00000080, 0x00000080, 0x80000080, 0x80000080, 0x00800080, 0x00800080,
+        0x80800080, 0x80800080, 0x00008080, 0x00008080, 0x80008080, 0x80008080,
+        0x00808080, 0x00808080, 0x80808080, 0x80808080],
+       [0x00000000, 0x00000000, 0x20000000, 0x20000000, 0x00200000, 0x00200000,
+        0x20200000, 0x20200000, 0x00002000, 0x00002000, 0x20002000, 0x20002000,
+        0x00202000, 0x00202000, 0x20202000, 0x20202000, 0x00000020, 0x00000020,
+        0x20000020, 0x20000020, 0x00200020, 0x00200020, 0x20200020, 0x20200020,
+        0x00002020, 0x00002020, 0x20002020, 0x20002020, 0x00202020, 0x00202020,
+        0x20202020, 0x20202020, 0x00000000, 0x00000000, 0x20000000, 0x20000000,
+        0x00200000, 0x00200000, 0x20200000, 0x20200000, 0x00002000, 0x00002000,
+        0x20002000, 0x20002000, 0x00202000, 0x00202000, 0x20202000, 0x20202000,
+        0x00000020, 0x00000020, 0x20000020, 0x20000020, 0x00200020, 0x00200020,
+        0x20200020, 0x20200020, 0x00002020, 0x00002020, 0x20002020, 0x20002020,
+        0x00202020, 0x00202020, 0x20202020, 0x20202020, 0x00000000, 0x00000000,
+        0x20000000, 0x20000000, 0x00200000, 0x00200000, 0x20200000, 0x20200000,
+        0x00002000, 0x00002000, 0x20002000, 0x20002000, 0x00202000, 0x00202000,
+        0x20202000, 0x20202000, 0x00000020, 0x00000020, 0x20000020, 0x20000020,
+        0x00200020, 0x00200020, 0x20200020, 0x20200020, 0x00002020, 0x00002020,
+        0x20002020, 0x20002020, 0x00202020, 0x00202020, 0x20202020, 0x20202020,
+        0x00000000, 0x00000000, 0x20000000, 0x20000000, 0x00200000, 0x00200000,
+        0x20200000, 0x20200000, 0x00002000, 0x00002000, 0x20002000, 0x20002000,
+        0x00202000, 0x00202000, 0x20202000, 0x20202000, 0x00000020, 0x00000020,
+        0x20000020, 0x20000020, 0x00200020, 0x00200020, 0x20200020, 0x20200020,
+        0x00002020, 0x00002020, 0x20002020, 0x20002020, 0x00202020, 0x00202020,
+        0x20202020, 0x20202020, 0x00000000, 0x00000000, 0x20000000, 0x20000000,
+        0x00200000, 0x00200000, 0x20200000, 0x20200000, 0x00002000, 0x00002000,
+        0x20002000, 0x20002000, 0x00202000, 0x00202000, 0x20202000, 0x20202000,
+        0x00000020, 0x00000020, 0x20000020, 0x20000020, 0x00200020, 0x00200020,
+        0x20200020, 0x20200020, 0x00002020, 0x00002020, 0x20002020, 0x20002020,
+        0x00202020, 0x00202020, 0x20202020, 0x20202020, 0x00000000, 0x00000000,
+        0x20000000, 0x20000000, 0x00200000, 0x00200000, 0x20200000, 0x20200000,
+        0x00002000, 0x00002000, 0x20002000, 0x20002000, 0x00202000, 0x00202000,
+        0x20202000, 0x20202000, 0x00000020, 0x00000020, 0x20000020, 0x20000020,
+        0x00200020, 0x00200020, 0x20200020, 0x20200020, 0x00002020, 0x00002020,
+        0x20002020, 0x20002020, 0x00202020, 0x00202020, 0x20202020, 0x20202020,
+        0x00000000, 0x00000000, 0x20000000, 0x20000000, 0x00200000, 0x00200000,
+        0x20200000, 0x20200000, 0x00002000, 0x00002000, 0x20002000, 0x20002000,
+        0x00202000, 0x00202000, 0x20202000, 0x20202000, 0x00000020, 0x00000020,
+        0x20000020, 0x20000020, 0x00200020, 0x00200020, 0x20200020, 0x20200020,
+        0x00002020, 0x00002020, 0x20002020, 0x20002020, 0x00202020, 0x00202020,
+        0x20202020, 0x20202020, 0x00000000, 0x00000000, 0x20000000, 0x20000000,
+        0x00200000, 0x00200000, 0x20200000, 0x20200000, 0x00002000, 0x00002000,
+        0x20002000, 0x20002000, 0x00202000, 0x00202000, 0x20202000, 0x20202000,
+        0x00000020, 0x00000020, 0x20000020, 0x20000020, 0x00200020, 0x00200020,
+        0x20200020, 0x20200020, 0x00002020, 0x00002020, 0x20002020, 0x20002020,
+        0x00202020, 0x00202020, 0x20202020, 0x20202020],
+       [0x00000000, 0x00000000, 0x08000000, 0x08000000, 0x00080000, 0x00080000,
+        0x08080000, 0x08080000, 0x00000800, 0x00000800, 0x08000800, 0x08000800,
+        0x00080800, 0x00080800, 0x08080800, 0x08080800, 0x00000008, 0x00000008,
+        0x08000008, 0x08000008, 0x00080008, 0x00080008, 0x08080008, 0x08080008,
+        0x00000808, 0x00000808, 0x08000808, 0x08000808, 0x00080808, 0x00080808,
+        0x08080808, 0x08080808, 0x00000000, 0x00000000, 0x08000000, 0x08000000,
+        0x00080000, 0x00080000, 0x08080000, 0x08080000, 0x00000800, 0x00000800,
+        0x08000800, 0x08000800, 0x00080800, 0x00080800, 0x08080800, 0x08080800,
+        0x00000008, 0x00000008, 0x08000008, 0x08000008, 0x00080008, 0x00080008,
+        0x08080008, 0x08080008, 0x00000808, 0x00000808, 0x08000808, 0x08000808,
+        0x00080808, 0x00080808, 0x08080808, 0x08080808, 0x00000000, 0x00000000,
+        0x08000000, 0x08000000, 0x00080000, 0x00080000, 0x08080000, 0x08080000,
+        0x00000800, 0x00000800, 0x08000800, 0x08000800, 0x00080800, 0x00080800,
+        0x08080800, 0x08080800, 0x00000008, 0x00000008, 0x08000008, 0x08000008,
+        0x00080008, 0x00080008, 0x08080008, 0x08080008, 0x00000808, 0x00000808,
+        0x08000808, 0x08000808, 0x00080808, 0x00080808, 0x08080808, 0x08080808,
+        0x00000000, 0x00000000, 0x08000000, 0x08000000, 0x00080000, 0x00080000,
+        0x08080000, 0x08080000, 0x00000800, 0x00000800, 0x08000800, 0x08000800,
+        0x00080800, 0x00080800, 0x08080800, 0x08080800, 0x00000008, 0x00000008,
+        0x08000008, 0x08000008, 0x00080008, 0x00080008, 0x08080008, 0x08080008,
+        0x00000808, 0x00000808, 0x08000808, 0x08000808, 0x00080808, 0x00080808,
+        0x08080808, 0x08080808, 0x00000000, 0x00000000, 0x08000000, 0x08000000,
+        0x00080000, 0x00080000, 0x08080000, 0x08080000, 0x00000800, 0x00000800,
+        0x08000800, 0x08000800, 0x00080800, 0x00080800, 0x08080800, 0x08080800,
+        0x00000008, 0x00000008, 0x08000008, 0x08000008, 0x00080008, 0x00080008,
+        0x08080008, 0x08080008, 0x00000808, 0x00000808, 0x08000808, 0x08000808,
+        0x00080808, 0x00080808, 0x08080808, 0x08080808, 0x00000000, 0x00000000,
+        0x08000000, 0x08000000, 0x00080000, 0x00080000, 0x08080000, 0x08080000,
+        0x00000800, 0x00000800, 0x08000800, 0x08000800, 0x00080800, 0x00080800,
+        0x08080800, 0x08080800, 0x00000008, 0x00000008, 0x08000008, 0x08000008,
+        0x00080008, 0x00080008, 0x08080008, 0x08080008, 0x00000808, 0x00000808,
+        0x08000808, 0x08000808, 0x00080808, 0x00080808, 0x08080808, 0x08080808,
+        0x00000000, 0x00000000, 0x08000000, 0x08000000, 0x00080000, 0x00080000,
+        0x08080000, 0x08080000, 0x00000800, 0x00000800, 0x08000800, 0x08000800,
+        0x00080800, 0x00080800, 0x08080800, 0x08080800, 0x00000008, 0x00000008,
+        0x08000008, 0x08000008, 0x00080008, 0x00080008, 0x08080008, 0x08080008,
+        0x00000808, 0x00000808, 0x08000808, 0x08000808, 0x00080808, 0x00080808,
+        0x08080808, 0x08080808, 0x00000000, 0x00000000, 0x08000000, 0x08000000,
+        0x00080000, 0x00080000, 0x08080000, 0x08080000, 0x00000800, 0x00000800,
+        0x08000800, 0x08000800, 0x00080800, 0x00080800, 0x08080800, 0x08080800,
+        0x00000008, 0x00000008, 0x08000008, 0x08000008, 0x00080008, 0x00080008,
+        0x08080008, 0x08080008, 0x00000808, 0x00000808, 0x08000808, 0x08000808,
+        0x00080808, 0x00080808, 0x08080808, 0x08080808],
+       [0x00000000, 0x00000000, 0x02000000, 0x02000000, 0x00020000, 0x00020000,
+        0x02020000, 0x02020000, 0x00000200, 0x00000200, 0x02000200, 0x02000200,
+        0x00020200, 0x00020200, 0x02020200, 0x02020200, 0x00000002, 0x00000002,
+        0x02000002, 0x02000002, 0x00020002, 0x00020002, 0x02020002, 0x02020002,
+        0x00000202, 0x00000202, 0x02000202, 0x02000202, 0x00020202, 0x00020202,
+        0x02020202, 0x02020202, 0x00000000, 0x00000000, 0x02000000, 0x02000000,
+        0x00020000, 0x00020000, 0x02020000, 0x02020000, 0x00000200, 0x00000200,
+        0x02000200, 0x02000200, 0x00020200, 0x00020200, 0x02020200, 0x02020200,
+        0x00000002, 0x00000002, 0x02000002, 0x02000002, 0x00020002, 0x00020002,
+        0x02020002, 0x02020002, 0x00000202, 0x00000202, 0x02000202, 0x02000202,
+        0x00020202, 0x00020202, 0x02020202, 0x02020202, 0x00000000, 0x00000000,
+        0x02000000, 0x02000000, 0x00020000, 0x00020000, 0x02020000, 0x02020000,
+        0x00000200, 0x00000200, 0x02000200, 0x02000200, 0x00020200, 0x00020200,
+        0x02020200, 0x02020200, 0x00000002, 0x00000002, 0x02000002, 0x02000002,
+        0x00020002, 0x00020002, 0x02020002, 0x02020002, 0x00000202, 0x00000202,
+        0x02000202, 0x02000202, 0x00020202, 0x00020202, 0x02020202, 0x02020202,
+        0x00000000, 0x00000000, 0x02000000, 0x02000000, 0x00020000, 0x00020000,
+        0x02020000, 0x02020000, 0x00000200, 0x00000200, 0x02000200, 0x02000200,
+        0x00020200, 0x00020200, 0x02020200, 0x02020200, 0x00000002, 0x00000002,
+        0x02000002, 0x02000002, 0x00020002, 0x00020002, 0x02020002, 0x02020002,
+        0x00000202, 0x00000202, 0x02000202, 0x02000202, 0x00020202, 0x00020202,
+        0x02020202, 0x02020202, 0x00000000, 0x00000000, 0x02000000, 0x02000000,
+        0x00020000, 0x00020000, 0x02020000, 0x02020000, 0x00000200, 0x00000200,
+        0x02000200, 0x02000200, 0x00020200, 0x00020200, 0x02020200, 0x02020200,
+        0x00000002, 0x00000002, 0x02000002, 0x02000002, 0x00020002, 0x00020002,
+        0x02020002, 0x02020002, 0x00000202, 0x00000202, 0x02000202, 0x02000202,
+        0x00020202, 0x00020202, 0x02020202, 0x02020202, 0x00000000, 0x00000000,
+        0x02000000, 0x02000000, 0x00020000, 0x00020000, 0x02020000, 0x02020000,
+        0x00000200, 0x00000200, 0x02000200, 0x02000200, 0x00020200, 0x00020200,
+        0x02020200, 0x02020200, 0x00000002, 0x00000002, 0x02000002, 0x02000002,
+        0x00020002, 0x00020002, 0x02020002, 0x02020002, 0x00000202, 0x00000202,
+        0x02000202, 0x02000202, 0x00020202, 0x00020202, 0x02020202, 0x02020202,
+        0x00000000, 0x00000000, 0x02000000, 0x02000000, 0x00020000, 0x00020000,
+        0x02020000, 0x02020000, 0x00000200, 0x00000200, 0x02000200, 0x02000200,
+        0x00020200, 0x00020200, 0x02020200, 0x02020200, 0x00000002, 0x00000002,
+        0x02000002, 0x02000002, 0x00020002, 0x00020002, 0x02020002, 0x02020002,
+        0x00000202, 0x00000202, 0x02000202, 0x02000202, 0x00020202, 0x00020202,
+        0x02020202, 0x02020202, 0x00000000, 0x00000000, 0x02000000, 0x02000000,
+        0x00020000, 0x00020000, 0x02020000, 0x02020000, 0x00000200, 0x00000200,
+        0x02000200, 0x02000200, 0x00020200, 0x00020200, 0x02020200, 0x02020200,
+        0x00000002, 0x00000002, 0x02000002, 0x02000002, 0x00020002, 0x00020002,
+        0x02020002, 0x02020002, 0x00000202, 0x00000202, 0x02000202, 0x02000202,
+        0x00020202, 0x00020202, 0x02020202, 0x02020202]]
+
+FPL = [[0x00000000, 0x00000010, 0x00000000, 0x00000010, 0x00000000, 0x00000010,
+        0x00000000, 0x00000010, 0x00000000, 0x00000010, 0x00000000, 0x00000010,
+        0x00000000, 0x00000010, 0x00000000, 0x00000010, 0x00000000, 0x00000010,
+        0x00000000, 0x00000010, 0x00000000, 0x00000010, 0x00000000, 0x00000010,
+        0x00000000, 0x00000010, 0x00000000, 0x00000010, 0x00000000, 0x00000010,
+        0x00000000, 0x00000010, 0x40000000, 0x40000010, 0x40000000, 0x40000010,
+        0x40000000, 0x40000010, 0x40000000, 0x40000010, 0x40000000, 0x40000010,
+        0x40000000, 0x40000010, 0x40000000, 0x40000010, 0x40000000, 0x40000010,
+        0x40000000, 0x40000010, 0x40000000, 0x40000010, 0x40000000, 0x40000010,
+        0x40000000, 0x40000010, 0x40000000, 0x40000010, 0x40000000, 0x40000010,
+        0x40000000, 0x40000010, 0x40000000, 0x40000010, 0x00400000, 0x00400010,
+        0x00400000, 0x00400010, 0x00400000, 0x00400010, 0x00400000, 0x00400010,
+        0x00400000, 0x00400010, 0x00400000, 0x00400010, 0x00400000, 0x00400010,
+        0x00400000, 0x00400010, 0x00400000, 0x00400010, 0x00400000, 0x00400010,
+        0x00400000, 0x00400010, 0x00400000, 0x00400010, 0x00400000, 0x00400010,
+        0x00400000, 0x00400010, 0x00400000, 0x00400010, 0x00400000, 0x00400010,
+        0x40400000, 0x40400010, 0x40400000, 0x40400010, 0x40400000, 0x40400010,
+        0x40400000, 0x40400010, 0x40400000, 0x40400010, 0x40400000, 0x40400010,
+        0x40400000, 0x40400010, 0x40400000, 0x40400010, 0x40400000, 0x40400010,
+        0x40400000, 0x40400010, 0x40400000, 0x40400010, 0x40400000, 0x40400010,
+        0x40400000, 0x40400010, 0x40400000, 0x40400010, 0x40400000, 0x40400010,
+        0x40400000, 0x40400010, 0x00004000, 0x00004010, 0x00004000, 0x00004010,
+        0x00004000, 0x00004010, 0x00004000, 0x00004010, 0x00004000, 0x00004010,
+        0x00004000, 0x00004010, 0x00004000, 0x00004010, 0x00004000, 0x00004010,
+        0x00004000, 0x00004010, 0x00004000, 0x00004010, 0x00004000, 0x00004010,
+        0x00004000, 0x00004010, 0x00004000, 0x00004010, 0x00004000, 0x00004010,
+        0x00004000, 0x00004010, 0x00004000, 0x00004010, 0x40004000, 0x40004010,
+        0x40004000, 0x40004010, 0x40004000, 0x40004010, 0x40004000, 0x40004010,
+        0x40004000, 0x40004010, 0x40004000, 0x40004010, 0x40004000, 0x40004010,
+        0x40004000, 0x40004010, 0x40004000, 0x40004010, 0x40004000, 0x40004010,
+        0x40004000, 0x40004010, 0x40004000, 0x40004010, 0x40004000, 0x40004010,
+        0x40004000, 0x40004010, 0x40004000, 0x40004010, 0x40004000, 0x40004010,
+        0x00404000, 0x00404010, 0x00404000, 0x00404010, 0x00404000, 0x00404010,
+        0x00404000, 0x00404010, 0x00404000, 0x00404010, 0x00404000, 0x00404010,
+        0x00404000, 0x00404010, 0x00404000, 0x00404010, 0x00404000, 0x00404010,
+        0x00404000, 0x00404010, 0x00404000, 0x00404010, 0x00404000, 0x00404010,
+        0x00404000, 0x00404010, 0x00404000, 0x00404010, 0x00404000, 0x00404010,
+        0x00404000, 0x00404010, 0x40404000, 0x40404010, 0x40404000, 0x40404010,
+        0x40404000, 0x40404010, 0x40404000, 0x40404010, 0x40404000, 0x40404010,
+        0x40404000, 0x40404010, 0x40404000, 0x40404010, 0x40404000, 0x40404010,
+        0x40404000, 0x40404010, 0x40404000, 0x40404010, 0x40404000, 0x40404010,
+        0x40404000, 0x40404010, 0x40404000, 0x40404010, 0x40404000, 0x40404010,
+        0x40404000, 0x40404010, 0x40404000, 0x40404010],
+       [0x00000000, 0x00000004, 0x00000000, 0x00000004, 0x00000000, 0x00000004,
+        0x00000000, 0x00000004, 0x00000000, 0x00000004, 0x00000000, 0x00000004,
+        0x00000000, 0x00000004, 0x00000000, 0x00000004, 0x00000000, 0x00000004,
+        0x00000000, 0x00000004, 0x00000000, 0x00000004, 0x00000000, 0x00000004,
+        0x00000000, 0x00000004, 0x00000000, 0x00000004, 0x00000000, 0x00000004,
+        0x00000000, 0x00000004, 0x10000000, 0x10000004, 0x10000000, 0x10000004,
+        0x10000000, 0x10000004, 0x10000000, 0x10000004, 0x10000000, 0x10000004,
+        0x10000000, 0x10000004, 0x10000000, 0x10000004, 0x10000000, 0x10000004,
+        0x10000000, 0x10000004, 0x10000000, 0x10000004, 0x10000000, 0x10000004,
+        0x10000000, 0x10000004, 0x10000000, 0x10000004, 0x10000000, 0x10000004,
+        0x10000000, 0x10000004, 0x10000000, 0x10000004, 0x00100000, 0x00100004,
+        0x00100000, 0x00100004, 0x00100000, 0x00100004, 0x00100000, 0x00100004,
+        0x00100000, 0x00100004, 0x00100000, 0x00100004, 0x00100000, 0x00100004,
+        0x00100000, 0x00100004, 0x00100000, 0x00100004, 0x00100000, 0x00100004,
+        0x00100000, 0x00100004, 0x00100000, 0x00100004, 0x00100000, 0x00100004,
+        0x00100000, 0x00100004, 0x00100000, 0x00100004, 0x00100000, 0x00100004,
+        0x10100000, 0x10100004, 0x10100000, 0x10100004, 0x10100000, 0x10100004,
+        0x10100000, 0x10100004, 0x10100000, 0x10100004, 0x10100000, 0x10100004,
+        0x10100000, 0x10100004, 0x10100000, 0x10100004, 0x10100000, 0x10100004,
+        0x10100000, 0x10100004, 0x10100000, 0x10100004, 0x10100000, 0x10100004,
+        0x10100000, 0x10100004, 0x10100000, 0x10100004, 0x10100000, 0x10100004,
+        0x10100000, 0x10100004, 0x00001000, 0x00001004, 0x00001000, 0x00001004,
+        0x00001000, 0x00001004, 0x00001000, 0x00001004, 0x00001000, 0x00001004,
+        0x00001000, 0x00001004, 0x00001000, 0x00001004, 0x00001000, 0x00001004,
+        0x00001000, 0x00001004, 0x00001000, 0x00001004, 0x00001000, 0x00001004,
+        0x00001000, 0x00001004, 0x00001000, 0x00001004, 0x00001000, 0x00001004,
+        0x00001000, 0x00001004, 0x00001000, 0x00001004, 0x10001000, 0x10001004,
+        0x10001000, 0x10001004, 0x10001000, 0x10001004, 0x10001000, 0x10001004,
+        0x10001000, 0x10001004, 0x10001000, 0x10001004, 0x10001000, 0x10001004,
+        0x10001000, 0x10001004, 0x10001000, 0x10001004, 0x10001000, 0x10001004,
+        0x10001000, 0x10001004, 0x10001000, 0x10001004, 0x10001000, 0x10001004,
+        0x10001000, 0x10001004, 0x10001000, 0x10001004, 0x10001000, 0x10001004,
+        0x00101000, 0x00101004, 0x00101000, 0x00101004, 0x00101000, 0x00101004,
+        0x00101000, 0x00101004, 0x00101000, 0x00101004, 0x00101000, 0x00101004,
+        0x00101000, 0x00101004, 0x00101000, 0x00101004, 0x00101000, 0x00101004,
+        0x00101000, 0x00101004, 0x00101000, 0x00101004, 0x00101000, 0x00101004,
+        0x00101000, 0x00101004, 0x00101000, 0x00101004, 0x00101000, 0x00101004,
+        0x00101000, 0x00101004, 0x10101000, 0x10101004, 0x10101000, 0x10101004,
+        0x10101000, 0x10101004, 0x10101000, 0x10101004, 0x10101000, 0x10101004,
+        0x10101000, 0x10101004, 0x10101000, 0x10101004, 0x10101000, 0x10101004,
+        0x10101000, 0x10101004, 0x10101000, 0x10101004, 0x10101000, 0x10101004,
+        0x10101000, 0x10101004, 0x10101000, 0x10101004, 0x10101000, 0x10101004,
+        0x10101000, 0x10101004, 0x10101000, 0x10101004],
+       [0x00000000, 0x00000001, 0x00000000, 0x00000001, 0x00000000, 0x00000001,
+        0x00000000, 0x00000001, 0x00000000, 0x00000001, 0x00000000, 0x00000001,
+        0x00000000, 0x00000001, 0x00000000, 0x00000001, 0x00000000, 0x00000001,
+        0x00000000, 0x00000001, 0x00000000, 0x00000001, 0x00000000, 0x00000001,
+        0x00000000, 0x00000001, 0x00000000, 0x00000001, 0x00000000, 0x00000001,
+        0x00000000, 0x00000001, 0x04000000, 0x04000001, 0x04000000, 0x04000001,
+        0x04000000, 0x04000001, 0x04000000, 0x04000001, 0x04000000, 0x04000001,
+        0x04000000, 0x04000001, 0x04000000, 0x04000001, 0x04000000, 0x04000001,
+        0x04000000, 0x04000001, 0x04000000, 0x04000001, 0x04000000, 0x04000001,
+        0x04000000, 0x04000001, 0x04000000, 0x04000001, 0x04000000, 0x04000001,
+        0x04000000, 0x04000001, 0x04000000, 0x04000001, 0x00040000, 0x00040001,
+        0x00040000, 0x00040001, 0x00040000, 0x00040001, 0x00040000, 0x00040001,
+        0x00040000, 0x00040001, 0x00040000, 0x00040001, 0x00040000, 0x00040001,
+        0x00040000, 0x00040001, 0x00040000, 0x00040001, 0x00040000, 0x00040001,
+        0x00040000, 0x00040001, 0x00040000, 0x00040001, 0x00040000, 0x00040001,
+        0x00040000, 0x00040001, 0x00040000, 0x00040001, 0x00040000, 0x00040001,
+        0x04040000, 0x04040001, 0x04040000, 0x04040001, 0x04040000, 0x04040001,
+        0x04040000, 0x04040001, 0x04040000, 0x04040001, 0x04040000, 0x04040001,
+        0x04040000, 0x04040001, 0x04040000, 0x04040001, 0x04040000, 0x04040001,
+        0x04040000, 0x04040001, 0x04040000, 0x04040001, 0x04040000, 0x04040001,
+        0x04040000, 0x04040001, 0x04040000, 0x04040001, 0x04040000, 0x04040001,
+        0x04040000, 0x04040001, 0x00000400, 0x00000401, 0x00000400, 0x00000401,
+        0x00000400, 0x00000401, 0x00000400, 0x00000401, 0x00000400, 0x00000401,
+        0x00000400, 0x00000401, 0x00000400, 0x00000401, 0x00000400, 0x00000401,
+        0x00000400, 0x00000401, 0x00000400, 0x00000401, 0x00000400, 0x00000401,
+        0x00000400, 0x00000401, 0x00000400, 0x00000401, 0x00000400, 0x00000401,
+        0x00000400, 0x00000401, 0x00000400, 0x00000401, 0x04000400, 0x04000401,
+        0x04000400, 0x04000401, 0x04000400, 0x04000401, 0x04000400, 0x04000401,
+        0x04000400, 0x04000401, 0x04000400, 0x04000401, 0x04000400, 0x04000401,
+        0x04000400, 0x04000401, 0x04000400, 0x04000401, 0x04000400, 0x04000401,
+        0x04000400, 0x04000401, 0x04000400, 0x04000401, 0x04000400, 0x04000401,
+        0x04000400, 0x04000401, 0x04000400, 0x04000401, 0x04000400, 0x04000401,
+        0x00040400, 0x00040401, 0x00040400, 0x00040401, 0x00040400, 0x00040401,
+        0x00040400, 0x00040401, 0x00040400, 0x00040401, 0x00040400, 0x00040401,
+        0x00040400, 0x00040401, 0x00040400, 0x00040401, 0x00040400, 0x00040401,
+        0x00040400, 0x00040401, 0x00040400, 0x00040401, 0x00040400, 0x00040401,
+        0x00040400, 0x00040401, 0x00040400, 0x00040401, 0x00040400, 0x00040401,
+        0x00040400, 0x00040401, 0x04040400, 0x04040401, 0x04040400, 0x04040401,
+        0x04040400, 0x04040401, 0x04040400, 0x04040401, 0x04040400, 0x04040401,
+        0x04040400, 0x04040401, 0x04040400, 0x04040401, 0x04040400, 0x04040401,
+        0x04040400, 0x04040401, 0x04040400, 0x04040401, 0x04040400, 0x04040401,
+        0x04040400, 0x04040401, 0x04040400, 0x04040401, 0x04040400, 0x04040401,
+        0x04040400, 0x04040401, 0x04040400, 0x04040401],
+       [0x00000000, 0x00000040, 0x00000000, 0x00000040, 0x00000000, 0x00000040,
+        0x00000000, 0x00000040, 0x00000000, 0x00000040, 0x00000000, 0x00000040,
+        0x00000000, 0x00000040, 0x00000000, 0x00000040, 0x00000000, 0x00000040,
+        0x00000000, 0x00000040, 0x00000000, 0x00000040, 0x00000000, 0x00000040,
+        0x00000000, 0x00000040, 0x00000000, 0x00000040, 0x00000000, 0x00000040,
+        0x00000000, 0x00000040, 0x01000000, 0x01000040, 0x01000000, 0x01000040,
+        0x01000000, 0x01000040, 0x01000000, 0x01000040, 0x01000000, 0x01000040,
+        0x01000000, 0x01000040, 0x01000000, 0x01000040, 0x01000000, 0x01000040,
+        0x01000000, 0x01000040, 0x01000000, 0x01000040, 0x01000000, 0x01000040,
+        0x01000000, 0x01000040, 0x01000000, 0x01000040, 0x01000000, 0x01000040,
+        0x01000000, 0x01000040, 0x01000000, 0x01000040, 0x00010000, 0x00010040,
+        0x00010000, 0x00010040, 0x00010000, 0x00010040, 0x00010000, 0x00010040,
+        0x00010000, 0x00010040, 0x00010000, 0x00010040, 0x00010000, 0x00010040,
+        0x00010000, 0x00010040, 0x00010000, 0x00010040, 0x00010000, 0x00010040,
+        0x00010000, 0x00010040, 0x00010000, 0x00010040, 0x00010000, 0x00010040,
+        0x00010000, 0x00010040, 0x00010000, 0x00010040, 0x00010000, 0x00010040,
+        0x01010000, 0x01010040, 0x01010000, 0x01010040, 0x01010000, 0x01010040,
+        0x01010000, 0x01010040, 0x01010000, 0x01010040, 0x01010000, 0x01010040,
+        0x01010000, 0x01010040, 0x01010000, 0x01010040, 0x01010000, 0x01010040,
+        0x01010000, 0x01010040, 0x01010000, 0x01010040, 0x01010000, 0x01010040,
+        0x01010000, 0x01010040, 0x01010000, 0x01010040, 0x01010000, 0x01010040,
+        0x01010000, 0x01010040, 0x00000100, 0x00000140, 0x00000100, 0x00000140,
+        0x00000100, 0x00000140, 0x00000100, 0x00000140, 0x00000100, 0x00000140,
+        0x00000100, 0x00000140, 0x00000100, 0x00000140, 0x00000100, 0x00000140,
+        0x00000100, 0x00000140, 0x00000100, 0x00000140, 0x00000100, 0x00000140,
+        0x00000100, 0x00000140, 0x00000100, 0x00000140, 0x00000100, 0x00000140,
+        0x00000100, 0x00000140, 0x00000100, 0x00000140, 0x01000100, 0x01000140,
+        0x01000100, 0x01000140, 0x01000100, 0x01000140, 0x01000100, 0x01000140,
+        0x01000100, 0x01000140, 0x01000100, 0x01000140, 0x01000100, 0x01000140,
+        0x01000100, 0x01000140, 0x01000100, 0x01000140, 0x01000100, 0x01000140,
+        0x01000100, 0x01000140, 0x01000100, 0x01000140, 0x01000100, 0x01000140,
+        0x01000100, 0x01000140, 0x01000100, 0x01000140, 0x01000100, 0x01000140,
+        0x00010100, 0x00010140, 0x00010100, 0x00010140, 0x00010100, 0x00010140,
+        0x00010100, 0x00010140, 0x00010100, 0x00010140, 0x00010100, 0x00010140,
+        0x00010100, 0x00010140, 0x00010100, 0x00010140, 0x00010100, 0x00010140,
+        0x00010100, 0x00010140, 0x00010100, 0x00010140, 0x00010100, 0x00010140,
+        0x00010100, 0x00010140, 0x00010100, 0x00010140, 0x00010100, 0x00010140,
+        0x00010100, 0x00010140, 0x01010100, 0x01010140, 0x01010100, 0x01010140,
+        0x01010100, 0x01010140, 0x01010100, 0x01010140, 0x01010100, 0x01010140,
+        0x01010100, 0x01010140, 0x01010100, 0x01010140, 0x01010100, 0x01010140,
+        0x01010100, 0x01010140, 0x01010100, 0x01010140, 0x01010100, 0x01010140,
+        0x01010100, 0x01010140, 0x01010100, 0x01010140, 0x01010100, 0x01010140,
+        0x01010100, 0x01010140, 0x01010100, 0x01010140],
+       [0x00000000, 0x00000020, 0x00000000, 0x00000020, 0x00000000, 0x00000020,
+        0x00000000, 0x00000020, 0x00000000, 0x00000020, 0x00000000, 0x00000020,
+        0x00000000, 0x00000020, 0x00000000, 0x00000020, 0x00000000, 0x00000020,
+        0x00000000, 0x00000020, 0x00000000, 0x00000020, 0x00000000, 0x00000020,
+        0x00000000, 0x00000020, 0x00000000, 0x00000020, 0x00000000, 0x00000020,
+        0x00000000, 0x00000020, 0x80000000, 0x80000020, 0x80000000, 0x80000020,
+        0x80000000, 0x80000020, 0x80000000, 0x80000020, 0x80000000, 0x80000020,
+        0x80000000, 0x80000020, 0x80000000, 0x80000020, 0x80000000, 0x80000020,
+        0x80000000, 0x80000020, 0x80000000, 0x80000020, 0x80000000, 0x80000020,
+        0x80000000, 0x80000020, 0x80000000, 0x80000020, 0x80000000, 0x80000020,
+        0x80000000, 0x80000020, 0x80000000, 0x80000020, 0x00800000, 0x00800020,
+        0x00800000, 0x00800020, 0x00800000, 0x00800020, 0x00800000, 0x00800020,
+        0x00800000, 0x00800020, 0x00800000, 0x00800020, 0x00800000, 0x00800020,
+        0x00800000, 0x00800020, 0x00800000, 0x00800020, 0x00800000, 0x00800020,
+        0x00800000, 0x00800020, 0x00800000, 0x00800020, 0x00800000, 0x00800020,
+        0x00800000, 0x00800020, 0x00800000, 0x00800020, 0x00800000, 0x00800020,
+        0x80800000, 0x80800020, 0x80800000, 0x80800020, 0x80800000, 0x80800020,
+        0x80800000, 0x80800020, 0x80800000, 0x80800020, 0x80800000, 0x80800020,
+        0x80800000, 0x80800020, 0x80800000, 0x80800020, 0x80800000, 0x80800020,
+        0x80800000, 0x80800020, 0x80800000, 0x80800020, 0x80800000, 0x80800020,
+        0x80800000, 0x80800020, 0x80800000, 0x80800020, 0x80800000, 0x80800020,
+        0x80800000, 0x80800020, 0x00008000, 0x00008020, 0x00008000, 0x00008020,
+        0x00008000, 0x00008020, 0x00008000, 0x00008020, 0x00008000, 0x00008020,
+        0x00008000, 0x00008020, 0x00008000, 0x00008020, 0x00008000, 0x00008020,
+        0x00008000, 0x00008020, 0x00008000, 0x00008020, 0x00008000, 0x00008020,
+        0x00008000, 0x00008020, 0x00008000, 0x00008020, 0x00008000, 0x00008020,
+        0x00008000, 0x00008020, 0x00008000, 0x00008020, 0x80008000, 0x80008020,
+        0x80008000, 0x80008020, 0x80008000, 0x80008020, 0x80008000, 0x80008020,
+        0x80008000, 0x80008020, 0x80008000, 0x80008020, 0x80008000, 0x80008020,
+        0x80008000, 0x80008020, 0x80008000, 0x80008020, 0x80008000, 0x80008020,
+        0x80008000, 0x80008020, 0x80008000, 0x80008020, 0x80008000, 0x80008020,
+        0x80008000, 0x80008020, 0x80008000, 0x80008020, 0x80008000, 0x80008020,
+        0x00808000, 0x00808020, 0x00808000, 0x00808020, 0x00808000, 0x00808020,
+        0x00808000, 0x00808020, 0x00808000, 0x00808020, 0x00808000, 0x00808020,
+        0x00808000, 0x00808020, 0x00808000, 0x00808020, 0x00808000, 0x00808020,
+        0x00808000, 0x00808020, 0x00808000, 0x00808020, 0x00808000, 0x00808020,
+        0x00808000, 0x00808020, 0x00808000, 0x00808020, 0x00808000, 0x00808020,
+        0x00808000, 0x00808020, 0x80808000, 0x80808020, 0x80808000, 0x80808020,
+        0x80808000, 0x80808020, 0x80808000, 0x80808020, 0x80808000, 0x80808020,
+        0x80808000, 0x80808020, 0x80808000, 0x80808020, 0x80808000, 0x80808020,
+        0x80808000, 0x80808020, 0x80808000, 0x80808020, 0x80808000, 0x80808020,
+        0x80808000, 0x80808020, 0x80808000, 0x80808020, 0x80808000, 0x80808020,
+        0x80808000, 0x80808020, 0x80808000, 0x80808020],
+       [0x00000000, 0x00000008, 0x00000000, 0x00000008, 0x00000000, 0x00000008,
+        0x00000000, 0x00000008, 0x00000000, 0x00000008, 0x00000000, 0x00000008,
+        0x00000000, 0x00000008, 0x00000000, 0x00000008, 0x00000000, 0x00000008,
+        0x00000000, 0x00000008, 0x00000000, 0x00000008, 0x00000000, 0x00000008,
+        0x00000000, 0x00000008, 0x00000000, 0x00000008, 0x00000000, 0x00000008,
+        0x00000000, 0x00000008, 0x20000000, 0x20000008, 0x20000000, 0x20000008,
+        0x20000000, 0x20000008, 0x20000000, 0x20000008, 0x20000000, 0x20000008,
+        0x20000000, 0x20000008, 0x20000000, 0x20000008, 0x20000000, 0x20000008,
+        0x20000000, 0x20000008, 0x20000000, 0x20000008, 0x20000000, 0x20000008,
+        0x20000000, 0x20000008, 0x20000000, 0x20000008, 0x20000000, 0x20000008,
+        0x20000000, 0x20000008, 0x20000000, 0x20000008, 0x00200000, 0x00200008,
+        0x00200000, 0x00200008, 0x00200000, 0x00200008, 0x00200000, 0x00200008,
+        0x00200000, 0x00200008, 0x00200000, 0x00200008, 0x00200000, 0x00200008,
+        0x00200000, 0x00200008, 0x00200000, 0x00200008, 0x00200000, 0x00200008,
+        0x00200000, 0x00200008, 0x00200000, 0x00200008, 0x00200000, 0x00200008,
+        0x00200000, 0x00200008, 0x00200000, 0x00200008, 0x00200000, 0x00200008,
+        0x20200000, 0x20200008, 0x20200000, 0x20200008, 0x20200000, 0x20200008,
+        0x20200000, 0x20200008, 0x20200000, 0x20200008, 0x20200000, 0x20200008,
+        0x20200000, 0x20200008, 0x20200000, 0x20200008, 0x20200000, 0x20200008,
+        0x20200000, 0x20200008, 0x20200000, 0x20200008, 0x20200000, 0x20200008,
+        0x20200000, 0x20200008, 0x20200000, 0x20200008, 0x20200000, 0x20200008,
+        0x20200000, 0x20200008, 0x00002000, 0x00002008, 0x00002000, 0x00002008,
+        0x00002000, 0x00002008, 0x00002000, 0x00002008, 0x00002000, 0x00002008,
+        0x00002000, 0x00002008, 0x00002000, 0x00002008, 0x00002000, 0x00002008,
+        0x00002000, 0x00002008, 0x00002000, 0x00002008, 0x00002000, 0x00002008,
+        0x00002000, 0x00002008, 0x00002000, 0x00002008, 0x00002000, 0x00002008,
+        0x00002000, 0x00002008, 0x00002000, 0x00002008, 0x20002000, 0x20002008,
+        0x20002000, 0x20002008, 0x20002000, 0x20002008, 0x20002000, 0x20002008,
+        0x20002000, 0x20002008, 0x20002000, 0x20002008, 0x20002000, 0x20002008,
+        0x20002000, 0x20002008, 0x20002000, 0x20002008, 0x20002000, 0x20002008,
+        0x20002000, 0x20002008, 0x20002000, 0x20002008, 0x20002000, 0x20002008,
+        0x20002000, 0x20002008, 0x20002000, 0x20002008, 0x20002000, 0x20002008,
+        0x00202000, 0x00202008, 0x00202000, 0x00202008, 0x00202000, 0x00202008,
+        0x00202000, 0x00202008, 0x00202000, 0x00202008, 0x00202000, 0x00202008,
+        0x00202000, 0x00202008, 0x00202000, 0x00202008, 0x00202000, 0x00202008,
+        0x00202000, 0x00202008, 0x00202000, 0x00202008, 0x00202000, 0x00202008,
+        0x00202000, 0x00202008, 0x00202000, 0x00202008, 0x00202000, 0x00202008,
+        0x00202000, 0x00202008, 0x20202000, 0x20202008, 0x20202000, 0x20202008,
+        0x20202000, 0x20202008, 0x20202000, 0x20202008, 0x20202000, 0x20202008,
+        0x20202000, 0x20202008, 0x20202000, 0x20202008, 0x20202000, 0x20202008,
+        0x20202000, 0x20202008, 0x20202000, 0x20202008, 0x20202000, 0x20202008,
+        0x20202000, 0x20202008, 0x20202000, 0x20202008, 0x20202000, 0x20202008,
+        0x20202000, 0x20202008, 0x20202000, 0x20202008],
+       [0x00000000, 0x00000002, 0x00000000, 0x00000002, 0x00000000, 0x00000002,
+        0x00000000, 0x00000002, 0x00000000, 0x00000002, 0x00000000, 0x00000002,
+        0x00000000, 0x00000002, 0x00000000, 0x00000002, 0x00000000, 0x00000002,
+        0x00000000, 0x00000002, 0x00000000, 0x00000002, 0x00000000, 0x00000002,
+        0x00000000, 0x00000002, 0x00000000, 0x00000002, 0x00000000, 0x00000002,
+        0x00000000, 0x00000002, 0x08000000, 0x08000002, 0x08000000, 0x08000002,
+        0x08000000, 0x08000002, 0x08000000, 0x08000002, 0x08000000, 0x08000002,
+        0x08000000, 0x08000002, 0x08000000, 0x08000002, 0x08000000, 0x08000002,
+        0x08000000, 0x08000002, 0x08000000, 0x08000002, 0x08000000, 0x08000002,
+        0x08000000, 0x08000002, 0x08000000, 0x08000002, 0x08000000, 0x08000002,
+        0x08000000, 0x08000002, 0x08000000, 0x08000002, 0x00080000, 0x00080002,
+        0x00080000, 0x00080002, 0x00080000, 0x00080002, 0x00080000, 0x00080002,
+        0x00080000, 0x00080002, 0x00080000, 0x00080002, 0x00080000, 0x00080002,
+        0x00080000, 0x00080002, 0x00080000, 0x00080002, 0x00080000, 0x00080002,
+        0x00080000, 0x00080002, 0x00080000, 0x00080002, 0x00080000, 0x00080002,
+        0x00080000, 0x00080002, 0x00080000, 0x00080002, 0x00080000, 0x00080002,
+        0x08080000, 0x08080002, 0x08080000, 0x08080002, 0x08080000, 0x08080002,
+        0x08080000, 0x08080002, 0x08080000, 0x08080002, 0x08080000, 0x08080002,
+        0x08080000, 0x08080002, 0x08080000, 0x08080002, 0x08080000, 0x08080002,
+        0x08080000, 0x08080002, 0x08080000, 0x08080002, 0x08080000, 0x08080002,
+        0x08080000, 0x08080002, 0x08080000, 0x08080002, 0x08080000, 0x08080002,
+        0x08080000, 0x08080002, 0x00000800, 0x00000802, 0x00000800, 0x00000802,
+        0x00000800, 0x00000802, 0x00000800, 0x00000802, 0x00000800, 0x00000802,
+        0x00000800, 0x00000802, 0x00000800, 0x00000802, 0x00000800, 0x00000802,
+        0x00000800, 0x00000802, 0x00000800, 0x00000802, 0x00000800, 0x00000802,
+        0x00000800, 0x00000802, 0x00000800, 0x00000802, 0x00000800, 0x00000802,
+        0x00000800, 0x00000802, 0x00000800, 0x00000802, 0x08000800, 0x08000802,
+        0x08000800, 0x08000802, 0x08000800, 0x08000802, 0x08000800, 0x08000802,
+        0x08000800, 0x08000802, 0x08000800, 0x08000802, 0x08000800, 0x08000802,
+        0x08000800, 0x08000802, 0x08000800, 0x08000802, 0x08000800, 0x08000802,
+        0x08000800, 0x08000802, 0x08000800, 0x08000802, 0x08000800, 0x08000802,
+        0x08000800, 0x08000802, 0x08000800, 0x08000802, 0x08000800, 0x08000802,
+        0x00080800, 0x00080802, 0x00080800, 0x00080802, 0x00080800, 0x00080802,
+        0x00080800, 0x00080802, 0x00080800, 0x00080802, 0x00080800, 0x00080802,
+        0x00080800, 0x00080802, 0x00080800, 0x00080802, 0x00080800, 0x00080802,
+        0x00080800, 0x00080802, 0x00080800, 0x00080802, 0x00080800, 0x00080802,
+        0x00080800, 0x00080802, 0x00080800, 0x00080802, 0x00080800, 0x00080802,
+        0x00080800, 0x00080802, 0x08080800, 0x08080802, 0x08080800, 0x08080802,
+        0x08080800, 0x08080802, 0x08080800, 0x08080802, 0x08080800, 0x08080802,
+        0x08080800, 0x08080802, 0x08080800, 0x08080802, 0x08080800, 0x08080802,
+        0x08080800, 0x08080802, 0x08080800, 0x08080802, 0x08080800, 0x08080802,
+        0x08080800, 0x08080802, 0x08080800, 0x08080802, 0x08080800, 0x08080802,
+        0x08080800, 0x08080802, 0x08080800, 0x08080802],
+       [0x00000000, 0x00000080, 0x00000000, 0x00000080, 0x00000000, 0x00000080,
+        0x00000000, 0x00000080, 0x00000000, 0x00000080, 0x00000000, 0x00000080,
+        0x00000000, 0x00000080, 0x00000000, 0x00000080, 0x00000000, 0x00000080,
+        0x00000000, 0x00000080, 0x00000000, 0x00000080, 0x00000000, 0x00000080,
+        0x00000000, 0x00000080, 0x00000000, 0x00000080, 0x00000000, 0x00000080,
+        0x00000000, 0x00000080, 0x02000000, 0x02000080, 0x02000000, 0x02000080,
+        0x02000000, 0x02000080, 0x02000000, 0x02000080, 0x02000000, 0x02000080,
+        0x02000000, 0x02000080, 0x02000000, 0x02000080, 0x02000000, 0x02000080,
+        0x02000000, 0x02000080, 0x02000000, 0x02000080, 0x02000000, 0x02000080,
+        0x02000000, 0x02000080, 0x02000000, 0x02000080, 0x02000000, 0x02000080,
+        0x02000000, 0x02000080, 0x02000000, 0x02000080, 0x00020000, 0x00020080,
+        0x00020000, 0x00020080, 0x00020000, 0x00020080, 0x00020000, 0x00020080,
+        0x00020000, 0x00020080, 0x00020000, 0x00020080, 0x00020000, 0x00020080,
+        0x00020000, 0x00020080, 0x00020000, 0x00020080, 0x00020000, 0x00020080,
+        0x00020000, 0x00020080, 0x00020000, 0x00020080, 0x00020000, 0x00020080,
+        0x00020000, 0x00020080, 0x00020000, 0x00020080, 0x00020000, 0x00020080,
+        0x02020000, 0x02020080, 0x02020000, 0x02020080, 0x02020000, 0x02020080,
+        0x02020000, 0x02020080, 0x02020000, 0x02020080, 0x02020000, 0x02020080,
+        0x02020000, 0x02020080, 0x02020000, 0x02020080, 0x02020000, 0x02020080,
+        0x02020000, 0x02020080, 0x02020000, 0x02020080, 0x02020000, 0x02020080,
+        0x02020000, 0x02020080, 0x02020000, 0x02020080, 0x02020000, 0x02020080,
+        0x02020000, 0x02020080, 0x00000200, 0x00000280, 0x00000200, 0x00000280,
+        0x00000200, 0x00000280, 0x00000200, 0x00000280, 0x00000200, 0x00000280,
+        0x00000200, 0x00000280, 0x00000200, 0x00000280, 0x00000200, 0x00000280,
+        0x00000200, 0x00000280, 0x00000200, 0x00000280, 0x00000200, 0x00000280,
+        0x00000200, 0x00000280, 0x00000200, 0x00000280, 0x00000200, 0x00000280,
+        0x00000200, 0x00000280, 0x00000200, 0x00000280, 0x02000200, 0x02000280,
+        0x02000200, 0x02000280, 0x02000200, 0x02000280, 0x02000200, 0x02000280,
+        0x02000200, 0x02000280, 0x02000200, 0x02000280, 0x02000200, 0x02000280,
+        0x02000200, 0x02000280, 0x02000200, 0x02000280, 0x02000200, 0x02000280,
+        0x02000200, 0x02000280, 0x02000200, 0x02000280, 0x02000200, 0x02000280,
+        0x02000200, 0x02000280, 0x02000200, 0x02000280, 0x02000200, 0x02000280,
+        0x00020200, 0x00020280, 0x00020200, 0x00020280, 0x00020200, 0x00020280,
+        0x00020200, 0x00020280, 0x00020200, 0x00020280, 0x00020200, 0x00020280,
+        0x00020200, 0x00020280, 0x00020200, 0x00020280, 0x00020200, 0x00020280,
+        0x00020200, 0x00020280, 0x00020200, 0x00020280, 0x00020200, 0x00020280,
+        0x00020200, 0x00020280, 0x00020200, 0x00020280, 0x00020200, 0x00020280,
+        0x00020200, 0x00020280, 0x02020200, 0x02020280, 0x02020200, 0x02020280,
+        0x02020200, 0x02020280, 0x02020200, 0x02020280, 0x02020200, 0x02020280,
+        0x02020200, 0x02020280, 0x02020200, 0x02020280, 0x02020200, 0x02020280,
+        0x02020200, 0x02020280, 0x02020200, 0x02020280, 0x02020200, 0x02020280,
+        0x02020200, 0x02020280, 0x02020200, 0x02020280, 0x02020200, 0x02020280,
+        0x02020200, 0x02020280, 0x02020200, 0x02020280]]
+
+SP1 = [0x01010400, 0x00000000, 0x00010000, 0x01010404, 0x01010004, 0x00010404,
+       0x00000004, 0x00010000, 0x00000400, 0x01010400, 0x01010404, 0x00000400,
+       0x01000404, 0x01010004, 0x01000000, 0x00000004, 0x00000404, 0x01000400,
+       0x01000400, 0x00010400, 0x00010400, 0x01010000, 0x01010000, 0x01000404,
+       0x00010004, 0x01000004, 0x01000004, 0x00010004, 0x00000000, 0x00000404,
+       0x00010404, 0x01000000, 0x00010000, 0x01010404, 0x00000004, 0x01010000,
+       0x01010400, 0x01000000, 0x01000000, 0x00000400, 0x01010004, 0x00010000,
+       0x00010400, 0x01000004, 0x00000400, 0x00000004, 0x01000404, 0x00010404,
+       0x01010404, 0x00010004, 0x01010000, 0x01000404, 0x01000004, 0x00000404,
+       0x00010404, 0x01010400, 0x00000404, 0x01000400, 0x01000400, 0x00000000,
+       0x00010004, 0x00010400, 0x00000000, 0x01010004]
+
+SP2 = [0x80108020, 0x80008000, 0x00008000, 0x00108020, 0x00100000, 0x00000020,
+       0x80100020, 0x80008020, 0x80000020, 0x80108020, 0x80108000, 0x80000000,
+       0x80008000, 0x00100000, 0x00000020, 0x80100020, 0x00108000, 0x00100020,
+       0x80008020, 0x00000000, 0x80000000, 0x00008000, 0x00108020, 0x80100000,
+       0x00100020, 0x80000020, 0x00000000, 0x00108000, 0x00008020, 0x80108000,
+       0x80100000, 0x00008020, 0x00000000, 0x00108020, 0x80100020, 0x00100000,
+       0x80008020, 0x80100000, 0x80108000, 0x00008000, 0x80100000, 0x80008000,
+       0x00000020, 0x80108020, 0x00108020, 0x00000020, 0x00008000, 0x80000000,
+       0x00008020, 0x80108000, 0x00100000, 0x80000020, 0x00100020, 0x80008020,
+       0x80000020, 0x00100020, 0x00108000, 0x00000000, 0x80008000, 0x00008020,
+       0x80000000, 0x80100020, 0x80108020, 0x00108000]
+
+SP3 = [0x00000208, 0x08020200, 0x00000000, 0x08020008, 0x08000200, 0x00000000,
+       0x00020208, 0x08000200, 0x00020008, 0x08000008, 0x08000008, 0x00020000,
+       0x08020208, 0x00020008, 0x08020000, 0x00000208, 0x08000000, 0x00000008,
+       0x08020200, 0x00000200, 0x00020200, 0x08020000, 0x08020008, 0x00020208,
+       0x08000208, 0x00020200, 0x00020000, 0x08000208, 0x00000008, 0x08020208,
+       0x00000200, 0x08000000, 0x08020200, 0x08000000, 0x00020008, 0x00000208,
+       0x00020000, 0x08020200, 0x08000200, 0x00000000, 0x00000200, 0x00020008,
+       0x08020208, 0x08000200, 0x08000008, 0x00000200, 0x00000000, 0x08020008,
+       0x08000208, 0x00020000, 0x08000000, 0x08020208, 0x00000008, 0x00020208,
+       0x00020200, 0x08000008, 0x08020000, 0x08000208, 0x00000208, 0x08020000,
+       0x00020208, 0x00000008, 0x08020008, 0x00020200]
+
+SP4 = [0x00802001, 0x00002081, 0x00002081, 0x00000080, 0x00802080, 0x00800081,
+       0x00800001, 0x00002001, 0x00000000, 0x00802000, 0x00802000, 0x00802081,
+       0x00000081, 0x00000000, 0x00800080, 0x00800001, 0x00000001, 0x00002000,
+       0x00800000, 0x00802001, 0x00000080, 0x00800000, 0x00002001, 0x00002080,
+       0x00800081, 0x00000001, 0x00002080, 0x00800080, 0x00002000, 0x00802080,
+       0x00802081, 0x00000081, 0x00800080, 0x00800001, 0x00802000, 0x00802081,
+       0x00000081, 0x00000000, 0x00000000, 0x00802000, 0x00002080, 0x00800080,
+       0x00800081, 0x00000001, 0x00802001, 0x00002081, 0x00002081, 0x00000080,
+       0x00802081, 0x00000081, 0x00000001, 0x00002000, 0x00800001, 0x00002001,
+       0x00802080, 0x00800081, 0x00002001, 0x00002080, 0x00800000, 0x00802001,
+       0x00000080, 0x00800000, 0x00002000, 0x00802080]
+
+SP5 = [0x00000100, 0x02080100, 0x02080000, 0x42000100, 0x00080000, 0x00000100,
+       0x40000000, 0x02080000, 0x40080100, 0x00080000, 0x02000100, 0x40080100,
+       0x42000100, 0x42080000, 0x00080100, 0x40000000, 0x02000000, 0x40080000,
+       0x40080000, 0x00000000, 0x40000100, 0x42080100, 0x42080100, 0x02000100,
+       0x42080000, 0x40000100, 0x00000000, 0x42000000, 0x02080100, 0x02000000,
+       0x42000000, 0x00080100, 0x00080000, 0x42000100, 0x00000100, 0x02000000,
+       0x40000000, 0x02080000, 0x42000100, 0x40080100, 0x02000100, 0x40000000,
+       0x42080000, 0x02080100, 0x40080100, 0x00000100, 0x02000000, 0x42080000,
+       0x42080100, 0x00080100, 0x42000000, 0x42080100, 0x02080000, 0x00000000,
+       0x40080000, 0x42000000, 0x00080100, 0x02000100, 0x40000100, 0x00080000,
+       0x00000000, 0x40080000, 0x02080100, 0x40000100]
+
+SP6 = [0x20000010, 0x20400000, 0x00004000, 0x20404010, 0x20400000, 0x00000010,
+       0x20404010, 0x00400000, 0x20004000, 0x00404010, 0x00400000, 0x20000010,
+       0x00400010, 0x20004000, 0x20000000, 0x00004010, 0x00000000, 0x00400010,
+       0x20004010, 0x00004000, 0x00404000, 0x20004010, 0x00000010, 0x20400010,
+       0x20400010, 0x00000000, 0x00404010, 0x20404000, 0x00004010, 0x00404000,
+       0x20404000, 0x20000000, 0x20004000, 0x00000010, 0x20400010, 0x00404000,
+       0x20404010, 0x00400000, 0x00004010, 0x20000010, 0x00400000, 0x20004000,
+       0x20000000, 0x00004010, 0x20000010, 0x20404010, 0x00404000, 0x20400000,
+       0x00404010, 0x20404000, 0x00000000, 0x20400010, 0x00000010, 0x00004000,
+       0x20400000, 0x00404010, 0x00004000, 0x00400010, 0x20004010, 0x00000000,
+       0x20404000, 0x20000000, 0x00400010, 0x20004010]
+
+SP7 = [0x00200000, 0x04200002, 0x04000802, 0x00000000, 0x00000800, 0x04000802,
+       0x00200802, 0x04200800, 0x04200802, 0x00200000, 0x00000000, 0x04000002,
+       0x00000002, 0x04000000, 0x04200002, 0x00000802, 0x04000800, 0x00200802,
+       0x00200002, 0x04000800, 0x04000002, 0x04200000, 0x04200800, 0x00200002,
+       0x04200000, 0x00000800, 0x00000802, 0x04200802, 0x00200800, 0x00000002,
+       0x04000000, 0x00200800, 0x04000000, 0x00200800, 0x00200000, 0x04000802,
+       0x04000802, 0x04200002, 0x04200002, 0x00000002, 0x00200002, 0x04000000,
+       0x04000800, 0x00200000, 0x04200800, 0x00000802, 0x00200802, 0x04200800,
+       0x00000802, 0x04000002, 0x04200802, 0x04200000, 0x00200800, 0x00000000,
+       0x00000002, 0x04200802, 0x00000000, 0x00200802, 0x04200000, 0x00000800,
+       0x04000002, 0x04000800, 0x00000800, 0x00200002]
+
+SP8 = [0x10001040, 0x00001000, 0x00040000, 0x10041040, 0x10000000, 0x10001040,
+       0x00000040, 0x10000000, 0x00040040, 0x10040000, 0x10041040, 0x00041000,
+       0x10041000, 0x00041040, 0x00001000, 0x00000040, 0x10040000, 0x10000040,
+       0x10001000, 0x00001040, 0x00041000, 0x00040040, 0x10040040, 0x10041000,
+       0x00001040, 0x00000000, 0x00000000, 0x10040040, 0x10000040, 0x10001000,
+       0x00041040, 0x00040000, 0x00041040, 0x00040000, 0x10041000, 0x00001000,
+       0x00000040, 0x10040040, 0x00001000, 0x00041040, 0x10001000, 0x00000040,
+       0x10000040, 0x10040000, 0x10040040, 0x10000000, 0x00040000, 0x10001040,
+       0x00000000, 0x10041040, 0x00040040, 0x10000040, 0x10040000, 0x10001000,
+       0x10001040, 0x00000000, 0x10041040, 0x00041000, 0x00041000, 0x00001040,
+       0x00001040, 0x00040040, 0x10000000, 0x10041000]
+
+PC2C = [[0x0000000000000000, 0x0000000000100000, 0x0000000004000000,
+         0x0000000004100000, 0x0100000000000000, 0x0100000000100000,
+         0x0100000004000000, 0x0100000004100000, 0x0004000000000000,
+         0x0004000000100000, 0x0004000004000000, 0x0004000004100000,
+         0x0104000000000000, 0x0104000000100000, 0x0104000004000000,
+         0x0104000004100000, 0x0000000020000000, 0x0000000020100000,
+         0x0000000024000000, 0x0000000024100000, 0x0100000020000000,
+         0x0100000020100000, 0x0100000024000000, 0x0100000024100000,
+         0x0004000020000000, 0x0004000020100000, 0x0004000024000000,
+         0x0004000024100000, 0x0104000020000000, 0x0104000020100000,
+         0x0104000024000000, 0x0104000024100000, 0x0000000000010000,
+         0x0000000000110000, 0x0000000004010000, 0x0000000004110000,
+         0x0100000000010000, 0x0100000000110000, 0x0100000004010000,
+         0x0100000004110000, 0x0004000000010000, 0x0004000000110000,
+         0x0004000004010000, 0x0004000004110000, 0x0104000000010000,
+         0x0104000000110000, 0x0104000004010000, 0x0104000004110000,
+         0x0000000020010000, 0x0000000020110000, 0x0000000024010000,
+         0x0000000024110000, 0x0100000020010000, 0x0100000020110000,
+         0x0100000024010000, 0x0100000024110000, 0x0004000020010000,
+         0x0004000020110000, 0x0004000024010000, 0x0004000024110000,
+         0x0104000020010000, 0x0104000020110000, 0x0104000024010000,
+         0x0104000024110000, 0x0200000000000000, 0x0200000000100000,
+         0x0200000004000000, 0x0200000004100000, 0x0300000000000000,
+         0x0300000000100000, 0x0300000004000000, 0x0300000004100000,
+         0x0204000000000000, 0x0204000000100000, 0x0204000004000000,
+         0x0204000004100000, 0x0304000000000000, 0x0304000000100000,
+         0x0304000004000000, 0x0304000004100000, 0x0200000020000000,
+         0x0200000020100000, 0x0200000024000000, 0x0200000024100000,
+         0x0300000020000000, 0x0300000020100000, 0x0300000024000000,
+         0x0300000024100000, 0x0204000020000000, 0x0204000020100000,
+         0x0204000024000000, 0x0204000024100000, 0x0304000020000000,
+         0x0304000020100000, 0x0304000024000000, 0x0304000024100000,
+         0x0200000000010000, 0x0200000000110000, 0x0200000004010000,
+         0x0200000004110000, 0x0300000000010000, 0x0300000000110000,
+         0x0300000004010000, 0x0300000004110000, 0x0204000000010000,
+         0x0204000000110000, 0x0204000004010000, 0x0204000004110000,
+         0x0304000000010000, 0x0304000000110000, 0x0304000004010000,
+         0x0304000004110000, 0x0200000020010000, 0x0200000020110000,
+         0x0200000024010000, 0x0200000024110000, 0x0300000020010000,
+         0x0300000020110000, 0x0300000024010000, 0x0300000024110000,
+         0x0204000020010000, 0x0204000020110000, 0x0204000024010000,
+         0x0204000024110000, 0x0304000020010000, 0x0304000020110000,
+         0x0304000024010000, 0x0304000024110000],
+        [0x0000000000000000, 0x2000000000000000, 0x0000000000020000,
+         0x2000000000020000, 0x0008000000000000, 0x2008000000000000,
+         0x0008000000020000, 0x2008000000020000, 0x0800000000000000,
+         0x2800000000000000, 0x0800000000020000, 0x2800000000020000,
+         0x0808000000000000, 0x2808000000000000, 0x0808000000020000,
+         0x2808000000020000, 0x0000000001000000, 0x2000000001000000,
+         0x0000000001020000, 0x2000000001020000, 0x0008000001000000,
+         0x2008000001000000, 0x0008000001020000, 0x2008000001020000,
+         0x0800000001000000, 0x2800000001000000, 0x0800000001020000,
+         0x2800000001020000, 0x0808000001000000, 0x2808000001000000,
+         0x0808000001020000, 0x2808000001020000, 0x0000000000000000,
+         0x2000000000000000, 0x0000000000020000, 0x2000000000020000,
+         0x0008000000000000, 0x2008000000000000, 0x0008000000020000,
+         0x2008000000020000, 0x0800000000000000, 0x2800000000000000,
+         0x0800000000020000, 0x2800000000020000, 0x0808000000000000,
+         0x2808000000000000, 0x0808000000020000, 0x2808000000020000,
+         0x0000000001000000, 0x2000000001000000, 0x0000000001020000,
+         0x2000000001020000, 0x0008000001000000, 0x2008000001000000,
+         0x0008000001020000, 0x2008000001020000, 0x0800000001000000,
+         0x2800000001000000, 0x0800000001020000, 0x2800000001020000,
+         0x0808000001000000, 0x2808000001000000, 0x0808000001020000,
+         0x2808000001020000, 0x0001000000000000, 0x2001000000000000,
+         0x0001000000020000, 0x2001000000020000, 0x0009000000000000,
+         0x2009000000000000, 0x0009000000020000, 0x2009000000020000,
+         0x0801000000000000, 0x2801000000000000, 0x0801000000020000,
+         0x2801000000020000, 0x0809000000000000, 0x2809000000000000,
+         0x0809000000020000, 0x2809000000020000, 0x0001000001000000,
+         0x2001000001000000, 0x0001000001020000, 0x2001000001020000,
+         0x0009000001000000, 0x2009000001000000, 0x0009000001020000,
+         0x2009000001020000, 0x0801000001000000, 0x2801000001000000,
+         0x0801000001020000, 0x2801000001020000, 0x0809000001000000,
+         0x2809000001000000, 0x0809000001020000, 0x2809000001020000,
+         0x0001000000000000, 0x2001000000000000, 0x0001000000020000,
+         0x2001000000020000, 0x0009000000000000, 0x2009000000000000,
+         0x0009000000020000, 0x2009000000020000, 0x0801000000000000,
+         0x2801000000000000, 0x0801000000020000, 0x2801000000020000,
+         0x0809000000000000, 0x2809000000000000, 0x0809000000020000,
+         0x2809000000020000, 0x0001000001000000, 0x2001000001000000,
+         0x0001000001020000, 0x2001000001020000, 0x0009000001000000,
+         0x2009000001000000, 0x0009000001020000, 0x2009000001020000,
+         0x0801000001000000, 0x2801000001000000, 0x0801000001020000,
+         0x2801000001020000, 0x0809000001000000, 0x2809000001000000,
+         0x0809000001020000, 0x2809000001020000],
+        [0x0000000000000000, 0x0000000002000000, 0x0000000000040000,
+         0x0000000002040000, 0x0010000000000000, 0x0010000002000000,
+         0x0010000000040000, 0x0010000002040000, 0x0000000000000000,
+         0x0000000002000000, 0x0000000000040000, 0x0000000002040000,
+         0x0010000000000000, 0x0010000002000000, 0x0010000000040000,
+         0x0010000002040000, 0x1000000000000000, 0x1000000002000000,
+         0x1000000000040000, 0x1000000002040000, 0x1010000000000000,
+         0x1010000002000000, 0x1010000000040000, 0x1010000002040000,
+         0x1000000000000000, 0x1000000002000000, 0x1000000000040000,
+         0x1000000002040000, 0x1010000000000000, 0x1010000002000000,
+         0x1010000000040000, 0x1010000002040000, 0x0000000000200000,
+         0x0000000002200000, 0x0000000000240000, 0x0000000002240000,
+         0x0010000000200000, 0x0010000002200000, 0x0010000000240000,
+         0x0010000002240000, 0x0000000000200000, 0x0000000002200000,
+         0x0000000000240000, 0x0000000002240000, 0x0010000000200000,
+         0x0010000002200000, 0x0010000000240000, 0x0010000002240000,
+         0x1000000000200000, 0x1000000002200000, 0x1000000000240000,
+         0x1000000002240000, 0x1010000000200000, 0x1010000002200000,
+         0x1010000000240000, 0x1010000002240000, 0x1000000000200000,
+         0x1000000002200000, 0x1000000000240000, 0x1000000002240000,
+         0x1010000000200000, 0x1010000002200000, 0x1010000000240000,
+         0x1010000002240000, 0x0000000008000000, 0x000000000a000000,
+         0x0000000008040000, 0x000000000a040000, 0x0010000008000000,
+         0x001000000a000000, 0x0010000008040000, 0x001000000a040000,
+         0x0000000008000000, 0x000000000a000000, 0x0000000008040000,
+         0x000000000a040000, 0x0010000008000000, 0x001000000a000000,
+         0x0010000008040000, 0x001000000a040000, 0x1000000008000000,
+         0x100000000a000000, 0x1000000008040000, 0x100000000a040000,
+         0x1010000008000000, 0x101000000a000000, 0x1010000008040000,
+         0x101000000a040000, 0x1000000008000000, 0x100000000a000000,
+         0x1000000008040000, 0x100000000a040000, 0x1010000008000000,
+         0x101000000a000000, 0x1010000008040000, 0x101000000a040000,
+         0x0000000008200000, 0x000000000a200000, 0x0000000008240000,
+         0x000000000a240000, 0x0010000008200000, 0x001000000a200000,
+         0x0010000008240000, 0x001000000a240000, 0x0000000008200000,
+         0x000000000a200000, 0x0000000008240000, 0x000000000a240000,
+         0x0010000008200000, 0x001000000a200000, 0x0010000008240000,
+         0x001000000a240000, 0x1000000008200000, 0x100000000a200000,
+         0x1000000008240000, 0x100000000a240000, 0x1010000008200000,
+         0x101000000a200000, 0x1010000008240000, 0x101000000a240000,
+         0x1000000008200000, 0x100000000a200000, 0x1000000008240000,
+         0x100000000a240000, 0x1010000008200000, 0x101000000a200000,
+         0x1010000008240000, 0x101000000a240000],
+        [0x0000000000000000, 0x0000000010000000, 0x0000000000080000,
+         0x0000000010080000, 0x0002000000000000, 0x0002000010000000,
+         0x0002000000080000, 0x0002000010080000, 0x0000000000000000,
+         0x0000000010000000, 0x0000000000080000, 0x0000000010080000,
+         0x0002000000000000, 0x0002000010000000, 0x0002000000080000,
+         0x0002000010080000, 0x0400000000000000, 0x0400000010000000,
+         0x0400000000080000, 0x0400000010080000, 0x0402000000000000,
+         0x0402000010000000, 0x0402000000080000, 0x0402000010080000,
+         0x0400000000000000, 0x0400000010000000, 0x0400000000080000,
+         0x0400000010080000, 0x0402000000000000, 0x0402000010000000,
+         0x0402000000080000, 0x0402000010080000, 0x0020000000000000,
+         0x0020000010000000, 0x0020000000080000, 0x0020000010080000,
+         0x0022000000000000, 0x0022000010000000, 0x0022000000080000,
+         0x0022000010080000, 0x0020000000000000, 0x0020000010000000,
+         0x0020000000080000, 0x0020000010080000, 0x0022000000000000,
+         0x0022000010000000, 0x0022000000080000, 0x0022000010080000,
+         0x0420000000000000, 0x0420000010000000, 0x0420000000080000,
+         0x0420000010080000, 0x0422000000000000, 0x0422000010000000,
+         0x0422000000080000, 0x0422000010080000, 0x0420000000000000,
+         0x0420000010000000, 0x0420000000080000, 0x0420000010080000,
+         0x0422000000000000, 0x0422000010000000, 0x0422000000080000,
+         0x0422000010080000, 0x0000000000000000, 0x0000000010000000,
+         0x0000000000080000, 0x0000000010080000, 0x0002000000000000,
+         0x0002000010000000, 0x0002000000080000, 0x0002000010080000,
+         0x0000000000000000, 0x0000000010000000, 0x0000000000080000,
+         0x0000000010080000, 0x0002000000000000, 0x0002000010000000,
+         0x0002000000080000, 0x0002000010080000, 0x0400000000000000,
+         0x0400000010000000, 0x0400000000080000, 0x0400000010080000,
+         0x0402000000000000, 0x0402000010000000, 0x0402000000080000,
+         0x0402000010080000, 0x0400000000000000, 0x0400000010000000,
+         0x0400000000080000, 0x0400000010080000, 0x0402000000000000,
+         0x0402000010000000, 0x0402000000080000, 0x0402000010080000,
+         0x0020000000000000, 0x0020000010000000, 0x0020000000080000,
+         0x0020000010080000, 0x0022000000000000, 0x0022000010000000,
+         0x0022000000080000, 0x0022000010080000, 0x0020000000000000,
+         0x0020000010000000, 0x0020000000080000, 0x0020000010080000,
+         0x0022000000000000, 0x0022000010000000, 0x0022000000080000,
+         0x0022000010080000, 0x0420000000000000, 0x0420000010000000,
+         0x0420000000080000, 0x0420000010080000, 0x0422000000000000,
+         0x0422000010000000, 0x0422000000080000, 0x0422000010080000,
+         0x0420000000000000, 0x0420000010000000, 0x0420000000080000,
+         0x0420000010080000, 0x0422000000000000, 0x0422000010000000,
+         0x0422000000080000, 0x0422000010080000]]
+
+PC2D = [[0x0000000000000000, 0x0000000000000000, 0x0000000200000000,
+         0x0000000200000000, 0x0000000000000200, 0x0000000000000200,
+         0x0000000200000200, 0x0000000200000200, 0x0000000000000001,
+         0x0000000000000001, 0x0000000200000001, 0x0000000200000001,
+         0x0000000000000201, 0x0000000000000201, 0x0000000200000201,
+         0x0000000200000201, 0x0000080000000000, 0x0000080000000000,
+         0x0000080200000000, 0x0000080200000000, 0x0000080000000200,
+         0x0000080000000200, 0x0000080200000200, 0x0000080200000200,
+         0x0000080000000001, 0x0000080000000001, 0x0000080200000001,
+         0x0000080200000001, 0x0000080000000201, 0x0000080000000201,
+         0x0000080200000201, 0x0000080200000201, 0x0000000000002000,
+         0x0000000000002000, 0x0000000200002000, 0x0000000200002000,
+         0x0000000000002200, 0x0000000000002200, 0x0000000200002200,
+         0x0000000200002200, 0x0000000000002001, 0x0000000000002001,
+         0x0000000200002001, 0x0000000200002001, 0x0000000000002201,
+         0x0000000000002201, 0x0000000200002201, 0x0000000200002201,
+         0x0000080000002000, 0x0000080000002000, 0x0000080200002000,
+         0x0000080200002000, 0x0000080000002200, 0x0000080000002200,
+         0x0000080200002200, 0x0000080200002200, 0x0000080000002001,
+         0x0000080000002001, 0x0000080200002001, 0x0000080200002001,
+         0x0000080000002201, 0x0000080000002201, 0x0000080200002201,
+         0x0000080200002201, 0x0000000000000002, 0x0000000000000002,
+         0x0000000200000002, 0x0000000200000002, 0x0000000000000202,
+         0x0000000000000202, 0x0000000200000202, 0x0000000200000202,
+         0x0000000000000003, 0x0000000000000003, 0x0000000200000003,
+         0x0000000200000003, 0x0000000000000203, 0x0000000000000203,
+         0x0000000200000203, 0x0000000200000203, 0x0000080000000002,
+         0x0000080000000002, 0x0000080200000002, 0x0000080200000002,
+         0x0000080000000202, 0x0000080000000202, 0x0000080200000202,
+         0x0000080200000202, 0x0000080000000003, 0x0000080000000003,
+         0x0000080200000003, 0x0000080200000003, 0x0000080000000203,
+         0x0000080000000203, 0x0000080200000203, 0x0000080200000203,
+         0x0000000000002002, 0x0000000000002002, 0x0000000200002002,
+         0x0000000200002002, 0x0000000000002202, 0x0000000000002202,
+         0x0000000200002202, 0x0000000200002202, 0x0000000000002003,
+         0x0000000000002003, 0x0000000200002003, 0x0000000200002003,
+         0x0000000000002203, 0x0000000000002203, 0x0000000200002203,
+         0x0000000200002203, 0x0000080000002002, 0x0000080000002002,
+         0x0000080200002002, 0x0000080200002002, 0x0000080000002202,
+         0x0000080000002202, 0x0000080200002202, 0x0000080200002202,
+         0x0000080000002003, 0x0000080000002003, 0x0000080200002003,
+         0x0000080200002003, 0x0000080000002203, 0x0000080000002203,
+         0x0000080200002203, 0x0000080200002203],
+        [0x0000000000000000, 0x0000000000000010, 0x0000200000000000,
+         0x0000200000000010, 0x0000000000001000, 0x0000000000001010,
+         0x0000200000001000, 0x0000200000001010, 0x0000000800000000,
+         0x0000000800000010, 0x0000200800000000, 0x0000200800000010,
+         0x0000000800001000, 0x0000000800001010, 0x0000200800001000,
+         0x0000200800001010, 0x0000000000000000, 0x0000000000000010,
+         0x0000200000000000, 0x0000200000000010, 0x0000000000001000,
+         0x0000000000001010, 0x0000200000001000, 0x0000200000001010,
+         0x0000000800000000, 0x0000000800000010, 0x0000200800000000,
+         0x0000200800000010, 0x0000000800001000, 0x0000000800001010,
+         0x0000200800001000, 0x0000200800001010, 0x0000040000000000,
+         0x0000040000000010, 0x0000240000000000, 0x0000240000000010,
+         0x0000040000001000, 0x0000040000001010, 0x0000240000001000,
+         0x0000240000001010, 0x0000040800000000, 0x0000040800000010,
+         0x0000240800000000, 0x0000240800000010, 0x0000040800001000,
+         0x0000040800001010, 0x0000240800001000, 0x0000240800001010,
+         0x0000040000000000, 0x0000040000000010, 0x0000240000000000,
+         0x0000240000000010, 0x0000040000001000, 0x0000040000001010,
+         0x0000240000001000, 0x0000240000001010, 0x0000040800000000,
+         0x0000040800000010, 0x0000240800000000, 0x0000240800000010,
+         0x0000040800001000, 0x0000040800001010, 0x0000240800001000,
+         0x0000240800001010, 0x0000000000000004, 0x0000000000000014,
+         0x0000200000000004, 0x0000200000000014, 0x0000000000001004,
+         0x0000000000001014, 0x0000200000001004, 0x0000200000001014,
+         0x0000000800000004, 0x0000000800000014, 0x0000200800000004,
+         0x0000200800000014, 0x0000000800001004, 0x0000000800001014,
+         0x0000200800001004, 0x0000200800001014, 0x0000000000000004,
+         0x0000000000000014, 0x0000200000000004, 0x0000200000000014,
+         0x0000000000001004, 0x0000000000001014, 0x0000200000001004,
+         0x0000200000001014, 0x0000000800000004, 0x0000000800000014,
+         0x0000200800000004, 0x0000200800000014, 0x0000000800001004,
+         0x0000000800001014, 0x0000200800001004, 0x0000200800001014,
+         0x0000040000000004, 0x0000040000000014, 0x0000240000000004,
+         0x0000240000000014, 0x0000040000001004, 0x0000040000001014,
+         0x0000240000001004, 0x0000240000001014, 0x0000040800000004,
+         0x0000040800000014, 0x0000240800000004, 0x0000240800000014,
+         0x0000040800001004, 0x0000040800001014, 0x0000240800001004,
+         0x0000240800001014, 0x0000040000000004, 0x0000040000000014,
+         0x0000240000000004, 0x0000240000000014, 0x0000040000001004,
+         0x0000040000001014, 0x0000240000001004, 0x0000240000001014,
+         0x0000040800000004, 0x0000040800000014, 0x0000240800000004,
+         0x0000240800000014, 0x0000040800001004, 0x0000040800001014,
+         0x0000240800001004, 0x0000240800001014],
+        [0x0000000000000000, 0x0000001000000000, 0x0000000000000100,
+         0x0000001000000100, 0x0000020000000000, 0x0000021000000000,
+         0x0000020000000100, 0x0000021000000100, 0x0000000000000020,
+         0x0000001000000020, 0x0000000000000120, 0x0000001000000120,
+         0x0000020000000020, 0x0000021000000020, 0x0000020000000120,
+         0x0000021000000120, 0x0000000000000400, 0x0000001000000400,
+         0x0000000000000500, 0x0000001000000500, 0x0000020000000400,
+         0x0000021000000400, 0x0000020000000500, 0x0000021000000500,
+         0x0000000000000420, 0x0000001000000420, 0x0000000000000520,
+         0x0000001000000520, 0x0000020000000420, 0x0000021000000420,
+         0x0000020000000520, 0x0000021000000520, 0x0000002000000000,
+         0x0000003000000000, 0x0000002000000100, 0x0000003000000100,
+         0x0000022000000000, 0x0000023000000000, 0x0000022000000100,
+         0x0000023000000100, 0x0000002000000020, 0x0000003000000020,
+         0x0000002000000120, 0x0000003000000120, 0x0000022000000020,
+         0x0000023000000020, 0x0000022000000120, 0x0000023000000120,
+         0x0000002000000400, 0x0000003000000400, 0x0000002000000500,
+         0x0000003000000500, 0x0000022000000400, 0x0000023000000400,
+         0x0000022000000500, 0x0000023000000500, 0x0000002000000420,
+         0x0000003000000420, 0x0000002000000520, 0x0000003000000520,
+         0x0000022000000420, 0x0000023000000420, 0x0000022000000520,
+         0x0000023000000520, 0x0000000000000000, 0x0000001000000000,
+         0x0000000000000100, 0x0000001000000100, 0x0000020000000000,
+         0x0000021000000000, 0x0000020000000100, 0x0000021000000100,
+         0x0000000000000020, 0x0000001000000020, 0x0000000000000120,
+         0x0000001000000120, 0x0000020000000020, 0x0000021000000020,
+         0x0000020000000120, 0x0000021000000120, 0x0000000000000400,
+         0x0000001000000400, 0x0000000000000500, 0x0000001000000500,
+         0x0000020000000400, 0x0000021000000400, 0x0000020000000500,
+         0x0000021000000500, 0x0000000000000420, 0x0000001000000420,
+         0x0000000000000520, 0x0000001000000520, 0x0000020000000420,
+         0x0000021000000420, 0x0000020000000520, 0x0000021000000520,
+         0x0000002000000000, 0x0000003000000000, 0x0000002000000100,
+         0x0000003000000100, 0x0000022000000000, 0x0000023000000000,
+         0x0000022000000100, 0x0000023000000100, 0x0000002000000020,
+         0x0000003000000020, 0x0000002000000120, 0x0000003000000120,
+         0x0000022000000020, 0x0000023000000020, 0x0000022000000120,
+         0x0000023000000120, 0x0000002000000400, 0x0000003000000400,
+         0x0000002000000500, 0x0000003000000500, 0x0000022000000400,
+         0x0000023000000400, 0x0000022000000500, 0x0000023000000500,
+         0x0000002000000420, 0x0000003000000420, 0x0000002000000520,
+         0x0000003000000520, 0x0000022000000420, 0x0000023000000420,
+         0x0000022000000520, 0x0000023000000520],
+        [0x0000000000000000, 0x0000000400000000, 0x0000010000000000,
+         0x0000010400000000, 0x0000000000000000, 0x0000000400000000,
+         0x0000010000000000, 0x0000010400000000, 0x0000000100000000,
+         0x0000000500000000, 0x0000010100000000, 0x0000010500000000,
+         0x0000000100000000, 0x0000000500000000, 0x0000010100000000,
+         0x0000010500000000, 0x0000100000000000, 0x0000100400000000,
+         0x0000110000000000, 0x0000110400000000, 0x0000100000000000,
+         0x0000100400000000, 0x0000110000000000, 0x0000110400000000,
+         0x0000100100000000, 0x0000100500000000, 0x0000110100000000,
+         0x0000110500000000, 0x0000100100000000, 0x0000100500000000,
+         0x0000110100000000, 0x0000110500000000, 0x0000000000000800,
+         0x0000000400000800, 0x0000010000000800, 0x0000010400000800,
+         0x0000000000000800, 0x0000000400000800, 0x0000010000000800,
+         0x0000010400000800, 0x0000000100000800, 0x0000000500000800,
+         0x0000010100000800, 0x0000010500000800, 0x0000000100000800,
+         0x0000000500000800, 0x0000010100000800, 0x0000010500000800,
+         0x0000100000000800, 0x0000100400000800, 0x0000110000000800,
+         0x0000110400000800, 0x0000100000000800, 0x0000100400000800,
+         0x0000110000000800, 0x0000110400000800, 0x0000100100000800,
+         0x0000100500000800, 0x0000110100000800, 0x0000110500000800,
+         0x0000100100000800, 0x0000100500000800, 0x0000110100000800,
+         0x0000110500000800, 0x0000000000000008, 0x0000000400000008,
+         0x0000010000000008, 0x0000010400000008, 0x0000000000000008,
+         0x0000000400000008, 0x0000010000000008, 0x0000010400000008,
+         0x0000000100000008, 0x0000000500000008, 0x0000010100000008,
+         0x0000010500000008, 0x0000000100000008, 0x0000000500000008,
+         0x0000010100000008, 0x0000010500000008, 0x0000100000000008,
+         0x0000100400000008, 0x0000110000000008, 0x0000110400000008,
+         0x0000100000000008, 0x0000100400000008, 0x0000110000000008,
+         0x0000110400000008, 0x0000100100000008, 0x0000100500000008,
+         0x0000110100000008, 0x0000110500000008, 0x0000100100000008,
+         0x0000100500000008, 0x0000110100000008, 0x0000110500000008,
+         0x0000000000000808, 0x0000000400000808, 0x0000010000000808,
+         0x0000010400000808, 0x0000000000000808, 0x0000000400000808,
+         0x0000010000000808, 0x0000010400000808, 0x0000000100000808,
+         0x0000000500000808, 0x0000010100000808, 0x0000010500000808,
+         0x0000000100000808, 0x0000000500000808, 0x0000010100000808,
+         0x0000010500000808, 0x0000100000000808, 0x0000100400000808,
+         0x0000110000000808, 0x0000110400000808, 0x0000100000000808,
+         0x0000100400000808, 0x0000110000000808, 0x0000110400000808,
+         0x0000100100000808, 0x0000100500000808, 0x0000110100000808,
+         0x0000110500000808, 0x0000100100000808, 0x0000100500000808,
+         0x0000110100000808, 0x0000110500000808]]
+
@@ -0,0 +1,543 @@
+"""Process pool engine for the parallelizable chaining modes
+
+The pure python ciphers run under the GIL, so a single cipher object only
+uses one core. The functions in this module split a buffer or a file at
+block boundaries and let a multiprocessing pool work on the pieces:
+
+    ECB:        encryption and decryption
+    CTR:        encryption and decryption
+    CBC, CFB:   decryption
+    XTS:        encryption and decryption of a data unit, or of
+                consecutive data units (encrypt_sectors/decrypt_sectors)
+    OCB:        encryption and decryption of the full blocks, the
+                checksums of the shards are combined afterwards
+    PMAC:       hashing (encrypt and update), the partial sums of the
+                shards are combined afterwards
+
+The data is handed to the workers through shared memory (or by mapping the
+files), so it is never pickled. Every worker rebuilds the codebook from a
+pickled snapshot of the expanded key, the key schedule isn't computed again.
+
+The output is identical to what cipher.encrypt/cipher.decrypt would return
+for the same data and the cipher is left in the same state, so it can
+still be used afterwards. Other modes and directions, codebooks that can't
+be pickled (the pycrypto ciphers) and inputs too small to be worth the
+process overhead are processed in the calling process.
+
+EXAMPLES:
+**********
+>>> from CryptoPlus.Cipher import python_AES, parallel
+>>> from CryptoPlus.Util.util import Counter
+>>> key = '2b7e151628aed2a6abf7158809cf4f3c'.decode('hex')
+>>> data = ''.join([chr(i % 251) for i in xrange(5000)])
+
+CTR:
+----
+>>> cipher = python_AES.new(key,python_AES.MODE_CTR,counter=Counter('\\x00'*16))
+>>> ciphertext = parallel.encrypt(cipher,data,processes=2,shard_size=1024)
+>>> ciphertext == python_AES.new(key,python_AES.MODE_CTR,counter=Counter('\\x00'*16)).encrypt(data)
+True
+>>> decipher = python_AES.new(key,python_AES.MODE_CTR,counter=Counter('\\x00'*16))
+>>> parallel.decrypt(decipher,ciphertext[:3000],processes=2,shard_size=1024) + decipher.decrypt(ciphertext[3000:]) == data
+True
+
+CBC decryption:
+---------------
+>>> IV = '000102030405060708090a0b0c0d0e0f'.decode('hex')
+>>> ciphertext = python_AES.new(key,python_AES.MODE_CBC,IV).encrypt(data)
+>>> decipher = python_AES.new(key,python_AES.MODE_CBC,IV)
+>>> parallel.decrypt(decipher,ciphertext,processes=2,shard_size=1024) == data[:4992]
+True
+
+CFB decryption (shards start where segments and blocks line up):
+------------------------------------------------------------------
+>>> ciphertext = python_AES.new(key,python_AES.MODE_CFB,IV,segment_size=24).encrypt(data)
+>>> decipher = python_AES.new(key,python_AES.MODE_CFB,IV,segment_size=24)
+>>> parallel.decrypt(decipher,ciphertext,processes=2,shard_size=1024) == data
+True
+
+XTS:
+----
+>>> key = ('27182818284590452353602874713526'.decode('hex'),'31415926535897932384626433832795'.decode('hex'))
+>>> cipher = python_AES.new(key,python_AES.MODE_XTS)
+>>> ciphertext = parallel.encrypt(cipher,data,'\\x01',processes=2,shard_size=1024)
+>>> ciphertext == python_AES.new(key,python_AES.MODE_XTS).encrypt(data,'\\x01')
+True
+
+>>> ciphertext = parallel.encrypt_sectors(cipher,data[:4096],1000,512,processes=2,shard_size=1024)
+>>> ciphertext == python_AES.new(key,python_AES.MODE_XTS).encrypt_sectors(data[:4096],1000,512)
+True
+
+OCB:
+----
+>>> nonce = 'BBAA99887766554433221101'.decode('hex')
+>>> cipher = python_AES.new(key[0],python_AES.MODE_OCB,nonce)
+>>> ciphertext = parallel.encrypt(cipher,data,processes=2,shard_size=1024) + cipher.final()
+>>> reference = python_AES.new(key[0],python_AES.MODE_OCB,nonce)
+>>> ciphertext == reference.encrypt(data) + reference.final()
+True
+>>> cipher.digest() == reference.digest()
+True
+
+PMAC:
+-----
+>>> cipher = python_AES.new(key[0],python_AES.MODE_PMAC)
+>>> parallel.encrypt(cipher,data,processes=2,shard_size=1024) == cipher.encrypt(data)
+True
+>>> parallel.update(cipher,data[:3000],processes=2,shard_size=1024)
+>>> cipher.update(data[3000:])
+>>> cipher.digest() == python_AES.new(key[0],python_AES.MODE_PMAC).encrypt(data)
+True
+"""
+
+import cPickle as pickle
+import mmap
+import os
+import multiprocessing
+from multiprocessing.sharedctypes import RawArray
+
+from blockcipher import MODE_ECB, MODE_CBC, MODE_CFB, MODE_CTR, MODE_XTS, MODE_CMAC, MODE_OCB, MODE_PMAC
+from blockcipher import CBC, CFB, XTS, OCB, PMAC, CHUNK_SIZE, _crypt_blocks, _counter_blocks, _string, _read_chunks
+from ..Util.strxor import strxor
+
+# Shards are never made smaller than this: below it, the work done by a
+#   worker doesn't make up for the inter process overhead
+MIN_SHARD_SIZE = 64*1024
+
+def encrypt(cipher,data,n='',processes=None,shard_size=None):
+    """Encrypt data using a pool of worker processes
+
+        cipher      = a CryptoPlus cipher object (python_AES.new(...), ...)
+        data        = raw string
+        n           = the 'tweak' value when the chaining mode is XTS
+        processes   = number of worker processes, default is the number of CPUs
+        shard_size  = amount of bytes handed to a worker at once, rounded
+                      down to a multiple of the blocksize
+
+    Returns the same as cipher.encrypt(data,n).
+    """
+    if cipher.mode == MODE_PMAC:
+        # the tag of data as one message
+        chain = cipher.chain
+        last = _last_block(chain,data)
+        return chain.tag(_partial_sum(cipher,data[:last],0,processes,shard_size),data[last:])
+    return _crypt_buffer(cipher,'e',data,n,processes,shard_size)
+
+def decrypt(cipher,data,n='',processes=None,shard_size=None):
+    """Decrypt data using a pool of worker processes
+
+    Same arguments as encrypt, returns the same as cipher.decrypt(data,n).
+    """
+    return _crypt_buffer(cipher,'d',data,n,processes,shard_size)
+
+def encrypt_file(cipher,src,dst,n='',processes=None,shard_size=None):
+    """Encrypt the file named src into the file named dst using a pool of worker processes
+
+    The output file holds what cipher.encrypt(<contents of src>,n) would
+      return. For ECB and CBC mode the remaining bytes are kept in the
+      cipher's cache, call cipher.final() to pad them if necessary.
+    When the file isn't processed by the pool, it is read in pieces of
+      CHUNK_SIZE bytes (only a XTS data unit is read at once).
+    Returns the amount of bytes written.
+    """
+    return _crypt_file(cipher,'e',src,dst,n,processes,shard_size)
+
+def decrypt_file(cipher,src,dst,n='',processes=None,shard_size=None):
+    """Decrypt the file named src into the file named dst using a pool of worker processes
+
+    Same arguments as encrypt_file, returns the amount of bytes written.
+    """
+    return _crypt_file(cipher,'d',src,dst,n,processes,shard_size)
+
+def encrypt_sectors(cipher,data,first_sector,sector_size=512,processes=None,shard_size=None):
+    """Encrypt consecutive XTS data units using a pool of worker processes
+
+    Returns the same as cipher.encrypt_sectors(data,first_sector,sector_size),
+      shards are rounded down to a multiple of the sector size.
+    """
+    return _crypt_sectors(cipher,'e',data,first_sector,sector_size,processes,shard_size)
+
+def decrypt_sectors(cipher,data,first_sector,sector_size=512,processes=None,shard_size=None):
+    """Decrypt consecutive XTS data units using a pool of worker processes
+
+    Returns the same as cipher.decrypt_sectors(data,first_sector,sector_size).
+    """
+    return _crypt_sectors(cipher,'d',data,first_sector,sector_size,processes,shard_size)
+
+def update(cipher,data,processes=None,shard_size=None):
+    """Add data to the message hashed by a PMAC cipher using a pool of worker processes
+
+    Same as cipher.update(data): the blocks are hashed by the workers,
+      their partial sums are added to the cipher's state afterwards.
+    """
+    if cipher.mode <> MODE_PMAC:
+        return cipher.update(data)
+    chain = cipher.chain
+    data = chain.cache + _string(data)
+    last = _last_block(chain,data)
+    chain.sum ^= _partial_sum(cipher,data[:last],chain.nblocks,processes,shard_size)
+    chain.nblocks += last // chain.blocksize
+    chain.cache = data[last:]
+
+def parallelizable(cipher,ed):
+    """Check if a cipher object can be processed in parallel for direction ed ('e' or 'd')"""
+    if cipher.mode in (MODE_ECB,MODE_CTR,MODE_XTS,MODE_OCB):
+        return True
+    if cipher.mode == MODE_PMAC:
+        return ed == 'e'
+    return cipher.mode in (MODE_CBC,MODE_CFB) and ed == 'd'
+
+def _crypt_buffer(cipher,ed,data,n,processes,shard_size):
+    plan = _plan(cipher,ed,len(data),n,processes,shard_size)
+    if plan is None:
+        return _serial(cipher,ed,data,n)
+    cipher.ed = ed
+    head, length, tail = plan.head, plan.length, plan.tail
+    output = [_serial_head(cipher,ed,data[:head])]
+
+    source = RawArray('c',length)
+    source[:] = data[head:head+length]
+    dest = RawArray('c',length)
+    _prepare(cipher,plan,(data,head),(dest,0))
+    _run(cipher,plan,(source,0),(dest,0))
+    output.append(dest.raw)
+
+    output.append(_serial_tail(cipher,ed,data[head+length:],plan))
+    return ''.join(output)
+
+def _crypt_sectors(cipher,ed,data,first_sector,sector_size,processes,shard_size):
+    plan = None
+    if cipher.mode == MODE_XTS and sector_size and not sector_size % 16 and not len(data) % sector_size:
+        plan = _plan(cipher,ed,len(data),'',processes,max(shard_size or MIN_SHARD_SIZE,sector_size),sector_size)
+    if plan is None:
+        if ed == 'e':
+            return cipher.encrypt_sectors(data,first_sector,sector_size)
+        return cipher.decrypt_sectors(data,first_sector,sector_size)
+    cipher.ed = ed
+    plan.tasks = [(start,length,first_sector + start // sector_size) for start,length in plan.shards]
+    source = RawArray('c',plan.length)
+    source[:] = data[:]
+    dest = RawArray('c',plan.length)
+    _run(cipher,plan,(source,0),(dest,0))
+    return dest.raw
+
+def _last_block(chain,data):
+    # start of the last block of a PMAC message (full or not)
+    return ((len(data)-1)//chain.blocksize)*chain.blocksize if data else 0
+
+def _partial_sum(cipher,data,start,processes,shard_size):
+    """PMAC partial sum of data (full blocks numbered from start+1)"""
+    plan = _plan(cipher,'e',len(data),'',processes,shard_size)
+    if plan is None:
+        return cipher.chain.partial_sum(data,start)
+    plan.tasks = [(i,length,start + i // plan.blocksize) for i,length in plan.shards]
+    source = RawArray('c',plan.length)
+    source[:] = data
+    sum = 0
+    for partial in _run(cipher,plan,(source,0),(None,0)):
+        sum ^= partial
+    return sum
+
+def _crypt_file(cipher,ed,src,dst,n,processes,shard_size):
+    size = os.path.getsize(src)
+    if cipher.mode == MODE_PMAC:
+        # the output is only a tag
+        plan = None
+    else:
+        plan = _plan(cipher,ed,size,n,processes,shard_size)
+    fsrc = open(src,'rb')
+    try:
+        if plan is None:
+            return _serial_file(cipher,ed,fsrc,dst,n)
+        cipher.ed = ed
+        head, length, tail = plan.head, plan.length, plan.tail
+        head_data = fsrc.read(head)
+        head_output = _serial_head(cipher,ed,head_data)
+
+        # size the output file so the workers can map it
+        fdst = open(dst,'w+b')
+        try:
+            fdst.write(head_output)
+            fdst.truncate(len(head_output) + length)
+            fdst.flush()
+            dest = mmap.mmap(fdst.fileno(),0)
+            source = mmap.mmap(fsrc.fileno(),0,access=mmap.ACCESS_READ)
+            try:
+                _prepare(cipher,plan,(source,head),(dest,len(head_output)))
+                dest.flush()
+            finally:
+                source.close()
+                dest.close()
+            _run(cipher,plan,(src,head),(dst,len(head_output)))
+
+            fsrc.seek(head + length)
+            tail_output = _serial_tail(cipher,ed,fsrc.read(),plan)
+            fdst.seek(0,2)
+            fdst.write(tail_output)
+            return len(head_output) + length + len(tail_output)
+        finally:
+            fdst.close()
+    finally:
+        fsrc.close()
+
+def _serial_file(cipher,ed,fsrc,dst,n):
+    """Process an open file in the calling process, CHUNK_SIZE bytes at a time"""
+    if cipher.mode == MODE_XTS:
+        # the data unit has to be supplied at once (it is below 128 MiB)
+        outputs = [_serial(cipher,ed,fsrc.read(),n)]
+    elif cipher.mode in (MODE_CMAC,MODE_PMAC):
+        # encrypt hashes one complete message, feed it to a fresh clone
+        mac = cipher.clone()
+        for chunk in _read_chunks(fsrc,CHUNK_SIZE):
+            mac.update(chunk)
+        cipher.ed = ed
+        outputs = [mac.digest()]
+    else:
+        outputs = (_serial(cipher,ed,chunk,n) for chunk in _read_chunks(fsrc,CHUNK_SIZE))
+    written = 0
+    fdst = open(dst,'wb')
+    try:
+        for output in outputs:
+            fdst.write(output)
+            written += len(output)
+    finally:
+        fdst.close()
+    return written
+
+class _Plan:
+    pass
+
+def _plan(cipher,ed,size,n,processes,shard_size,sector_size=None):
+    """Work out how data of the given size is split, None if it shouldn't be
+
+    With a sector_size, XTS shards hold whole data units (and n isn't used).
+    """
+    if not parallelizable(cipher,ed):
+        return None
+    if cipher.mode == MODE_OCB and cipher.chain.finished:
+        # let the cipher raise the error
+        return None
+    try:
+        snapshot = pickle.dumps(_codebook(cipher),2)
+    except (pickle.PicklingError,TypeError):
+        return None
+    if processes is None:
+        processes = multiprocessing.cpu_count()
+    blocksize = cipher.blocksize
+    if shard_size is None:
+        shard_size = MIN_SHARD_SIZE
+    unit = sector_size or blocksize
+    if cipher.mode == MODE_CFB:
+        # the shift register only holds the preceding ciphertext at segment
+        #   boundaries that are also block boundaries
+        unit = _lcm(cipher.chain.segment_size,blocksize)
+    shard_size = max(shard_size - shard_size % unit,unit)
+
+    plan = _Plan()
+    plan.mode = cipher.mode
+    plan.ed = ed
+    plan.blocksize = blocksize
+    plan.snapshot = snapshot
+    plan.processes = processes
+    plan.n = n
+    plan.segment_size = None
+    plan.sector_size = sector_size
+    if sector_size:
+        plan.head, plan.length = 0, size
+    elif cipher.mode == MODE_XTS:
+        if not 16 <= size < 128*pow(2,20):
+            return None
+        plan.head = 0
+        plan.length = (size // 16)*16
+        if size % 16:
+            # one last full block and a partial block are stolen
+            plan.length -= 16
+    else:
+        plan.head = _unaligned(cipher,size)
+        plan.length = size - plan.head - (size - plan.head) % unit
+        if cipher.mode == MODE_CFB:
+            plan.segment_size = cipher.chain.segment_size
+    plan.tail = size - plan.head - plan.length
+    if processes < 2 or plan.length < 2*shard_size:
+        return None
+    plan.shards = [(i,min(shard_size,plan.length-i)) for i in xrange(0,plan.length,shard_size)]
+    return plan
+
+def _lcm(a,b):
+    x, y = a, b
+    while y:
+        x, y = y, x % y
+    return a*b // x
+
+def _codebook(cipher):
+    if cipher.mode == MODE_XTS:
+        return cipher.chain.codebook1, cipher.chain.codebook2
+    return cipher.chain.codebook
+
+def _unaligned(cipher,size):
+    """Bytes to process in the calling process until the chain is at a block boundary"""
+    chain = cipher.chain
+    if cipher.mode == MODE_PMAC:
+        # only called with full blocks
+        return 0
+    if cipher.mode in (MODE_ECB,MODE_CBC,MODE_OCB):
+        pending = len(chain.cache)
+        return min(size,(cipher.blocksize - pending) % cipher.blocksize)
+    else: # CTR, CFB: finish the current block or segment first
+        return min(size,len(chain.keystream))
+
+def _serial(cipher,ed,data,n):
+    if ed == 'e':
+        return cipher.encrypt(data,n)
+    return cipher.decrypt(data,n)
+
+def _serial_head(cipher,ed,data):
+    if not data:
+        return ''
+    return _serial(cipher,ed,data,'')
+
+def _serial_tail(cipher,ed,data,plan):
+    if plan.mode == MODE_XTS:
+        if not data:
+            return ''
+        return cipher.chain.crypt_tail(ed,data)
+    if not data:
+        return ''
+    return _serial(cipher,ed,data,'')
+
+def _prepare(cipher,plan,source,dest):
+    """Give every shard its parameters and update the cipher as if it processed them
+
+    source, dest: (string, RawArray or mmap, offset of the aligned data)
+    """
+    source, source_base = source
+    dest, dest_base = dest
+    chain = cipher.chain
+    blocksize = plan.blocksize
+    tasks = []
+    if plan.mode == MODE_ECB:
+        tasks = [(start,length,None) for start,length in plan.shards]
+    elif plan.mode == MODE_CTR:
+        # the counter blocks are written in the output buffer, where the
+        #   workers encrypt them and XOR them with the input
+        for start,length in plan.shards:
+            counters = _counter_blocks(chain.counter, length // blocksize)
+            dest[dest_base+start:dest_base+start+length] = counters
+            tasks.append((start,length,None))
+        chain.totalbytes += plan.length
+    elif plan.mode in (MODE_CBC,MODE_CFB):
+        # every shard uses the ciphertext block preceding it as IV
+        previous = chain.IV
+        for start,length in plan.shards:
+            if start:
+                previous = source[source_base+start-blocksize:source_base+start]
+            tasks.append((start,length,previous))
+        chain.IV = source[source_base+plan.length-blocksize:source_base+plan.length]
+        if plan.mode == MODE_CFB:
+            chain.totalbytes += plan.length
+    elif plan.mode == MODE_OCB:
+        # the offset of a shard's first block follows from its block number,
+        #   the checksum is updated when the workers are done
+        chain.ed = plan.ed
+        for start,length in plan.shards:
+            index = chain.nblocks + start // blocksize
+            tasks.append((start,length,(index,chain.offset_at(index))))
+        end = chain.nblocks + plan.length // blocksize
+        chain.offset = chain.offset_at(end)
+        chain.nblocks = end
+        chain.totalbytes += plan.length
+    else: # XTS
+        chain.set_tweak(plan.n)
+        for start,length in plan.shards:
+            tasks.append((start,length,chain.T))
+            chain.skip_blocks(length // 16)
+    plan.tasks = tasks
+
+def _run(cipher,plan,source,dest):
+    """Run the shards of a plan in a pool of worker processes
+
+    source, dest: (RawArray or file name, offset of the aligned data)
+    """
+    state = (plan.mode,plan.ed,plan.blocksize,plan.segment_size,plan.sector_size,plan.snapshot)
+    pool = multiprocessing.Pool(min(plan.processes,len(plan.tasks)),_init_worker,(source,dest,state))
+    try:
+        results = pool.map(_work,plan.tasks,1)
+        pool.close()
+    except:
+        pool.terminate()
+        raise
+    pool.join()
+    if plan.mode == MODE_OCB:
+        for checksum in results:
+            cipher.chain.checksum ^= checksum
+    return results
+
+_worker = {}
+
+def _init_worker(source,dest,state):
+    _worker['source'] = _open(source,mmap.ACCESS_READ)
+    _worker['dest'] = _open(dest,mmap.ACCESS_WRITE)
+    mode,ed,blocksize,segment_size,sector_size,snapshot = state
+    codebook = pickle.loads(snapshot)
+    if mode == MODE_XTS:
+        # both codebooks are in the snapshot
+        codebook = XTS(*codebook)
+        crypt_blocks = None, None
+    elif mode == MODE_OCB:
+        codebook = OCB(codebook,blocksize,None)
+        crypt_blocks = None, None
+    elif mode == MODE_PMAC:
+        codebook = PMAC(codebook,blocksize,None)
+        crypt_blocks = None, None
+    else:
+        crypt_blocks = _crypt_blocks(codebook,blocksize)
+    _worker['state'] = (mode,ed,blocksize,segment_size,sector_size,codebook,crypt_blocks)
+
+def _open(location,access):
+    buf, base = location
+    if isinstance(buf,basestring):
+        f = open(buf,access == mmap.ACCESS_READ and 'rb' or 'r+b')
+        buf = mmap.mmap(f.fileno(),0,access=access)
+        f.close()
+    return buf, base
+
+def _work(task):
+    start, length, param = task
+    source, source_base = _worker['source']
+    dest, dest_base = _worker['dest']
+    mode,ed,blocksize,segment_size,sector_size,codebook,(encrypt_blocks,decrypt_blocks) = _worker['state']
+    data = source[source_base+start:source_base+start+length]
+    result = None
+    if mode == MODE_ECB:
+        if ed == 'e':
+            output = encrypt_blocks(data)
+        else:
+            output = decrypt_blocks(data)
+    elif mode == MODE_CTR:
+        keystream = encrypt_blocks(dest[dest_base+start:dest_base+start+length])
+        output = strxor(data,keystream)
+    elif mode == MODE_CBC:
+        output = CBC(codebook,blocksize,param).update(data,'d')
+    elif mode == MODE_CFB:
+        output = CFB(codebook,blocksize,param,segment_size*8).update(data,'d')
+    elif mode == MODE_PMAC: # param is the amount of message blocks before the shard
+        return codebook.partial_sum(data,param)
+    elif mode == MODE_OCB: # param is (block number, offset) of the block before the shard
+        output, offset, checksum = codebook.crypt_blocks(ed,data,param[0],param[1])
+        result = checksum
+    elif sector_size: # XTS data units, param is the first sequence number
+        output = codebook.crypt_sectors(ed,data,param,sector_size)
+    else: # XTS
+        codebook.T = param
+        output = codebook.crypt_blocks(ed,data)
+    dest[dest_base+start:dest_base+start+length] = output
+    if isinstance(dest,mmap.mmap):
+        dest.flush()
+    return result
+
+def _test():
+    import doctest
+    doctest.testmod()
+
+if __name__ == "__main__":
+    _test()
@@ -509,6 +509,35 @@ class des:
         self.__padding = pad
         return self.crypt(data, des.DECRYPT)
 
+    def encrypt_blocks(self, data):
+        """encrypt_blocks(data) -> string
+
+        data : String of contiguous 8 byte blocks
+
+        Encrypts every block independently (ECB), whatever the mode
+        of this object, without any padding.
+        """
+        return self.__crypt_blocks(data, des.ENCRYPT)
+
+    def decrypt_blocks(self, data):
+        """decrypt_blocks(data) -> string
+
+        data : String of contiguous 8 byte blocks
+
+        Decrypts every block independently (ECB), whatever the mode
+        of this object, without any padding.
+        """
+        return self.__crypt_blocks(data, des.DECRYPT)
+
+    def __crypt_blocks(self, data, crypt_type):
+        if len(data) % self.block_size != 0:
+            raise ValueError("Invalid data length, data must be a multiple of " + str(self.block_size) + " bytes\n.")
+        to_bits = self.__String_to_BitList
+        to_string = self.__BitList_to_String
+        des_crypt = self.__des_crypt
+        return ''.join([to_string(des_crypt(to_bits(data[i:i+8]), crypt_type))
+                        for i in xrange(0, len(data), 8)])
+
 
 #############################################################################
 #               Triple DES                  #
@@ -644,6 +673,24 @@ class triple_des:
             data = self.__key2.encrypt(data)
             return self.__key1.decrypt(data, pad)
 
+    def encrypt_blocks(self, data):
+        """encrypt_blocks(data) -> string
+
+        Encrypts contiguous 8 byte blocks independently (ECB), without padding.
+        """
+        data = self.__key1.encrypt_blocks(data)
+        data = self.__key2.decrypt_blocks(data)
+        return self.__key3.encrypt_blocks(data)
+
+    def decrypt_blocks(self, data):
+        """decrypt_blocks(data) -> string
+
+        Decrypts contiguous 8 byte blocks independently (ECB), without padding.
+        """
+        data = self.__key3.decrypt_blocks(data)
+        data = self.__key2.encrypt_blocks(data)
+        return self.__key1.decrypt_blocks(data)
+
 
 #############################################################################
 #               Examples                    #
@@ -34,6 +34,7 @@ using the software:
 __author__ = "Michael Gilfix <mgilfix@gmail.com>"
 
 import copy
+import struct
 
 class Blowfish:
     """Blowfish encryption Scheme
@@ -62,6 +63,14 @@ class Blowfish:
             up into 8 byte chunks for the ciphering
             process. Data must be aligned on 8 byte chunks.
 
+        def encrypt_blocks(self, data):
+            Encrypts any number of contiguous 8 byte blocks
+            in one call, keeping the boxes in local variables.
+
+        def decrypt_blocks(self, data):
+            Decrypts any number of contiguous 8 byte blocks
+            in one call.
+
         def cipher(self, xl, xr, direction):
             Encrypts a 64-bit block of data where xl is
             the upper 32-bits and xr is the lower 32-bits.
@@ -459,6 +468,34 @@ class Blowfish:
     def decrypt(self, data):
         return self.crypt(data, self.DECRYPT)
 
+    def encrypt_blocks(self, data):
+        return self.__crypt_blocks(data, self.p_boxes)
+
+    def decrypt_blocks(self, data):
+        # decryption runs the same network with the p-boxes reversed
+        return self.__crypt_blocks(data, self.p_boxes[::-1])
+
+    def __crypt_blocks(self, data, p):
+        assert len(data) % 8 == 0
+        s0, s1, s2, s3 = self.s_boxes
+        p16, p17 = p[16], p[17]
+        rounds = p[:16]
+        words = struct.unpack('>%dL' % (len(data) / 4), data)
+        result = []
+        append = result.append
+        for i in xrange(0, len(words), 2):
+            xl = words[i]
+            xr = words[i + 1]
+            for k in rounds:
+                xl ^= k
+                xr ^= ((((s0[xl >> 24] + s1[(xl >> 16) & 0xFF]) & 0xFFFFFFFF) ^
+                        s2[(xl >> 8) & 0xFF]) + s3[xl & 0xFF]) & 0xFFFFFFFF
+                xl, xr = xr, xl
+            # undo the last swap while applying the output whitening
+            append(xr ^ p17)
+            append(xl ^ p16)
+        return struct.pack('>%dL' % len(result), *result)
+
     def block_size(self):
         return self.BLOCK_SIZE
 
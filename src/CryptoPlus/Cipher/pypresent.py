@@ -57,9 +57,18 @@ Encrypting with a 128-bit key:
 >>> decrypted.encode('hex')
 '0123456789abcdef'
 
+Processing several blocks in one call:
+---------------------------------------
+>>> cipher.encrypt_blocks(plain + plain) == encrypted + encrypted
+True
+>>> cipher.decrypt_blocks(encrypted + encrypted) == plain + plain
+True
+
 fully based on standard specifications: http://www.crypto.ruhr-uni-bochum.de/imperia/md/content/texte/publications/conferences/present_ches2007.pdf
 test vectors: http://www.crypto.ruhr-uni-bochum.de/imperia/md/content/texte/publications/conferences/slides/present_testvectors.zip
 """
+import struct
+
 class Present:
 
         def __init__(self,key,rounds=32):
@@ -104,17 +113,71 @@ class Present:
                 decipher = addRoundKey(state,self.roundkeys[0])
                 return number2string_N(decipher,8)
 
+        def encrypt_blocks(self,data):
+                """Encrypt any number of contiguous blocks in one call
+
+                Input:  plaintext as raw string, a multiple of 8 bytes
+                Output: ciphertext as raw string
+                """
+                if len(data) % 8:
+                        raise ValueError, "Data must be a multiple of 8 bytes"
+                sp0,sp1,sp2,sp3,sp4,sp5,sp6,sp7 = byteTables()[0]
+                roundkeys = self.roundkeys[:self.rounds-1]
+                lastkey = self.roundkeys[-1]
+                output = []
+                for state in struct.unpack('>%dQ' % (len(data)/8), data):
+                        for roundkey in roundkeys:
+                                state ^= roundkey
+                                # sBoxLayer and pLayer in one pass of byte lookups
+                                state = sp0[state & 0xFF] ^ sp1[(state >> 8) & 0xFF] ^ \
+                                        sp2[(state >> 16) & 0xFF] ^ sp3[(state >> 24) & 0xFF] ^ \
+                                        sp4[(state >> 32) & 0xFF] ^ sp5[(state >> 40) & 0xFF] ^ \
+                                        sp6[(state >> 48) & 0xFF] ^ sp7[state >> 56]
+                        output.append(state ^ lastkey)
+                return struct.pack('>%dQ' % len(output), *output)
+
+        def decrypt_blocks(self,data):
+                """Decrypt any number of contiguous blocks in one call
+
+                Input:  ciphertext as raw string, a multiple of 8 bytes
+                Output: plaintext as raw string
+                """
+                if len(data) % 8:
+                        raise ValueError, "Data must be a multiple of 8 bytes"
+                p0,p1,p2,p3,p4,p5,p6,p7 = byteTables()[1]
+                sinv = byteTables()[2]
+                roundkeys = self.roundkeys[:0:-1]
+                firstkey = self.roundkeys[0]
+                output = []
+                for state in struct.unpack('>%dQ' % (len(data)/8), data):
+                        for roundkey in roundkeys:
+                                state ^= roundkey
+                                state = p0[state & 0xFF] ^ p1[(state >> 8) & 0xFF] ^ \
+                                        p2[(state >> 16) & 0xFF] ^ p3[(state >> 24) & 0xFF] ^ \
+                                        p4[(state >> 32) & 0xFF] ^ p5[(state >> 40) & 0xFF] ^ \
+                                        p6[(state >> 48) & 0xFF] ^ p7[state >> 56]
+                                state = sinv[state & 0xFF] | sinv[(state >> 8) & 0xFF] << 8 | \
+                                        sinv[(state >> 16) & 0xFF] << 16 | sinv[(state >> 24) & 0xFF] << 24 | \
+                                        sinv[(state >> 32) & 0xFF] << 32 | sinv[(state >> 40) & 0xFF] << 40 | \
+                                        sinv[(state >> 48) & 0xFF] << 48 | sinv[state >> 56] << 56
+                        output.append(state ^ firstkey)
+                return struct.pack('>%dQ' % len(output), *output)
+
         def get_block_size(self):
                 return 8
 
 #        0   1   2   3   4   5   6   7   8   9   a   b   c   d   e   f
 Sbox= [0xc,0x5,0x6,0xb,0x9,0x0,0xa,0xd,0x3,0xe,0xf,0x8,0x4,0x7,0x1,0x2]
-Sbox_inv = [Sbox.index(x) for x in xrange(16)]
+# inverses of Sbox and PBox, checked by tools/gen_tables.py
+Sbox_inv = [0x5,0xe,0xf,0x8,0xc,0x1,0x2,0xd,0xb,0x4,0x6,0x3,0x0,0x7,0x9,0xa]
 PBox = [0,16,32,48,1,17,33,49,2,18,34,50,3,19,35,51,
         4,20,36,52,5,21,37,53,6,22,38,54,7,23,39,55,
         8,24,40,56,9,25,41,57,10,26,42,58,11,27,43,59,
         12,28,44,60,13,29,45,61,14,30,46,62,15,31,47,63]
-PBox_inv = [PBox.index(x) for x in xrange(64)]
+PBox_inv = [0,4,8,12,16,20,24,28,32,36,40,44,48,52,56,60,
+        1,5,9,13,17,21,25,29,33,37,41,45,49,53,57,61,
+        2,6,10,14,18,22,26,30,34,38,42,46,50,54,58,62,
+        3,7,11,15,19,23,27,31,35,39,43,47,51,55,59,63]
 
 def generateRoundkeys80(key,rounds):
         """Generate the roundkeys for a 80-bit key
@@ -159,6 +222,38 @@ def generateRoundkeys128(key,rounds):
                 key ^= i << 62
         return roundkeys
 
+_byteTables = []
+
+def byteTables():
+        """Byte indexed tables for the multi-block functions, built on first use
+
+        Output: (sp, p_inv, sbox_inv)
+                sp:       8 tables giving pLayer(sBoxLayer(byte)) per byte position
+                p_inv:    8 tables giving pLayer_dec(byte) per byte position
+                sbox_inv: 1 table applying Sbox_inv to both nibbles of a byte"""
+        if not _byteTables:
+                sp = []
+                p_inv = []
+                for j in xrange(8):
+                        sp_j = []
+                        p_inv_j = []
+                        for v in xrange(256):
+                                s = Sbox[v & 0xF] | Sbox[v >> 4] << 4
+                                out = 0
+                                out_inv = 0
+                                for b in xrange(8):
+                                        if (s >> b) & 1:
+                                                out |= 1 << PBox[8*j+b]
+                                        if (v >> b) & 1:
+                                                out_inv |= 1 << PBox_inv[8*j+b]
+                                sp_j.append(out)
+                                p_inv_j.append(out_inv)
+                        sp.append(sp_j)
+                        p_inv.append(p_inv_j)
+                sbox_inv = [Sbox_inv[v & 0xF] | Sbox_inv[v >> 4] << 4 for v in xrange(256)]
+                _byteTables.extend((sp, p_inv, sbox_inv))
+        return _byteTables
+
 def addRoundKey(state,roundkey):
         return state ^ roundkey
 
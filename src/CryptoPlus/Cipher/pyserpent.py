@@ -43,16 +43,44 @@ class Serpent:
         bitsInKey = keyLengthInBitsOf(key)
         rawKey = convertToBitstring(reverse(key.lower()), bitsInKey)
         self.userKey = makeLongKey(rawKey)
+        self.KHat = None
 
     def encrypt(self,block):
-        plainText = convertToBitstring(reverse(block.encode("hex").lower()), 128)
-        cipherText = encrypt(plainText, self.userKey)
-        return reverse(bitstring2hexstring(cipherText)).decode('hex')
+        return self.encrypt_blocks(block)
 
     def decrypt(self,block):
-        cipherText = convertToBitstring(reverse(block.encode("hex").lower()), 128)
-        plainText = decrypt(cipherText, self.userKey)
-        return reverse(bitstring2hexstring(plainText)).decode('hex')
+        return self.decrypt_blocks(block)
+
+    def encrypt_blocks(self,data):
+        # process any number of contiguous blocks with the same subkeys
+        if len(data) % 16:
+            raise ValueError, "data length should be a multiple of 16 bytes"
+        KHat = self.__subkeys()
+        output = []
+        for i in xrange(0, len(data), 16):
+            BHat = IP(convertToBitstring(reverse(data[i:i+16].encode("hex")), 128))
+            for j in xrange(r):
+                BHat = R(j, BHat, KHat)
+            output.append(reverse(bitstring2hexstring(FP(BHat))))
+        return ''.join(output).decode('hex')
+
+    def decrypt_blocks(self,data):
+        if len(data) % 16:
+            raise ValueError, "data length should be a multiple of 16 bytes"
+        KHat = self.__subkeys()
+        output = []
+        for i in xrange(0, len(data), 16):
+            BHat = FPInverse(convertToBitstring(reverse(data[i:i+16].encode("hex")), 128))
+            for j in xrange(r-1, -1, -1):
+                BHat = RInverse(j, BHat, KHat)
+            output.append(reverse(bitstring2hexstring(IPInverse(BHat))))
+        return ''.join(output).decode('hex')
+
+    def __subkeys(self):
+        # the subkeys only depend on the key: derive them once
+        if self.KHat is None:
+            K, self.KHat = makeSubkeys(self.userKey)
+        return self.KHat
 
     def get_block_size(self):
         return 16
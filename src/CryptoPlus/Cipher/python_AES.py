@@ -8,10 +8,11 @@ def new(key,mode=MODE_ECB,IV=None,counter=None,segment_size=None):
 
         key = raw string containing the key, AES-128..256 will be selected according to the key length
             -> when using XTS mode: the key should be a tuple containing the 2 keys needed
-        mode = python_AES.MODE_ECB/CBC/CFB/OFB/CTR/XTS/CMAC, default is ECB
+        mode = python_AES.MODE_ECB/CBC/CFB/OFB/CTR/XTS/CMAC/GCM/OCB/PMAC, default is ECB
+            -> OCB (as XTS and GCM) only works with a 128-bit blocksize
             -> for every mode, except ECB and CTR, it is important to construct a seperate cipher for encryption and decryption
         IV = IV as a raw string, default is "all zero" IV
-            -> needed for CBC, CFB and OFB mode
+            -> needed for CBC, CFB and OFB mode, the nonce for GCM mode and for OCB mode (1 to 15 bytes)
         counter = counter object (CryptoPlus.Util.util.Counter)
             -> only needed for CTR mode
             -> use a seperate counter object for the cipher and decipher: the counter is updated directly, not a copy
@@ -178,6 +179,27 @@ def new(key,mode=MODE_ECB,IV=None,counter=None,segment_size=None):
     >>> decipher.decrypt(ciphertext).encode('hex')
     '6bc1bee22e409f96e93d7e117393172aae2d8a571e03ac9c9eb76fac45af8e5130c81c46a35ce411e5fbc1191a0a52ef'
 
+    CTR EXAMPLE: same as previous but now supplied in pieces
+    ------------
+    >>> counter = Counter('f0f1f2f3f4f5f6f7f8f9fafbfcfdfeff'.decode('hex'))
+    >>> cipher = python_AES.new(key,python_AES.MODE_CTR,counter=counter)
+    >>> output = cipher.encrypt(plaintext1[:5])
+    >>> output += cipher.encrypt(plaintext1[5:] + plaintext2 + plaintext3[:3])
+    >>> output += cipher.encrypt(plaintext3[3:])
+    >>> output == ciphertext
+    True
+
+    CTR EXAMPLE: decrypting from the middle of the stream
+    ------------
+    >>> counter = Counter('f0f1f2f3f4f5f6f7f8f9fafbfcfdfeff'.decode('hex'))
+    >>> decipher = python_AES.new(key,python_AES.MODE_CTR,counter=counter)
+    >>> decipher.seek(21)
+    >>> decipher.decrypt(ciphertext[21:40]) == (plaintext2 + plaintext3)[5:24]
+    True
+    >>> decipher.seek(0)
+    >>> decipher.decrypt(ciphertext[:3]) == plaintext1[:3]
+    True
+
     XTS EXAMPLE:
     ------------
     XTS-AES-128 applied for a data unit of 512 bytes
@@ -193,6 +215,17 @@ def new(key,mode=MODE_ECB,IV=None,counter=None,segment_size=None):
     >>> decipher.decrypt(ciphertext).encode('hex')
     '000102030405060708090a0b0c0d0e0f101112131415161718191a1b1c1d1e1f202122232425262728292a2b2c2d2e2f303132333435363738393a3b3c3d3e3f404142434445464748494a4b4c4d4e4f505152535455565758595a5b5c5d5e5f606162636465666768696a6b6c6d6e6f707172737475767778797a7b7c7d7e7f808182838485868788898a8b8c8d8e8f909192939495969798999a9b9c9d9e9fa0a1a2a3a4a5a6a7a8a9aaabacadaeafb0b1b2b3b4b5b6b7b8b9babbbcbdbebfc0c1c2c3c4c5c6c7c8c9cacbcccdcecfd0d1d2d3d4d5d6d7d8d9dadbdcdddedfe0e1e2e3e4e5e6e7e8e9eaebecedeeeff0f1f2f3f4f5f6f7f8f9fafbfcfdfeff000102030405060708090a0b0c0d0e0f101112131415161718191a1b1c1d1e1f202122232425262728292a2b2c2d2e2f303132333435363738393a3b3c3d3e3f404142434445464748494a4b4c4d4e4f505152535455565758595a5b5c5d5e5f606162636465666768696a6b6c6d6e6f707172737475767778797a7b7c7d7e7f808182838485868788898a8b8c8d8e8f909192939495969798999a9b9c9d9e9fa0a1a2a3a4a5a6a7a8a9aaabacadaeafb0b1b2b3b4b5b6b7b8b9babbbcbdbebfc0c1c2c3c4c5c6c7c8c9cacbcccdcecfd0d1d2d3d4d5d6d7d8d9dadbdcdddedfe0e1e2e3e4e5e6e7e8e9eaebecedeeeff0f1f2f3f4f5f6f7f8f9fafbfcfdfeff'
 
+    processing consecutive data units (sectors) at once, the sequence number
+    of every sector is its index counted from first_sector
+
+    >>> cipher = python_AES.new(key,python_AES.MODE_XTS)
+    >>> sectors = cipher.encrypt_sectors(plaintext,0xff,256)
+    >>> sectors == cipher.encrypt(plaintext[:256],'\\xff') + cipher.encrypt(plaintext[256:],'\\x00\\x01')
+    True
+    >>> decipher = python_AES.new(key,python_AES.MODE_XTS)
+    >>> decipher.decrypt_sectors(sectors,0xff,256) == plaintext
+    True
+
     using data sequence number n
 
     >>> key = ('fffefdfcfbfaf9f8f7f6f5f4f3f2f1f0'.decode('hex'),'22222222222222222222222222222222'.decode('hex'))
@@ -276,6 +309,90 @@ def new(key,mode=MODE_ECB,IV=None,counter=None,segment_size=None):
     >>> cipher = python_AES.new(key,python_AES.MODE_CMAC)
     >>> cipher.encrypt(plaintext).encode('hex')[:16]
     'dfa66747de9ae630'
+
+    CMAC EXAMPLE3: same message supplied in pieces
+    --------------
+    >>> cipher = python_AES.new(key,python_AES.MODE_CMAC)
+    >>> cipher.update(plaintext[:7])
+    >>> cipher.update(plaintext[7:32])
+    >>> cipher2 = cipher.copy()
+    >>> cipher.update(plaintext[32:])
+    >>> cipher.hexdigest()[:16]
+    'dfa66747de9ae630'
+    >>> cipher2.digest() == python_AES.new(key,python_AES.MODE_CMAC).encrypt(plaintext[:32])
+    True
+
+    PMAC EXAMPLE:
+    -------------
+    PMAC1-AES-128 test vectors (Rogaway)
+
+    >>> key = '000102030405060708090a0b0c0d0e0f'.decode('hex')
+    >>> cipher = python_AES.new(key,python_AES.MODE_PMAC)
+    >>> cipher.encrypt('').encode('hex')
+    '4399572cd6ea5341b8d35876a7098af7'
+    >>> plaintext = '000102030405060708090a0b0c0d0e0f10111213'.decode('hex')
+    >>> cipher.encrypt(plaintext).encode('hex')
+    '0412ca150bbf79058d8c75a58c993f55'
+    >>> cipher.update('\\x00'*500)
+    >>> cipher.update('\\x00'*500)
+    >>> cipher.hexdigest()
+    'c2c9fa1d9985f6f0d2aff915a0e8d910'
+
+    GCM EXAMPLE:
+    ------------
+    The Galois/Counter Mode of Operation (GCM), McGrew & Viega, test cases 1, 2 and 4
+
+    >>> key = '00000000000000000000000000000000'.decode('hex')
+    >>> IV = '000000000000000000000000'.decode('hex')
+    >>> cipher = python_AES.new(key,python_AES.MODE_GCM,IV)
+    >>> cipher.hexdigest()
+    '58e2fccefa7e3061367f1d57a4e7455a'
+    >>> cipher = python_AES.new(key,python_AES.MODE_GCM,IV)
+    >>> cipher.encrypt('\\x00'*16).encode('hex')
+    '0388dace60b6a392f328c2b971b2fe78'
+    >>> cipher.hexdigest()
+    'ab6e47d42cec13bdf53a67b21257bddf'
+
+    >>> key = 'feffe9928665731c6d6a8f9467308308'.decode('hex')
+    >>> IV = 'cafebabefacedbaddecaf888'.decode('hex')
+    >>> aad = 'feedfacedeadbeeffeedfacedeadbeefabaddad2'.decode('hex')
+    >>> plaintext = 'd9313225f88406e5a55909c5aff5269a86a7a9531534f7da2e4c303d8a318a721c3c0c95956809532fcf0e2449a6b525b16aedf5aa0de657ba637b39'.decode('hex')
+    >>> cipher = python_AES.new(key,python_AES.MODE_GCM,IV)
+    >>> cipher.update(aad)
+    >>> ciphertext = cipher.encrypt(plaintext[:25])
+    >>> ciphertext += cipher.encrypt(plaintext[25:])
+    >>> ciphertext.encode('hex')
+    '42831ec2217774244b7221b784d0d49ce3aa212f2c02a4e035c17e2329aca12e21d514b25466931c7d8f6a5aac84aa051ba30b396a0aac973d58e091'
+    >>> tag = cipher.digest()
+    >>> tag.encode('hex')
+    '5bc94fbc3221a5db94fae95ae7121a47'
+    >>> decipher = python_AES.new(key,python_AES.MODE_GCM,IV)
+    >>> decipher.update(aad)
+    >>> decipher.decrypt(ciphertext) == plaintext
+    True
+    >>> decipher.verify(tag)
+
+    OCB EXAMPLE:
+    ------------
+    RFC 7253, Appendix A
+
+    >>> key = '000102030405060708090A0B0C0D0E0F'.decode('hex')
+    >>> nonce = 'BBAA99887766554433221100'.decode('hex')
+    >>> cipher = python_AES.new(key,python_AES.MODE_OCB,nonce)
+    >>> (cipher.final() + cipher.digest()).encode('hex').upper()
+    '785407BFFFC8AD9EDCC5520AC9111EE6'
+    >>> nonce = 'BBAA99887766554433221101'.decode('hex')
+    >>> cipher = python_AES.new(key,python_AES.MODE_OCB,nonce)
+    >>> cipher.update('0001020304050607'.decode('hex'))
+    >>> ciphertext = cipher.encrypt('0001020304050607'.decode('hex'))
+    >>> ciphertext += cipher.final()
+    >>> (ciphertext + cipher.digest()).encode('hex').upper()
+    '6820B3657B6F615A5725BDA0D3B4EB3A257C9AF1F8F03009'
+    >>> decipher = python_AES.new(key,python_AES.MODE_OCB,nonce)
+    >>> decipher.update('0001020304050607'.decode('hex'))
+    >>> (decipher.decrypt(ciphertext) + decipher.final()).encode('hex')
+    '0001020304050607'
+    >>> decipher.verify(cipher.digest())
     """
     return python_AES(key,mode,IV,counter,segment_size)
 
@@ -291,6 +408,16 @@ class python_AES(BlockCipher):
     def keylen_valid(self,key):
         return len(key) in (16,24,32)
 
+class Key(BlockCipherKey):
+    """Immutable expanded AES key for the one-shot functions (encrypt_cbc, encrypt_ctr, ...)"""
+    key_error_message = ("Key should be 128, 192 or 256 bits")
+
+    def __init__(self,key):
+        BlockCipherKey.__init__(self,key,16,rijndael,{'block_size':16})
+
+    def keylen_valid(self,key):
+        return len(key) in (16,24,32)
+
 def _test():
     import doctest
     doctest.testmod()
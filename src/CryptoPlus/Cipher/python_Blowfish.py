@@ -7,7 +7,7 @@ def new(key,mode=MODE_ECB,IV=None,counter=None,segment_size=None):
     Wrapper for pure python implementation pyblowfish.py
 
         key = raw string containing the key
-        mode = Blowfish.MODE_ECB/CBC/CFB/OFB/CTR/CMAC, default is ECB
+        mode = Blowfish.MODE_ECB/CBC/CFB/OFB/CTR/CMAC/PMAC, default is ECB
         IV = IV as a raw string, default is "all zero" IV
             -> only needed for CBC mode
         counter = counter object (CryptoPlus.Util.util.Counter)
@@ -74,6 +74,16 @@ class python_Blowfish(BlockCipher):
     def keylen_valid(self,key):
         return 8 <= len(key) <= 56
 
+class Key(BlockCipherKey):
+    """Immutable expanded Blowfish key for the one-shot functions (encrypt_cbc, encrypt_ctr, ...)"""
+    key_error_message = "Key should be between 8 and 56 bytes (64 <-> 448 bits)"
+
+    def __init__(self,key):
+        BlockCipherKey.__init__(self,key,8,Blowfish)
+
+    def keylen_valid(self,key):
+        return 8 <= len(key) <= 56
+
 def _test():
     import doctest
     doctest.testmod()
@@ -1,13 +1,13 @@
 from blockcipher import *
-import pyDes
+import des32
 
 def new(key,mode=MODE_ECB,IV=None,counter=None,segment_size=None):
     """Create a new cipher object
 
-    wrapper for pure python implementation pyDes.py
+    wrapper for pure python implementation des32.py
 
         key = raw string containing the key
-        mode = python_DES.MODE_ECB/CBC/CFB/OFB/CTR/CMAC, default is ECB
+        mode = python_DES.MODE_ECB/CBC/CFB/OFB/CTR/CMAC/PMAC, default is ECB
             -> for every mode, except ECB and CTR, it is important to construct a seperate cipher for encryption and decryption
         IV = IV as a raw string, default is "all zero" IV
             -> needed for CBC, CFB and OFB mode
@@ -42,13 +42,23 @@ class python_DES(BlockCipher):
     key_error_message = ("Key should be 64 bits")
 
     def __init__(self,key,mode,IV,counter,segment_size):
-        cipher_module = pyDes.des
+        cipher_module = des32.des
         self.blocksize = 8
         BlockCipher.__init__(self,key,mode,IV,counter,cipher_module,segment_size)
 
     def keylen_valid(self,key):
         return len(key) == 8
 
+class Key(BlockCipherKey):
+    """Immutable expanded DES key for the one-shot functions (encrypt_cbc, encrypt_ctr, ...)"""
+    key_error_message = ("Key should be 64 bits")
+
+    def __init__(self,key):
+        BlockCipherKey.__init__(self,key,8,des32.des)
+
+    def keylen_valid(self,key):
+        return len(key) == 8
+
 def _test():
     import doctest
     doctest.testmod()
@@ -1,15 +1,15 @@
 from blockcipher import *
-import pyDes
+import des32
 
 def new(key,mode=MODE_ECB,IV=None,counter=None,segment_size=None):
     """Create a DES-EDE3 or DES-EDE2 cipher object
 
-    wrapper for pure python 3DES implementation pyDes.py
+    wrapper for pure python 3DES implementation des32.py
 
         key = raw string containing the 2/3 keys
             - DES-EDE2: supply 2 keys as 1 single concatenated 16byte key= key1|key2
             - DES-EDE3: supply 3 keys as 1 single concatenated 24byte key= key1|key2|key3
-        mode = python_AES.MODE_ECB/CBC/CFB/OFB/CTR/CMAC, default is ECB
+        mode = python_AES.MODE_ECB/CBC/CFB/OFB/CTR/CMAC/PMAC, default is ECB
         IV = IV as a raw string, default is "all zero" IV
             -> only needed for CBC mode
         counter = counter object (CryptoPlus.Util.util.Counter)
@@ -65,13 +65,23 @@ class python_DES3(BlockCipher):
     key_error_message = "Key should be 128 or 192 bits"
 
     def __init__(self,key,mode,IV,counter,segment_size):
-        cipher_module = pyDes.triple_des
+        cipher_module = des32.triple_des
         self.blocksize = 8
         BlockCipher.__init__(self,key,mode,IV,counter,cipher_module,segment_size)
 
     def keylen_valid(self,key):
         return len(key) in (16,24)
 
+class Key(BlockCipherKey):
+    """Immutable expanded Triple DES key for the one-shot functions (encrypt_cbc, encrypt_ctr, ...)"""
+    key_error_message = "Key should be 128 or 192 bits"
+
+    def __init__(self,key):
+        BlockCipherKey.__init__(self,key,8,des32.triple_des)
+
+    def keylen_valid(self,key):
+        return len(key) in (16,24)
+
 def _test():
     import doctest
     doctest.testmod()
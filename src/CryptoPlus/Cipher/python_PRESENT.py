@@ -7,7 +7,7 @@ def new(key,mode=MODE_ECB,IV=None,counter=None,segment_size=None,rounds=32):
     Wrapper for pure python implementation rijndael.py
 
         key = raw string containing the key, AES-128..256 will be selected according to the key length
-        mode = python_PRESENT.MODE_ECB/CBC/CFB/OFB/CTR/CMAC, default is ECB
+        mode = python_PRESENT.MODE_ECB/CBC/CFB/OFB/CTR/CMAC/PMAC, default is ECB
             -> for every mode, except ECB and CTR, it is important to construct a seperate cipher for encryption and decryption
         IV = IV as a raw string, default is "all zero" IV
             -> needed for CBC, CFB and OFB mode
@@ -86,6 +86,16 @@ class python_PRESENT(BlockCipher):
     def keylen_valid(self,key):
         return len(key) in (10,16)
 
+class Key(BlockCipherKey):
+    """Immutable expanded PRESENT key for the one-shot functions (encrypt_cbc, encrypt_ctr, ...)"""
+    key_error_message = "Key should be 80 or 128 bits"
+
+    def __init__(self,key,rounds=32):
+        BlockCipherKey.__init__(self,key,8,Present,{'rounds':rounds})
+
+    def keylen_valid(self,key):
+        return len(key) in (10,16)
+
 def _test():
     import doctest
     doctest.testmod()
@@ -8,10 +8,11 @@ def new(key,mode=MODE_ECB,IV=None,counter=None,segment_size=None,blocksize=None)
 
         key = raw string containing the key
             -> supported key size are 16, 24 and 32 bytes
-        mode = python_Rijndael.MODE_ECB/CBC/CFB/OFB/CTR/XTS/CMAC, default is ECB
+        mode = python_Rijndael.MODE_ECB/CBC/CFB/OFB/CTR/XTS/CMAC/GCM/OCB/PMAC, default is ECB
+            -> OCB (as XTS and GCM) only works with a 128-bit blocksize
             -> for every mode, except ECB and CTR, it is important to construct a seperate cipher for encryption and decryption
         IV = IV as a raw string, default is "all zero" IV
-            -> needed for CBC, CFB and OFB mode
+            -> needed for CBC, CFB and OFB mode, the nonce for GCM mode and for OCB mode (1 to 15 bytes)
         counter = counter object (CryptoPlus.Util.util.Counter)
             -> only needed for CTR mode
             -> use a seperate counter object for the cipher and decipher: the counter is updated directly, not a copy
@@ -21,7 +22,7 @@ def new(key,mode=MODE_ECB,IV=None,counter=None,segment_size=None,blocksize=None)
                of the cipher (only per byte access possible), default is 8
             -> only needed for CFB mode
         blocksize = blocksize in bytes
-            -> supported blocksizes are 16, 24 and 32 bytes, must be 16 if XTS mode.
+            -> supported blocksizes are 16, 24 and 32 bytes, must be 16 if XTS, GCM or OCB mode.
 
     EXAMPLES:
     **********
@@ -99,6 +100,18 @@ class python_Rijndael(BlockCipher):
     def keylen_valid(self,key):
         return len(key) in (16,24,32)
 
+class Key(BlockCipherKey):
+    """Immutable expanded Rijndael key for the one-shot functions (encrypt_cbc, encrypt_ctr, ...)"""
+    key_error_message = ("Key should be 128, 192 or 256 bits")
+
+    def __init__(self,key,blocksize=16):
+        if blocksize not in (16,24,32):
+                raise ValueError("Blocksize should be 16, 24 or 32")
+        BlockCipherKey.__init__(self,key,blocksize,rijndael,{'block_size':blocksize})
+
+    def keylen_valid(self,key):
+        return len(key) in (16,24,32)
+
 def _test():
     import doctest
     doctest.testmod()
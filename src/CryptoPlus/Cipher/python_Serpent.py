@@ -8,10 +8,11 @@ def new(key,mode=MODE_ECB,IV=None,counter=None,segment_size=None):
 
         key = raw string containing the key
             -> when using XTS mode: the key should be a tuple containing the 2 keys needed
-        mode = python_Serpent.MODE_ECB/CBC/CFB/OFB/CTR/XTS/CMAC, default is ECB
+        mode = python_Serpent.MODE_ECB/CBC/CFB/OFB/CTR/XTS/CMAC/GCM/OCB/PMAC, default is ECB
+            -> OCB (as XTS and GCM) only works with a 128-bit blocksize
             -> for every mode, except ECB and CTR, it is important to construct a seperate cipher for encryption and decryption
         IV = IV as a raw string, default is "all zero" IV
-            -> needed for CBC, CFB and OFB mode
+            -> needed for CBC, CFB and OFB mode, the nonce for GCM mode and for OCB mode (1 to 15 bytes)
         counter = counter object (CryptoPlus.Util.util.Counter)
             -> only needed for CTR mode
             -> use a seperate counter object for the cipher and decipher: the counter is updated directly, not a copy
@@ -60,6 +61,16 @@ class python_Serpent(BlockCipher):
         self.blocksize = 16
         BlockCipher.__init__(self,key,mode,IV,counter,cipher_module,segment_size)
 
+class Key(BlockCipherKey):
+    """Immutable expanded Serpent key for the one-shot functions (encrypt_cbc, encrypt_ctr, ...)"""
+    key_error_message = ("Key should be 128, 192 or 256 bits")
+
+    def __init__(self,key):
+        BlockCipherKey.__init__(self,key,16,Serpent)
+
+    def keylen_valid(self,key):
+        return len(key) in (16,24,32)
+
 def _test():
     import doctest
     doctest.testmod()
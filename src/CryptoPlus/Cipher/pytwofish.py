@@ -114,6 +114,86 @@ class Twofish:
         return ciphertext
 
 
+    def encrypt_blocks(self, data):
+        """Encrypt any number of contiguous blocks in one call."""
+
+        if len(data) % 16:
+            raise ValueError, "block size must be a multiple of 16"
+        if WORD_BIGENDIAN:
+            return self.encrypt(data)
+
+        l_key = self.context.l_key
+        m0, m1, m2, m3 = self.context.mk_tab
+        k0, k1, k2, k3, k4, k5, k6, k7 = l_key[:8]
+        subkeys = [l_key[4 * i + 8:4 * i + 12] for i in xrange(8)]
+        words = struct.unpack("<%dL" % (len(data) / 4), data)
+        result = []
+        extend = result.extend
+
+        for n in xrange(0, len(words), 4):
+            a = words[n] ^ k0
+            b = words[n + 1] ^ k1
+            c = words[n + 2] ^ k2
+            d = words[n + 3] ^ k3
+            for s0, s1, s2, s3 in subkeys:
+                t1 = m0[b >> 24] ^ m1[b & 0xff] ^ m2[(b >> 8) & 0xff] ^ m3[(b >> 16) & 0xff]
+                t0 = m0[a & 0xff] ^ m1[(a >> 8) & 0xff] ^ m2[(a >> 16) & 0xff] ^ m3[a >> 24]
+                c ^= (t0 + t1 + s0) & 0xFFFFFFFF
+                c = (c >> 1) | ((c << 31) & 0xFFFFFFFF)
+                d = ((d << 1) & 0xFFFFFFFF) | (d >> 31)
+                d ^= (t0 + 2 * t1 + s1) & 0xFFFFFFFF
+
+                t1 = m0[d >> 24] ^ m1[d & 0xff] ^ m2[(d >> 8) & 0xff] ^ m3[(d >> 16) & 0xff]
+                t0 = m0[c & 0xff] ^ m1[(c >> 8) & 0xff] ^ m2[(c >> 16) & 0xff] ^ m3[c >> 24]
+                a ^= (t0 + t1 + s2) & 0xFFFFFFFF
+                a = (a >> 1) | ((a << 31) & 0xFFFFFFFF)
+                b = ((b << 1) & 0xFFFFFFFF) | (b >> 31)
+                b ^= (t0 + 2 * t1 + s3) & 0xFFFFFFFF
+            extend((c ^ k4, d ^ k5, a ^ k6, b ^ k7))
+
+        return struct.pack("<%dL" % len(result), *result)
+
+
+    def decrypt_blocks(self, data):
+        """Decrypt any number of contiguous blocks in one call."""
+
+        if len(data) % 16:
+            raise ValueError, "block size must be a multiple of 16"
+        if WORD_BIGENDIAN:
+            return self.decrypt(data)
+
+        l_key = self.context.l_key
+        m0, m1, m2, m3 = self.context.mk_tab
+        k0, k1, k2, k3, k4, k5, k6, k7 = l_key[:8]
+        subkeys = [l_key[4 * i + 8:4 * i + 12] for i in xrange(7, -1, -1)]
+        words = struct.unpack("<%dL" % (len(data) / 4), data)
+        result = []
+        extend = result.extend
+
+        for n in xrange(0, len(words), 4):
+            a = words[n] ^ k4
+            b = words[n + 1] ^ k5
+            c = words[n + 2] ^ k6
+            d = words[n + 3] ^ k7
+            for s0, s1, s2, s3 in subkeys:
+                t1 = m0[b >> 24] ^ m1[b & 0xff] ^ m2[(b >> 8) & 0xff] ^ m3[(b >> 16) & 0xff]
+                t0 = m0[a & 0xff] ^ m1[(a >> 8) & 0xff] ^ m2[(a >> 16) & 0xff] ^ m3[a >> 24]
+                c = ((c << 1) & 0xFFFFFFFF) | (c >> 31)
+                c ^= (t0 + t1 + s2) & 0xFFFFFFFF
+                d ^= (t0 + 2 * t1 + s3) & 0xFFFFFFFF
+                d = (d >> 1) | ((d << 31) & 0xFFFFFFFF)
+
+                t1 = m0[d >> 24] ^ m1[d & 0xff] ^ m2[(d >> 8) & 0xff] ^ m3[(d >> 16) & 0xff]
+                t0 = m0[c & 0xff] ^ m1[(c >> 8) & 0xff] ^ m2[(c >> 16) & 0xff] ^ m3[c >> 24]
+                a = ((a << 1) & 0xFFFFFFFF) | (a >> 31)
+                a ^= (t0 + t1 + s0) & 0xFFFFFFFF
+                b ^= (t0 + 2 * t1 + s1) & 0xFFFFFFFF
+                b = (b >> 1) | ((b << 31) & 0xFFFFFFFF)
+            extend((c ^ k0, d ^ k1, a ^ k2, b ^ k3))
+
+        return struct.pack("<%dL" % len(result), *result)
+
+
     def get_name(self):
         """Return the name of the cipher."""
 
@@ -276,15 +356,20 @@ def mds_rem(p0, p1):
         p1 ^= ((u << 24) & 0xffffffff) | ((u << 8) & 0xffffffff)
     return p1
 
+# q_tab and m_tab don't depend on the key: they are generated by the first
+#   set_key and shared (read only) by all the keys
+_shared_tabs = None
+
 def set_key(pkey, in_key, key_len):
-    pkey.qt_gen = 0
-    if not pkey.qt_gen:
-        gen_qtab(pkey)
-        pkey.qt_gen = 1
-    pkey.mt_gen = 0
-    if not pkey.mt_gen:
-        gen_mtab(pkey)
-        pkey.mt_gen = 1
+    global _shared_tabs
+    if _shared_tabs is None:
+        tabs = TWI()
+        gen_qtab(tabs)
+        gen_mtab(tabs)
+        _shared_tabs = tabs.q_tab, tabs.m_tab
+    pkey.q_tab, pkey.m_tab = _shared_tabs
+    pkey.qt_gen = 1
+    pkey.mt_gen = 1
     pkey.k_len = (key_len * 8) / 64
 
     a = 0
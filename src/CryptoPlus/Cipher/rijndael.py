@@ -26,8 +26,27 @@ If any strings are of the wrong length a ValueError is thrown
 # code, in which case it can be made public domain by
 # deleting all the comments and renaming all the variables
 
-import copy
-import string
+import struct
+import sys
+
+# the numpy module (None if it isn't installed), once _load_numpy has run:
+#   NumPy is only imported by the first call using the NumPy engine
+numpy = None
+_numpy_loaded = False
+
+def _load_numpy():
+    """Import NumPy on first use
+
+    Output: the numpy module, or None when it isn't installed
+    """
+    global numpy, _numpy_loaded
+    if not _numpy_loaded:
+        try:
+            import numpy
+        except ImportError:
+            numpy = None
+        _numpy_loaded = True
+    return numpy
 
 
 
@@ -51,164 +70,8 @@ shifts = [[[0, 0], [1, 3], [2, 2], [3, 1]],
 # [keysize][block_size]
 num_rounds = {16: {16: 10, 24: 12, 32: 14}, 24: {16: 12, 24: 12, 32: 14}, 32: {16: 14, 24: 14, 32: 14}}
 
-A = [[1, 1, 1, 1, 1, 0, 0, 0],
-     [0, 1, 1, 1, 1, 1, 0, 0],
-     [0, 0, 1, 1, 1, 1, 1, 0],
-     [0, 0, 0, 1, 1, 1, 1, 1],
-     [1, 0, 0, 0, 1, 1, 1, 1],
-     [1, 1, 0, 0, 0, 1, 1, 1],
-     [1, 1, 1, 0, 0, 0, 1, 1],
-     [1, 1, 1, 1, 0, 0, 0, 1]]
-
-# produce log and alog tables, needed for multiplying in the
-# field GF(2^m) (generator = 3)
-alog = [1]
-for i in xrange(255):
-    j = (alog[-1] << 1) ^ alog[-1]
-    if j & 0x100 != 0:
-        j ^= 0x11B
-    alog.append(j)
-
-log = [0] * 256
-for i in xrange(1, 255):
-    log[alog[i]] = i
-
-# multiply two elements of GF(2^m)
-def mul(a, b):
-    if a == 0 or b == 0:
-        return 0
-    return alog[(log[a & 0xFF] + log[b & 0xFF]) % 255]
-
-# substitution box based on F^{-1}(x)
-box = [[0] * 8 for i in xrange(256)]
-box[1][7] = 1
-for i in xrange(2, 256):
-    j = alog[255 - log[i]]
-    for t in xrange(8):
-        box[i][t] = (j >> (7 - t)) & 0x01
-
-B = [0, 1, 1, 0, 0, 0, 1, 1]
-
-# affine transform:  box[i] <- B + A*box[i]
-cox = [[0] * 8 for i in xrange(256)]
-for i in xrange(256):
-    for t in xrange(8):
-        cox[i][t] = B[t]
-        for j in xrange(8):
-            cox[i][t] ^= A[t][j] * box[i][j]
-
-# S-boxes and inverse S-boxes
-S =  [0] * 256
-Si = [0] * 256
-for i in xrange(256):
-    S[i] = cox[i][0] << 7
-    for t in xrange(1, 8):
-        S[i] ^= cox[i][t] << (7-t)
-    Si[S[i] & 0xFF] = i
-
-# T-boxes
-G = [[2, 1, 1, 3],
-    [3, 2, 1, 1],
-    [1, 3, 2, 1],
-    [1, 1, 3, 2]]
-
-AA = [[0] * 8 for i in xrange(4)]
-
-for i in xrange(4):
-    for j in xrange(4):
-        AA[i][j] = G[i][j]
-        AA[i][i+4] = 1
-
-for i in xrange(4):
-    pivot = AA[i][i]
-    if pivot == 0:
-        t = i + 1
-        while AA[t][i] == 0 and t < 4:
-            t += 1
-            assert t != 4, 'G matrix must be invertible'
-            for j in xrange(8):
-                AA[i][j], AA[t][j] = AA[t][j], AA[i][j]
-            pivot = AA[i][i]
-    for j in xrange(8):
-        if AA[i][j] != 0:
-            AA[i][j] = alog[(255 + log[AA[i][j] & 0xFF] - log[pivot & 0xFF]) % 255]
-    for t in xrange(4):
-        if i != t:
-            for j in xrange(i+1, 8):
-                AA[t][j] ^= mul(AA[i][j], AA[t][i])
-            AA[t][i] = 0
-
-iG = [[0] * 4 for i in xrange(4)]
-
-for i in xrange(4):
-    for j in xrange(4):
-        iG[i][j] = AA[i][j + 4]
-
-def mul4(a, bs):
-    if a == 0:
-        return 0
-    r = 0
-    for b in bs:
-        r <<= 8
-        if b != 0:
-            r = r | mul(a, b)
-    return r
-
-T1 = []
-T2 = []
-T3 = []
-T4 = []
-T5 = []
-T6 = []
-T7 = []
-T8 = []
-U1 = []
-U2 = []
-U3 = []
-U4 = []
-
-for t in xrange(256):
-    s = S[t]
-    T1.append(mul4(s, G[0]))
-    T2.append(mul4(s, G[1]))
-    T3.append(mul4(s, G[2]))
-    T4.append(mul4(s, G[3]))
-
-    s = Si[t]
-    T5.append(mul4(s, iG[0]))
-    T6.append(mul4(s, iG[1]))
-    T7.append(mul4(s, iG[2]))
-    T8.append(mul4(s, iG[3]))
-
-    U1.append(mul4(t, iG[0]))
-    U2.append(mul4(t, iG[1]))
-    U3.append(mul4(t, iG[2]))
-    U4.append(mul4(t, iG[3]))
-
-# round constants
-rcon = [1]
-r = 1
-for t in xrange(1, 30):
-    r = mul(2, r)
-    rcon.append(r)
-
-del A
-del AA
-del pivot
-del B
-del G
-del box
-del log
-del alog
-del i
-del j
-del r
-del s
-del t
-del mul
-del mul4
-del cox
-del iG
+# S-boxes, T-boxes and round constants, precomputed by tools/gen_tables.py
+from rijndael_tables import S, Si, T1, T2, T3, T4, T5, T6, T7, T8, U1, U2, U3, U4, rcon
 
 class rijndael:
     def __init__(self, key, block_size = 16):
@@ -220,154 +83,352 @@ class rijndael:
 
         ROUNDS = num_rounds[len(key)][block_size]
         BC = block_size / 4
-        # encryption round keys
-        Ke = [[0] * BC for i in xrange(ROUNDS + 1)]
-        # decryption round keys
-        Kd = [[0] * BC for i in xrange(ROUNDS + 1)]
         ROUND_KEY_COUNT = (ROUNDS + 1) * BC
         KC = len(key) / 4
 
-        # copy user material bytes into temporary ints
-        tk = []
-        for i in xrange(0, KC):
-            tk.append((ord(key[i * 4]) << 24) | (ord(key[i * 4 + 1]) << 16) |
-                (ord(key[i * 4 + 2]) << 8) | ord(key[i * 4 + 3]))
-
-        # copy values into round key arrays
-        t = 0
-        j = 0
-        while j < KC and t < ROUND_KEY_COUNT:
-            Ke[t / BC][t % BC] = tk[j]
-            Kd[ROUNDS - (t / BC)][t % BC] = tk[j]
-            j += 1
-            t += 1
-        tt = 0
-        rconpointer = 0
-        while t < ROUND_KEY_COUNT:
-            # extrapolate using phi (the round key evolution function)
-            tt = tk[KC - 1]
-            tk[0] ^= (S[(tt >> 16) & 0xFF] & 0xFF) << 24 ^  \
-                     (S[(tt >>  8) & 0xFF] & 0xFF) << 16 ^  \
-                     (S[ tt        & 0xFF] & 0xFF) <<  8 ^  \
-                     (S[(tt >> 24) & 0xFF] & 0xFF)       ^  \
-                     (rcon[rconpointer]    & 0xFF) << 24
-            rconpointer += 1
-            if KC != 8:
-                for i in xrange(1, KC):
-                    tk[i] ^= tk[i-1]
-            else:
-                for i in xrange(1, KC / 2):
-                    tk[i] ^= tk[i-1]
-                tt = tk[KC / 2 - 1]
-                tk[KC / 2] ^= (S[ tt        & 0xFF] & 0xFF)       ^ \
-                              (S[(tt >>  8) & 0xFF] & 0xFF) <<  8 ^ \
-                              (S[(tt >> 16) & 0xFF] & 0xFF) << 16 ^ \
-                              (S[(tt >> 24) & 0xFF] & 0xFF) << 24
-                for i in xrange(KC / 2 + 1, KC):
-                    tk[i] ^= tk[i-1]
-            # copy values into round key arrays
-            j = 0
-            while j < KC and t < ROUND_KEY_COUNT:
-                Ke[t / BC][t % BC] = tk[j]
-                Kd[ROUNDS - (t / BC)][t % BC] = tk[j]
-                j += 1
-                t += 1
-        # inverse MixColumn where needed
+        # expand the key into the words of the encryption round keys, using
+        #   phi (the round key evolution function) every KC words
+        w = list(struct.unpack('>%dL' % KC, key))
+        for t in xrange(KC, ROUND_KEY_COUNT):
+            tt = w[t - 1]
+            if t % KC == 0:
+                tt = S[(tt >> 16) & 0xFF] << 24 ^ \
+                     S[(tt >>  8) & 0xFF] << 16 ^ \
+                     S[ tt        & 0xFF] <<  8 ^ \
+                     S[ tt >> 24        ]       ^ \
+                     rcon[t / KC - 1]     << 24
+            elif KC == 8 and t % KC == 4:
+                tt = S[ tt >> 24        ] << 24 ^ \
+                     S[(tt >> 16) & 0xFF] << 16 ^ \
+                     S[(tt >>  8) & 0xFF] <<  8 ^ \
+                     S[ tt        & 0xFF]
+            w.append(w[t - KC] ^ tt)
+        # encryption round keys
+        self.Ke = [w[t:t + BC] for t in xrange(0, ROUND_KEY_COUNT, BC)]
+        # the routines are bound to the round keys on first use, and the
+        #   decryption round keys (Kd) derived then, see prepare_decrypt.
+        #   python_AES.new with a 16 byte key (key schedule cache disabled,
+        #   python 2.7, x86_64, best of 25):
+        #     mode    baseline  eager binding  lazy binding
+        #     ECB     45us      40us           20us
+        #     CBC     50us      42us           19us
+        #     CFB     54us      25us           20us
+        #     OFB     49us      28us           20us
+        #     CTR     45us      27us           21us
+        #     CMAC    121us     42us           46us
+        #     XTS     93us      72us           34us
+        #     OCB     -         87us           62us
+        #     PMAC    -         52us           57us
+        #   (CMAC, PMAC and OCB encrypt a block when they are set up, which
+        #   binds the encryption routines)
+
+    def prepare_decrypt(self):
+        """Derive the decryption round keys now instead of on first use
+
+        Encryption only modes (CTR, OFB, CFB, CMAC, ...) never need them.
+        """
+        if 'Kd' in self.__dict__:
+            return
+        # the decryption round keys are the encryption round keys in reverse
+        #   order, with the inverse MixColumn applied where needed
+        ROUNDS = len(self.Ke) - 1
+        Kd = [list(self.Ke[ROUNDS - r]) for r in xrange(ROUNDS + 1)]
         for r in xrange(1, ROUNDS):
-            for j in xrange(BC):
-                tt = Kd[r][j]
-                Kd[r][j] = U1[(tt >> 24) & 0xFF] ^ \
-                           U2[(tt >> 16) & 0xFF] ^ \
-                           U3[(tt >>  8) & 0xFF] ^ \
-                           U4[ tt        & 0xFF]
-        self.Ke = Ke
+            Kd[r] = [U1[(tt >> 24) & 0xFF] ^
+                     U2[(tt >> 16) & 0xFF] ^
+                     U3[(tt >>  8) & 0xFF] ^
+                     U4[ tt        & 0xFF] for tt in Kd[r]]
+        self.decrypt, self.decrypt_blocks = _bind(Kd, 1)
         self.Kd = Kd
 
-    def encrypt(self, plaintext):
-        if len(plaintext) != self.block_size:
-            raise ValueError('wrong block length, expected ' + str(self.block_size) + ' got ' + str(len(plaintext)))
-        Ke = self.Ke
-
-        BC = self.block_size / 4
-        ROUNDS = len(Ke) - 1
-        if BC == 4:
-            SC = 0
-        elif BC == 6:
-            SC = 1
+    # until the routines are bound, these bind them (and derive the
+    #   decryption round keys), the instance attributes take over afterwards
+    def encrypt(self, data):
+        self.__prepare_encrypt()
+        return self.encrypt(data)
+
+    def encrypt_blocks(self, data):
+        self.__prepare_encrypt()
+        return self.encrypt_blocks(data)
+
+    def __prepare_encrypt(self):
+        if 'encrypt' not in self.__dict__:
+            self.encrypt, self.encrypt_blocks = _bind(self.Ke, 0)
+
+    def decrypt(self, data):
+        self.prepare_decrypt()
+        return self.decrypt(data)
+
+    def decrypt_blocks(self, data):
+        self.prepare_decrypt()
+        return self.decrypt_blocks(data)
+
+    def __getstate__(self):
+        # the routines (with their NumPy state) and Kd are rebuilt on first
+        #   use after unpickling
+        state = self.__dict__.copy()
+        for name in ('encrypt', 'decrypt', 'encrypt_blocks', 'decrypt_blocks', 'Kd'):
+            state.pop(name, None)
+        return state
+
+    def lanes(ciphers):
+        """Get an object encrypting one block per cipher in every call
+
+        See Lanes, used for multi-buffer encryption of independent messages.
+        """
+        return Lanes(ciphers)
+    lanes = staticmethod(lanes)
+
+# Unrolled routines
+#
+# For every (block size, amount of rounds) combination, the source of a
+#   function binding the round keys to local names is generated and compiled
+#   once. The routines it returns encrypt or decrypt one block, or a string
+#   of contiguous blocks, with every column of the state in its own local
+#   variable and every round written out. Strings of at least NUMPY_THRESHOLD
+#   blocks are handed to the NumPy engine instead, when it is available.
+
+_compiled = {}
+
+def _bind(K, direction):
+    """Get the single block and the multiple block routine for the round keys K"""
+    factory = _routines(len(K[0]), len(K) - 1, direction)
+    return factory(sum(K, []), _numpy_routine(K, direction))
+
+def _routines(BC, ROUNDS, direction):
+    """Get the routine factory for BC columns, ROUNDS rounds and a direction (0: encrypt, 1: decrypt)
+
+    The factory takes the flattened round keys and the NumPy routine for the
+      same keys, and returns the single block and the multiple block
+      function.
+    """
+    shape = (BC, ROUNDS, direction)
+    if shape not in _compiled:
+        namespace = {}
+        exec _source(BC, ROUNDS, direction) in globals(), namespace
+        _compiled[shape] = namespace['routines']
+    return _compiled[shape]
+
+def _source(BC, ROUNDS, direction):
+    SC = {4: 0, 6: 1, 8: 2}[BC]
+    s1, s2, s3 = [shifts[SC][row][direction] for row in (1, 2, 3)]
+    if direction == 0:
+        tables, box = 'T1, T2, T3, T4', 'S'
+    else:
+        tables, box = 'T5, T6, T7, T8', 'Si'
+    cols = range(BC)
+    keys = ['k%d' % i for i in xrange((ROUNDS + 1) * BC)]
+    state = ', '.join(['s%d' % i for i in cols])
+
+    rounds = []
+    for i in cols:
+        rounds.append('s%d ^= k%d' % (i, i))
+    src, dst = 's', 't'
+    for r in xrange(1, ROUNDS):
+        for i in cols:
+            rounds.append('%s%d = Ta[%s%d >> 24] ^ Tb[(%s%d >> 16) & 0xFF] ^ Tc[(%s%d >> 8) & 0xFF] ^ Td[%s%d & 0xFF] ^ k%d' %
+                          (dst, i, src, i, src, (i + s1) % BC, src, (i + s2) % BC, src, (i + s3) % BC, r * BC + i))
+        src, dst = dst, src
+    # last round is special
+    last = ', '.join(['(Sbox[%s%d >> 24] << 24 | Sbox[(%s%d >> 16) & 0xFF] << 16 | Sbox[(%s%d >> 8) & 0xFF] << 8 | Sbox[%s%d & 0xFF]) ^ k%d' %
+                      (src, i, src, (i + s1) % BC, src, (i + s2) % BC, src, (i + s3) % BC, ROUNDS * BC + i) for i in cols])
+
+    lines = ['def routines(K, bulk, Ta=%s, Tb=%s, Tc=%s, Td=%s, Sbox=%s, block=struct.Struct(">%dL")):' % (tuple(tables.split(', ')) + (box, BC)),
+             '    %s = K' % ', '.join(keys),
+             '    unpack, pack = block.unpack, block.pack',
+             '    def crypt(data):',
+             '        if len(data) != %d:' % (4 * BC),
+             "            raise ValueError('wrong block length, expected %d got ' + str(len(data)))" % (4 * BC),
+             '        %s = unpack(data)' % state]
+    lines += ['        ' + line for line in rounds]
+    lines += ['        return pack(%s)' % last,
+              '    def crypt_blocks(data):',
+              '        if len(data) %% %d != 0:' % (4 * BC),
+              "            raise ValueError('wrong data length, expected a multiple of %d got ' + str(len(data)))" % (4 * BC),
+              '        if len(data) >= NUMPY_THRESHOLD * %d:' % (4 * BC),
+              '            output = bulk(data)',
+              '            if output is not None:',
+              '                return output',
+              "        words = struct.unpack('>%dL' % (len(data) / 4), data)",
+              '        result = []',
+              '        extend = result.extend',
+              '        for %s in zip(%s):' % (state, ', '.join(['words[%d::%d]' % (i, BC) for i in cols]))]
+    lines += ['            ' + line for line in rounds]
+    lines += ['            extend((%s))' % last,
+              "        return struct.pack('>%dL' % len(result), *result)",
+              '    return crypt, crypt_blocks']
+    return '\n'.join(lines) + '\n'
+
+# NumPy engine
+#
+# The state of all the blocks is held as an array [column, block] of 32-bit
+#   words, every round takes one table lookup per byte of a column for all
+#   the blocks at once. The bytes of the words are read through a uint8 view
+#   of the state.
+
+# amount of blocks from which encrypt_blocks/decrypt_blocks use NumPy, if available
+NUMPY_THRESHOLD = 32
+# amount of blocks processed in one pass, bounding the memory used
+NUMPY_CHUNK = 65536
+
+# index of the most to the least significant byte of a word in memory
+if sys.byteorder == 'little':
+    _word_bytes = (3, 2, 1, 0)
+else:
+    _word_bytes = (0, 1, 2, 3)
+
+_numpy_tables = {}
+
+def _numpy_boxes(direction):
+    """T-tables and S-box of a direction as NumPy arrays, converted once"""
+    if direction not in _numpy_tables:
+        if direction == 0:
+            tables, box = (T1, T2, T3, T4), S
         else:
-            SC = 2
-        s1 = shifts[SC][1][0]
-        s2 = shifts[SC][2][0]
-        s3 = shifts[SC][3][0]
-        a = [0] * BC
-        # temporary work array
-        t = []
-        # plaintext to ints + key
-        for i in xrange(BC):
-            t.append((ord(plaintext[i * 4    ]) << 24 |
-                      ord(plaintext[i * 4 + 1]) << 16 |
-                      ord(plaintext[i * 4 + 2]) <<  8 |
-                      ord(plaintext[i * 4 + 3])        ) ^ Ke[0][i])
-        # apply round transforms
-        for r in xrange(1, ROUNDS):
-            for i in xrange(BC):
-                a[i] = (T1[(t[ i           ] >> 24) & 0xFF] ^
-                        T2[(t[(i + s1) % BC] >> 16) & 0xFF] ^
-                        T3[(t[(i + s2) % BC] >>  8) & 0xFF] ^
-                        T4[ t[(i + s3) % BC]        & 0xFF]  ) ^ Ke[r][i]
-            t = copy.copy(a)
-        # last round is special
-        result = []
-        for i in xrange(BC):
-            tt = Ke[ROUNDS][i]
-            result.append((S[(t[ i           ] >> 24) & 0xFF] ^ (tt >> 24)) & 0xFF)
-            result.append((S[(t[(i + s1) % BC] >> 16) & 0xFF] ^ (tt >> 16)) & 0xFF)
-            result.append((S[(t[(i + s2) % BC] >>  8) & 0xFF] ^ (tt >>  8)) & 0xFF)
-            result.append((S[ t[(i + s3) % BC]        & 0xFF] ^  tt       ) & 0xFF)
-        return string.join(map(chr, result), '')
-
-    def decrypt(self, ciphertext):
-        if len(ciphertext) != self.block_size:
-            raise ValueError('wrong block length, expected ' + str(self.block_size) + ' got ' + str(len(plaintext)))
-        Kd = self.Kd
-
+            tables, box = (T5, T6, T7, T8), Si
+        _numpy_tables[direction] = ([numpy.array(T, dtype=numpy.uint32) for T in tables],
+                                    numpy.array(box, dtype=numpy.uint32))
+    return _numpy_tables[direction]
+
+def _colshifts(BC, direction):
+    """Columns read for every column of the state, in the 4 rows"""
+    SC = {4: 0, 6: 1, 8: 2}[BC]
+    cols = range(BC)
+    return zip(cols,
+               [(i + shifts[SC][1][direction]) % BC for i in cols],
+               [(i + shifts[SC][2][direction]) % BC for i in cols],
+               [(i + shifts[SC][3][direction]) % BC for i in cols])
+
+def _numpy_crypt(t, K, direction, colshifts):
+    """All the rounds on a state t, a NumPy uint32 array [column, block]
+
+    K: round keys as an array [round, column, 1] (one key for all the
+       blocks) or [round, column, block] (a key per block)
+    Returns the new state.
+    """
+    (Ta, Tb, Tc, Td), Sbox = _numpy_boxes(direction)
+    b0, b1, b2, b3 = _word_bytes
+    BC, n = t.shape
+    t = t ^ K[0]
+    ROUNDS = len(K) - 1
+    for r in xrange(1, ROUNDS + 1):
+        Kr = K[r]
+        b = t.view(numpy.uint8).reshape(BC, n, 4)
+        t = numpy.empty((BC, n), numpy.uint32)
+        last = r == ROUNDS
+        for i, i1, i2, i3 in colshifts:
+            x = t[i]
+            if not last:
+                Ta.take(b[i, :, b0], out=x)
+                x ^= Tb.take(b[i1, :, b1])
+                x ^= Tc.take(b[i2, :, b2])
+                x ^= Td.take(b[i3, :, b3])
+            else:
+                # last round is special
+                Sbox.take(b[i, :, b0], out=x)
+                x <<= 24
+                x |= Sbox.take(b[i1, :, b1]) << 16
+                x |= Sbox.take(b[i2, :, b2]) << 8
+                x |= Sbox.take(b[i3, :, b3])
+            x ^= Kr[i]
+    return t
+
+def _numpy_routine(K, direction):
+    """Get a function en/decrypting a string of blocks with NumPy, for the round keys K
+
+    The function returns None when NumPy isn't installed. NumPy is imported,
+      and the round keys converted, by its first call.
+    """
+    BC = len(K[0])
+    state = [] # round keys as a NumPy array and column shifts, once built
+    def crypt_blocks(data):
+        if not state:
+            if _load_numpy() is None:
+                return None
+            state[:] = numpy.array(K, dtype=numpy.uint32)[:, :, None], _colshifts(BC, direction)
+        keys, colshifts = state
+        output = []
+        step = NUMPY_CHUNK * 4 * BC
+        for i in xrange(0, len(data), step):
+            chunk = data[i:i + step]
+            n = len(chunk) / (4 * BC)
+            t = numpy.frombuffer(chunk, dtype='>u4').reshape(n, BC).T.astype(numpy.uint32, order='C')
+            output.append(_numpy_crypt(t, keys, direction, colshifts).T.astype('>u4').tostring())
+        return ''.join(output)
+    return crypt_blocks
+
+# amount of lanes from which the NumPy engine is used, if available
+LANES_NUMPY_THRESHOLD = 64
+
+class Lanes:
+    """Encryption of one block for each of several rijndael objects at once
+
+    ciphers: rijndael objects of the same block size, each with its own key
+    encrypt(data): data holds one block for each of the first n ciphers
+      (n <= len(ciphers)), block i is encrypted with ciphers[i]
+
+    When NumPy is installed, there are at least LANES_NUMPY_THRESHOLD lanes
+      and all keys have the same length, every round is computed for all
+      lanes with one table lookup per column byte. Otherwise the blocks are
+      encrypted in one loop over the lanes.
+    """
+    def __init__(self, ciphers):
+        self.block_size = ciphers[0].block_size
+        for cipher in ciphers:
+            if cipher.block_size != self.block_size:
+                raise ValueError('all the lanes should have the same block size')
+        self.colshifts = _colshifts(self.block_size / 4, 0)
+        self.Ke = [cipher.Ke for cipher in ciphers]
+        # round keys as an array [round, column, lane], built by the first
+        #   call with enough lanes for NumPy (False if it can't be used)
+        self.K = None
+
+    def encrypt(self, data):
+        if len(data) % self.block_size != 0:
+            raise ValueError('wrong data length, expected a multiple of ' + str(self.block_size) + ' got ' + str(len(data)))
+        n = len(data) / self.block_size
+        if n > len(self.Ke):
+            raise ValueError('more blocks than lanes')
+        if n >= LANES_NUMPY_THRESHOLD and self.__numpy_keys():
+            return self.__encrypt_numpy(data, n)
+        return self.__encrypt(data, n)
+
+    def __numpy_keys(self):
+        # whether the NumPy engine can be used, building its round keys
+        if self.K is None:
+            self.K = False
+            if len(set([len(Ke) for Ke in self.Ke])) == 1 and _load_numpy() is not None:
+                self.K = numpy.array(self.Ke, dtype=numpy.uint32).transpose(1, 2, 0).copy()
+        return self.K is not False
+
+    def __encrypt(self, data, n):
         BC = self.block_size / 4
-        ROUNDS = len(Kd) - 1
-        if BC == 4:
-            SC = 0
-        elif BC == 6:
-            SC = 1
-        else:
-            SC = 2
-        s1 = shifts[SC][1][1]
-        s2 = shifts[SC][2][1]
-        s3 = shifts[SC][3][1]
-        a = [0] * BC
-        # temporary work array
-        t = [0] * BC
-        # ciphertext to ints + key
-        for i in xrange(BC):
-            t[i] = (ord(ciphertext[i * 4    ]) << 24 |
-                    ord(ciphertext[i * 4 + 1]) << 16 |
-                    ord(ciphertext[i * 4 + 2]) <<  8 |
-                    ord(ciphertext[i * 4 + 3])        ) ^ Kd[0][i]
-        # apply round transforms
-        for r in xrange(1, ROUNDS):
-            for i in xrange(BC):
-                a[i] = (T5[(t[ i           ] >> 24) & 0xFF] ^
-                        T6[(t[(i + s1) % BC] >> 16) & 0xFF] ^
-                        T7[(t[(i + s2) % BC] >>  8) & 0xFF] ^
-                        T8[ t[(i + s3) % BC]        & 0xFF]  ) ^ Kd[r][i]
-            t = copy.copy(a)
-        # last round is special
+        colshifts = self.colshifts
+        words = struct.unpack('>%dL' % (len(data) / 4), data)
         result = []
-        for i in xrange(BC):
-            tt = Kd[ROUNDS][i]
-            result.append((Si[(t[ i           ] >> 24) & 0xFF] ^ (tt >> 24)) & 0xFF)
-            result.append((Si[(t[(i + s1) % BC] >> 16) & 0xFF] ^ (tt >> 16)) & 0xFF)
-            result.append((Si[(t[(i + s2) % BC] >>  8) & 0xFF] ^ (tt >>  8)) & 0xFF)
-            result.append((Si[ t[(i + s3) % BC]        & 0xFF] ^  tt       ) & 0xFF)
-        return string.join(map(chr, result), '')
+        extend = result.extend
+        for lane in xrange(n):
+            K = self.Ke[lane]
+            K0 = K[0]
+            b = lane * BC
+            t = [words[b + i] ^ K0[i] for i in xrange(BC)]
+            for Kr in K[1:-1]:
+                t = [(T1[(t[i ] >> 24) & 0xFF] ^
+                      T2[(t[i1] >> 16) & 0xFF] ^
+                      T3[(t[i2] >>  8) & 0xFF] ^
+                      T4[ t[i3]        & 0xFF]  ) ^ Kr[i]
+                     for i, i1, i2, i3 in colshifts]
+            Klast = K[-1]
+            extend([(S[(t[i ] >> 24) & 0xFF] << 24 |
+                     S[(t[i1] >> 16) & 0xFF] << 16 |
+                     S[(t[i2] >>  8) & 0xFF] <<  8 |
+                     S[ t[i3]        & 0xFF]        ) ^ Klast[i]
+                    for i, i1, i2, i3 in colshifts])
+        return struct.pack('>%dL' % len(result), *result)
+
+    def __encrypt_numpy(self, data, n):
+        t = numpy.frombuffer(data, dtype='>u4').reshape(n, self.block_size / 4).T.astype(numpy.uint32, order='C')
+        return _numpy_crypt(t, self.K[:, :, :n], 0, self.colshifts).T.astype('>u4').tostring()
 
 def encrypt(key, block):
     return rijndael(key, len(block)).encrypt(block)
@@ -1,3 +1,5 @@
+from strxor import strxor
+
 def number2string(i):
     """Convert a number to a string
 
@@ -30,9 +32,9 @@ def string2number(i):
 def xorstring(a,b):
     """XOR two strings of same length
 
-    For more complex cases, see CryptoPlus.Cipher.XOR"""
+    For more complex cases, see CryptoPlus.Util.strxor"""
     assert len(a) == len(b)
-    return number2string_N(string2number(a)^string2number(b), len(a))
+    return strxor(a,b)
 
 class Counter(str):
     #found here: http://www.lag.net/pipermail/paramiko/2008-February.txt
@@ -42,14 +44,92 @@ class Counter(str):
     Everytime the object is called ( ctr() ) it returns the current value and increments it by 1.
     Input/output is a raw string.
 
-    Counter value is big endian"""
-    def __init__(self, initial_ctr):
+        initial_ctr      = the first counter block; its length sets the block width
+        nonce_bytes      = amount of leading bytes of initial_ctr that make up a
+                            fixed nonce, only the bytes after it are counted (default: 0)
+        little_endian    = increment the counter bytes as a little endian number
+                            (default: False, big endian)
+        allow_wraparound = restart at 0 when the counter bytes overflow; when False
+                            an OverflowError is raised instead (default: True)
+
+    ctr.seek(n) sets the counter to its initial value + n, so the next call
+    returns the value for the n'th block (used by the CTR mode to seek).
+    ctr.advance(n) skips the next n values and ctr.next_blocks(n) returns the
+    next n values as one string.
+
+    >>> from CryptoPlus.Util.util import Counter
+    >>> ctr = Counter('\\x00'*7+'\\xfe')
+    >>> ctr().encode('hex'), ctr().encode('hex'), ctr().encode('hex')
+    ('00000000000000fe', '00000000000000ff', '0000000000000100')
+    >>> ctr = Counter('nonce'+'\\xff'*3, nonce_bytes=5)
+    >>> ctr.next_blocks(2)
+    'nonce\\xff\\xff\\xffnonce\\x00\\x00\\x00'
+    >>> ctr = Counter('\\xff\\x00\\x00\\x00', little_endian=True)
+    >>> ctr.advance(1)
+    >>> ctr().encode('hex')
+    '00010000'
+    >>> ctr = Counter('\\xff'*4, allow_wraparound=False)
+    >>> ctr().encode('hex')
+    'ffffffff'
+    >>> ctr()
+    Traceback (most recent call last):
+    ...
+    OverflowError: counter wrapped around
+    """
+    def __new__(cls, initial_ctr, *args, **kwargs):
+        return str.__new__(cls, initial_ctr)
+
+    def __init__(self, initial_ctr, nonce_bytes=0, little_endian=False, allow_wraparound=True):
         if not isinstance(initial_ctr, str):
             raise TypeError("nonce must be str")
-        self.c = int(initial_ctr.encode('hex'), 16)
+        if not 0 <= nonce_bytes < len(initial_ctr):
+            raise ValueError("nonce must leave at least one counter byte")
+        self.nonce = initial_ctr[:nonce_bytes]
+        self.size = len(initial_ctr) - nonce_bytes
+        self.little_endian = little_endian
+        self.allow_wraparound = allow_wraparound
+        self.modulus = 1 << (8*self.size)
+        ctr = initial_ctr[nonce_bytes:]
+        if little_endian:
+            ctr = ctr[::-1]
+        self.c = self.start = string2number(ctr)
+        # hex format of a whole counter block
+        self.format = self.nonce.encode('hex') + '%%0%dx' % (2*self.size)
+
+    def seek(self, n):
+        self.c = self.start + n
+        self.__check()
+
+    def advance(self, n):
+        self.c += n
+        self.__check()
+
+    def __check(self):
+        if not self.allow_wraparound:
+            if self.c > self.modulus:
+                raise OverflowError("counter wrapped around")
+        else:
+            self.c %= self.modulus
+
     def __call__(self):
-        # This might be slow, but it works as a demonstration
-        ctr = ("%032x" % (self.c,)).decode('hex')
-        self.c += 1
-        return ctr
+        return self.next_blocks(1)
 
+    def next_blocks(self, n):
+        """Return the next n counter blocks as one string"""
+        c, modulus = self.c, self.modulus
+        if c + n > modulus and not self.allow_wraparound:
+            raise OverflowError("counter wrapped around")
+        fmt = self.format
+        # xrange can't hold counters that don't fit in a C long
+        if c + n <= modulus:
+            values = [c + i for i in xrange(n)]
+        else:
+            values = [(c + i) % modulus for i in xrange(n)]
+        if self.little_endian:
+            nonce, size = self.nonce, self.size
+            blocks = ''.join([nonce + number2string_N(v, size)[::-1] for v in values])
+        else:
+            blocks = ''.join([fmt % v for v in values]).decode('hex')
+        # without wraparound the counter stays at modulus once it is exhausted
+        self.c = c + n if not self.allow_wraparound else (c + n) % modulus
+        return blocks
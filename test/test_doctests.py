@@ -7,8 +7,8 @@ require("CryptoPlus>=1.0")
 #import CryptoPlus.Cipher.python_AES
 from CryptoPlus.Cipher import python_AES, AES, python_DES, DES, python_DES3,\
         DES3, python_Blowfish, Blowfish, python_Twofish, python_Serpent,\
-        python_Rijndael, CAST, ARC2, python_PRESENT
-from CryptoPlus.Util import padding
+        python_Rijndael, CAST, ARC2, python_PRESENT, blockcipher, parallel, des32
+from CryptoPlus.Util import padding, util, strxor
 from CryptoPlus.Hash import python_RadioGatun, python_PBKDF2, RIPEMD, python_MD5,\
      python_SHA,python_SHA256,python_SHA224,python_SHA384,python_SHA512,\
      python_whirlpool
@@ -23,7 +23,7 @@ suite = unittest.TestSuite()
 #for mod in (CryptoPlus.Cipher.python_AES,CryptoPlus.Cipher.python_AES):
 for mod in python_AES, AES, python_DES, DES, python_DES3, DES3, python_Blowfish,\
            Blowfish, python_Twofish, python_Serpent, python_Rijndael, CAST, ARC2,\
-           python_PRESENT, padding, python_RadioGatun, python_PBKDF2, RIPEMD,\
+           python_PRESENT, blockcipher, parallel, des32, padding, util, strxor, python_RadioGatun, python_PBKDF2, RIPEMD,\
            python_MD5, python_SHA,python_SHA256,python_SHA224,python_SHA384,python_SHA512,\
            python_whirlpool:
     suite.addTest(doctest.DocTestSuite(mod))
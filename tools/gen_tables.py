@@ -0,0 +1,285 @@
+#!/usr/bin/env python
+"""Generate the constant tables shipped with the pure python ciphers
+
+The tables used to be computed at import time (the rijndael T-boxes take
+most of the import time of python_AES and python_Rijndael). They are now
+precomputed once by this script from their algorithmic definition and
+stored as literals.
+
+usage: python tools/gen_tables.py          rewrite rijndael_tables.py and des32_tables.py
+       python tools/gen_tables.py --check  verify the shipped tables, exit status 1 on mismatch
+"""
+import os
+import sys
+
+CIPHER_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                          os.pardir, 'src', 'CryptoPlus', 'Cipher')
+RIJNDAEL_TABLES = os.path.join(CIPHER_DIR, 'rijndael_tables.py')
+DES32_TABLES = os.path.join(CIPHER_DIR, 'des32_tables.py')
+
+# ported from the Java reference code by Bram Cohen, bram@gawth.com, April 2001
+# (this is the code that rijndael.py used to run at import time)
+def rijndael_tables():
+    """Compute the rijndael S-boxes, T-boxes and round constants
+
+    Output: list of (name, table) pairs
+    """
+    A = [[1, 1, 1, 1, 1, 0, 0, 0],
+         [0, 1, 1, 1, 1, 1, 0, 0],
+         [0, 0, 1, 1, 1, 1, 1, 0],
+         [0, 0, 0, 1, 1, 1, 1, 1],
+         [1, 0, 0, 0, 1, 1, 1, 1],
+         [1, 1, 0, 0, 0, 1, 1, 1],
+         [1, 1, 1, 0, 0, 0, 1, 1],
+         [1, 1, 1, 1, 0, 0, 0, 1]]
+
+    # produce log and alog tables, needed for multiplying in the
+    # field GF(2^m) (generator = 3)
+    alog = [1]
+    for i in xrange(255):
+        j = (alog[-1] << 1) ^ alog[-1]
+        if j & 0x100 != 0:
+            j ^= 0x11B
+        alog.append(j)
+
+    log = [0] * 256
+    for i in xrange(1, 255):
+        log[alog[i]] = i
+
+    # multiply two elements of GF(2^m)
+    def mul(a, b):
+        if a == 0 or b == 0:
+            return 0
+        return alog[(log[a & 0xFF] + log[b & 0xFF]) % 255]
+
+    # substitution box based on F^{-1}(x)
+    box = [[0] * 8 for i in xrange(256)]
+    box[1][7] = 1
+    for i in xrange(2, 256):
+        j = alog[255 - log[i]]
+        for t in xrange(8):
+            box[i][t] = (j >> (7 - t)) & 0x01
+
+    B = [0, 1, 1, 0, 0, 0, 1, 1]
+
+    # affine transform:  box[i] <- B + A*box[i]
+    cox = [[0] * 8 for i in xrange(256)]
+    for i in xrange(256):
+        for t in xrange(8):
+            cox[i][t] = B[t]
+            for j in xrange(8):
+                cox[i][t] ^= A[t][j] * box[i][j]
+
+    # S-boxes and inverse S-boxes
+    S =  [0] * 256
+    Si = [0] * 256
+    for i in xrange(256):
+        S[i] = cox[i][0] << 7
+        for t in xrange(1, 8):
+            S[i] ^= cox[i][t] << (7-t)
+        Si[S[i] & 0xFF] = i
+
+    # T-boxes
+    G = [[2, 1, 1, 3],
+        [3, 2, 1, 1],
+        [1, 3, 2, 1],
+        [1, 1, 3, 2]]
+
+    AA = [[0] * 8 for i in xrange(4)]
+
+    for i in xrange(4):
+        for j in xrange(4):
+            AA[i][j] = G[i][j]
+            AA[i][i+4] = 1
+
+    for i in xrange(4):
+        pivot = AA[i][i]
+        if pivot == 0:
+            t = i + 1
+            while AA[t][i] == 0 and t < 4:
+                t += 1
+                assert t != 4, 'G matrix must be invertible'
+                for j in xrange(8):
+                    AA[i][j], AA[t][j] = AA[t][j], AA[i][j]
+                pivot = AA[i][i]
+        for j in xrange(8):
+            if AA[i][j] != 0:
+                AA[i][j] = alog[(255 + log[AA[i][j] & 0xFF] - log[pivot & 0xFF]) % 255]
+        for t in xrange(4):
+            if i != t:
+                for j in xrange(i+1, 8):
+                    AA[t][j] ^= mul(AA[i][j], AA[t][i])
+                AA[t][i] = 0
+
+    iG = [[0] * 4 for i in xrange(4)]
+
+    for i in xrange(4):
+        for j in xrange(4):
+            iG[i][j] = AA[i][j + 4]
+
+    def mul4(a, bs):
+        if a == 0:
+            return 0
+        r = 0
+        for b in bs:
+            r <<= 8
+            if b != 0:
+                r = r | mul(a, b)
+        return r
+
+    T = [[mul4(S[t], G[i]) for t in xrange(256)] for i in xrange(4)]
+    T += [[mul4(Si[t], iG[i]) for t in xrange(256)] for i in xrange(4)]
+    U = [[mul4(t, iG[i]) for t in xrange(256)] for i in xrange(4)]
+
+    # round constants
+    rcon = [1]
+    r = 1
+    for t in xrange(1, 30):
+        r = mul(2, r)
+        rcon.append(r)
+
+    return ([('S', S), ('Si', Si)] +
+            [('T%d' % (i+1), T[i]) for i in xrange(8)] +
+            [('U%d' % (i+1), U[i]) for i in xrange(4)] +
+            [('rcon', rcon)])
+
+def present_tables():
+    """Compute the inverse PRESENT S-box and bit permutation"""
+    sys.path.insert(0, CIPHER_DIR)
+    import pypresent
+    return [('Sbox_inv', [pypresent.Sbox.index(x) for x in xrange(16)]),
+            ('PBox_inv', [pypresent.PBox.index(x) for x in xrange(64)])]
+
+# DES bit strings are numbered from the most significant bit (0) on, as in
+#   the permutation tables of pyDes
+def permute(table, value, width):
+    """Permute the bits of the width bit integer value with table"""
+    out = 0
+    for position in table:
+        out = out << 1 | (value >> (width - 1 - position)) & 1
+    return out
+
+def rotl32(x, n):
+    return ((x << n) | (x >> (32 - n))) & 0xFFFFFFFF
+
+def des32_tables():
+    """Compute the tables of the integer DES core (des32.py)
+
+    The core keeps both halves of the state rotated left by one bit, so that
+      the 6-bit groups of the expansion E are aligned on bytes, as in
+      Outerbridge's d3des:
+        IPL, IPR: IP per input byte, giving the rotated halves
+        FPH, FPL: FP per byte of the rotated (R16, L16), giving both output words
+        SP1..SP8: S-box j followed by P (rotated), per 6-bit input
+        PC2C, PC2D: PC2 per 7 bits of C or D, giving the subkey as two words
+          (a << 32 | b) holding its 6-bit groups 1,3,5,7 and 2,4,6,8 in bytes
+    The permutations themselves are taken from pyDes.
+
+    Output: list of (name, table) pairs
+    """
+    sys.path.insert(0, CIPHER_DIR)
+    import pyDes
+    des = pyDes.des
+    ip, fp, p, pc2, sbox = des._des__ip, des._des__fp, des._des__p, des._des__pc2, des._des__sbox
+    M = 0xFFFFFFFF
+
+    IPL = [[0] * 256 for k in xrange(8)]
+    IPR = [[0] * 256 for k in xrange(8)]
+    FPH = [[0] * 256 for k in xrange(8)]
+    FPL = [[0] * 256 for k in xrange(8)]
+    for k in xrange(8):
+        for b in xrange(256):
+            out = permute(ip, b << (56 - 8 * k), 64)
+            IPL[k][b] = rotl32(out >> 32, 1)
+            IPR[k][b] = rotl32(out & M, 1)
+            v = b << (56 - 8 * k)
+            out = permute(fp, rotl32(v >> 32, 31) << 32 | rotl32(v & M, 31), 64)
+            FPH[k][b] = out >> 32
+            FPL[k][b] = out & M
+
+    SP = [[0] * 64 for j in xrange(8)]
+    for j in xrange(8):
+        for x in xrange(64):
+            s = sbox[j][((x >> 4) & 2 | x & 1) * 16 + ((x >> 1) & 15)]
+            SP[j][x] = rotl32(permute(p, s << (28 - 4 * j), 32), 1)
+
+    def cooked(cd):
+        subkey = permute(pc2, cd, 56)
+        groups = [(subkey >> (42 - 6 * j)) & 63 for j in xrange(8)]
+        a = groups[0] << 24 | groups[2] << 16 | groups[4] << 8 | groups[6]
+        b = groups[1] << 24 | groups[3] << 16 | groups[5] << 8 | groups[7]
+        return a << 32 | b
+    PC2C = [[cooked((v << (21 - 7 * g)) << 28) for v in xrange(128)] for g in xrange(4)]
+    PC2D = [[cooked(v << (21 - 7 * g)) for v in xrange(128)] for g in xrange(4)]
+
+    return ([('IPL', IPL), ('IPR', IPR), ('FPH', FPH), ('FPL', FPL)] +
+            [('SP%d' % (j+1), SP[j]) for j in xrange(8)] +
+            [('PC2C', PC2C), ('PC2D', PC2D)])
+
+def format_table(name, table, digits, per_line):
+    if isinstance(table[0], list):
+        # list of tables
+        rows = [format_table('', row, digits, per_line)[3:-1] for row in table]
+        rows = [row.replace('\n    ', '\n' + ' ' * (len(name) + 5)) for row in rows]
+        indent = ' ' * (len(name) + 4)
+        return '%s = [%s]\n' % (name, (',\n' + indent).join(rows))
+    lines = []
+    for i in xrange(0, len(table), per_line):
+        lines.append(', '.join(['0x%0*x' % (digits, x) for x in table[i:i+per_line]]))
+    indent = ' ' * (len(name) + 4)
+    return '%s = [%s]\n' % (name, (',\n' + indent).join(lines))
+
+def write_tables(path, title, tables, formats):
+    out = open(path, 'w')
+    out.write('# Precomputed %s\n'
+              '#\n'
+              '# Generated by tools/gen_tables.py from the algorithmic definition,\n'
+              '# do not edit.\n\n' % title)
+    for name, table in tables:
+        out.write(format_table(name, table, *formats(name)))
+        out.write('\n')
+    out.close()
+
+def rijndael_formats(name):
+    if name[0] in 'TU':
+        return 8, 6
+    return 2, 12
+
+def des32_formats(name):
+    if name.startswith('PC2'):
+        return 16, 3
+    return 8, 6
+
+def check():
+    """Compare the shipped tables with the computed ones
+
+    Output: list of the names of the tables that differ
+    """
+    sys.path.insert(0, CIPHER_DIR)
+    import rijndael_tables as rijndael_module
+    import des32_tables as des32_module
+    import pypresent
+    bad = []
+    for module, tables in ((rijndael_module, rijndael_tables()),
+                           (des32_module, des32_tables()),
+                           (pypresent, present_tables())):
+        for name, table in tables:
+            if list(getattr(module, name, ())) != table:
+                bad.append('%s.%s' % (module.__name__, name))
+    return bad
+
+if __name__ == '__main__':
+    if sys.argv[1:] == ['--check']:
+        bad = check()
+        for name in bad:
+            print '%s differs from its definition' % name
+        if not bad:
+            print 'all tables OK'
+        sys.exit(bool(bad))
+    elif sys.argv[1:]:
+        print __doc__
+        sys.exit(2)
+    write_tables(RIJNDAEL_TABLES, 'rijndael tables', rijndael_tables(), rijndael_formats)
+    print 'wrote', os.path.normpath(RIJNDAEL_TABLES)
+    write_tables(DES32_TABLES, 'tables of the integer DES core', des32_tables(), des32_formats)
+    print 'wrote', os.path.normpath(DES32_TABLES)